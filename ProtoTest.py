@@ -1,15 +1,23 @@
 import pygame
 import sys
+import atexit
 import os
 import json
 import random
-import csv
-import Levenshtein
 import joblib
 from sklearn.linear_model import SGDClassifier
 import speech_recognition as sr
+from render_cache import draw_gradient_background, get_font, render_text
+from frame_loop import FrameLoop
+from tts_service import TTSService
+from edit_distance import levenshtein
+from bigram_index import bigram_similarity
+from online_trainer import OnlineTrainer
+from training_log import TrainingLog
+from persistence import JsonStore
 
 pygame.init()
+tts = TTSService()
 
 # === WINDOW ===
 WIDTH, HEIGHT = 800, 600
@@ -36,7 +44,7 @@ classes = ["correct", "almost", "incorrect"]
 def get_fonts(height):
     large = max(30, height // 10)
     small = max(16, height // 30)
-    return pygame.font.Font(None, large), pygame.font.Font(None, small)
+    return get_font(large), get_font(small)
 
 # === WORDS ===
 if os.path.exists(WORDS_FILE):
@@ -51,18 +59,15 @@ else:
         json.dump(words, f, indent=2)
 
 # === ATTEMPTS ===
-if os.path.exists(ATTEMPTS_FILE):
-    with open(ATTEMPTS_FILE) as f:
-        attempts_db = json.load(f)
-else:
-    attempts_db = {"easy": {}, "difficult": {}}
+store = JsonStore()
+atexit.register(store.close)  # pending saves are written on exit
+attempts_db = store.load(ATTEMPTS_FILE, {"easy": {}, "difficult": {}})
 
 for diff in ["easy", "difficult"]:
     for w in words[diff]:
         if w["word"] not in attempts_db[diff]:
             attempts_db[diff][w["word"]] = 0
-with open(ATTEMPTS_FILE, "w") as f:
-    json.dump(attempts_db, f, indent=2)
+store.save(ATTEMPTS_FILE, attempts_db)
 
 # === MODEL ===
 if os.path.exists(MODEL_FILE):
@@ -70,32 +75,16 @@ if os.path.exists(MODEL_FILE):
 else:
     model = SGDClassifier(loss="log_loss")
     model.partial_fit([[0, 1], [1, 0], [0.5, 0.5]], ["correct", "incorrect", "almost"], classes=classes)
+trainer = OnlineTrainer(model, MODEL_FILE)
+atexit.register(trainer.close)  # fit and save the last samples however the app exits
 
 # === HELPERS ===
-def draw_gradient_background(screen, width, height, start_color, end_color):
-    for y in range(height):
-        ratio = y / height
-        r = int(start_color[0] * (1 - ratio) + end_color[0] * ratio)
-        g = int(start_color[1] * (1 - ratio) + end_color[1] * ratio)
-        b = int(start_color[2] * (1 - ratio) + end_color[2] * ratio)
-        pygame.draw.line(screen, (r, g, b), (0, y), (width, y))
-
 def draw_text(text, font, color, x, y):
-    txt = font.render(text, True, color)
+    txt = render_text(text, font, color)
     rect = txt.get_rect(center=(x, y))
     screen.blit(txt, rect)
 
 # === ML ===
-def levenshtein(a, b):
-    return Levenshtein.distance(a, b)
-
-def bigram_similarity(a, b):
-    def get_bigrams(w):
-        return set(w[i:i+2] for i in range(len(w)-1)) if len(w) >= 2 else {w}
-    A = get_bigrams(a)
-    B = get_bigrams(b)
-    return len(A & B) / len(A | B) if A | B else 0
-
 def combined_feedback(user, correct):
     d = levenshtein(user, correct)
     s = bigram_similarity(user, correct)
@@ -106,10 +95,11 @@ def combined_feedback(user, correct):
     else:
         return "incorrect"
 
+training_log = TrainingLog(TRAINING_LOG)
+atexit.register(training_log.close)  # writes out the rows still buffered
+
 def log_attempt(user, correct, lev, bigram, label):
-    with open(TRAINING_LOG, "a", newline="") as csvfile:
-        writer = csv.writer(csvfile)
-        writer.writerow([user, correct, lev, bigram, label])
+    training_log.append(user, correct, lev, bigram, label)
 
 # === SYLLABLE SPLIT ===
 def split_syllables(word):
@@ -133,8 +123,9 @@ def add_word_menu():
     text = ''
     adding = True
 
+    loop = FrameLoop()
     while adding:
-        for e in pygame.event.get():
+        for e in loop.events():
             if e.type == pygame.QUIT:
                 pygame.quit(); sys.exit()
             elif e.type == pygame.MOUSEBUTTONDOWN:
@@ -149,21 +140,21 @@ def add_word_menu():
                         sylls = len(split_syllables(word))
                         diff = "easy" if sylls <= 2 else "difficult"
                         words[diff].append({"word": word})
-                        with open(WORDS_FILE, "w") as f:
-                            json.dump(words, f, indent=2)
+                        store.save(WORDS_FILE, words)
                         adding = False
                 elif e.key == pygame.K_BACKSPACE:
                     text = text[:-1]
                 else:
                     text += e.unicode
 
-        draw_gradient_background(screen, WIDTH, HEIGHT, WHITE, (200, 200, 255))
-        _, FONT_SMALL = get_fonts(HEIGHT)
-        draw_text("Add new word:", FONT_SMALL, BLACK, WIDTH//2, HEIGHT//2 - 40)
-        pygame.draw.rect(screen, color, input_box, 2)
-        txt2 = FONT_SMALL.render(text, True, BLACK)
-        screen.blit(txt2, (input_box.x+5, input_box.y+5))
-        pygame.display.flip()
+        if loop.needs_redraw():
+            draw_gradient_background(screen, WIDTH, HEIGHT, WHITE, (200, 200, 255))
+            _, FONT_SMALL = get_fonts(HEIGHT)
+            draw_text("Add new word:", FONT_SMALL, BLACK, WIDTH//2, HEIGHT//2 - 40)
+            pygame.draw.rect(screen, color, input_box, 2)
+            txt2 = FONT_SMALL.render(text, True, BLACK)
+            screen.blit(txt2, (input_box.x+5, input_box.y+5))
+            loop.flip()
 
 # === MIC ===
 def recognize_speech():
@@ -179,30 +170,32 @@ def recognize_speech():
 # === MENU ===
 def menu():
     running = True
+    loop = FrameLoop()
     while running:
-        screen.fill(WHITE)
-        _, FONT_SMALL = get_fonts(HEIGHT)
-        btn_w, btn_h = 160, 40
-        btn_x = WIDTH // 2 - btn_w // 2
-
-        easy_btn = pygame.Rect(btn_x, 200, btn_w, btn_h)
-        diff_btn = pygame.Rect(btn_x, 250, btn_w, btn_h)
-        add_btn = pygame.Rect(btn_x, 300, btn_w, btn_h)
-        quit_btn = pygame.Rect(btn_x, 350, btn_w, btn_h)
-
-        pygame.draw.rect(screen, GREEN, easy_btn)
-        pygame.draw.rect(screen, RED, diff_btn)
-        pygame.draw.rect(screen, GRAY, add_btn)
-        pygame.draw.rect(screen, GRAY, quit_btn)
-
-        draw_text("Easy", FONT_SMALL, WHITE, easy_btn.centerx, easy_btn.centery)
-        draw_text("Difficult", FONT_SMALL, WHITE, diff_btn.centerx, diff_btn.centery)
-        draw_text("Add Word", FONT_SMALL, BLACK, add_btn.centerx, add_btn.centery)
-        draw_text("Quit", FONT_SMALL, BLACK, quit_btn.centerx, quit_btn.centery)
-
-        pygame.display.flip()
-
-        for e in pygame.event.get():
+        if loop.needs_redraw():
+            screen.fill(WHITE)
+            _, FONT_SMALL = get_fonts(HEIGHT)
+            btn_w, btn_h = 160, 40
+            btn_x = WIDTH // 2 - btn_w // 2
+
+            easy_btn = pygame.Rect(btn_x, 200, btn_w, btn_h)
+            diff_btn = pygame.Rect(btn_x, 250, btn_w, btn_h)
+            add_btn = pygame.Rect(btn_x, 300, btn_w, btn_h)
+            quit_btn = pygame.Rect(btn_x, 350, btn_w, btn_h)
+
+            pygame.draw.rect(screen, GREEN, easy_btn)
+            pygame.draw.rect(screen, RED, diff_btn)
+            pygame.draw.rect(screen, GRAY, add_btn)
+            pygame.draw.rect(screen, GRAY, quit_btn)
+
+            draw_text("Easy", FONT_SMALL, WHITE, easy_btn.centerx, easy_btn.centery)
+            draw_text("Difficult", FONT_SMALL, WHITE, diff_btn.centerx, diff_btn.centery)
+            draw_text("Add Word", FONT_SMALL, BLACK, add_btn.centerx, add_btn.centery)
+            draw_text("Quit", FONT_SMALL, BLACK, quit_btn.centerx, quit_btn.centery)
+
+            loop.flip()
+
+        for e in loop.events():
             if e.type == pygame.QUIT:
                 pygame.quit(); sys.exit()
             elif e.type == pygame.MOUSEBUTTONDOWN:
@@ -221,65 +214,64 @@ def main_game(diff):
     running = True
     shuffle_btn = pygame.Rect(10, 50, 90, 30)
 
+    loop = FrameLoop()
     while running:
-        FONT_BIG, FONT_SMALL = get_fonts(HEIGHT)
-        draw_gradient_background(screen, WIDTH, HEIGHT, WHITE, (200, 200, 255))
-        word = words[diff][idx]["word"]
-        draw_text(word, FONT_BIG, BLUE, WIDTH//2, HEIGHT//3)
-
-        # Shuffle button
-        pygame.draw.rect(screen, GRAY, shuffle_btn)
-        draw_text("Shuffle", FONT_SMALL, BLACK, shuffle_btn.centerx, shuffle_btn.centery)
-
-        # Right-side buttons
-        speak_btn = pygame.Rect(WIDTH - 200, 150, 180, 40)
-        mic_btn = pygame.Rect(WIDTH - 200, 200, 180, 40)
-        ai_assist_btn = pygame.Rect(WIDTH - 200, 250, 180, 40)
-        ai_help_btn = pygame.Rect(WIDTH - 200, 300, 180, 40)
-
-        pygame.draw.rect(screen, GRAY, speak_btn)
-        pygame.draw.rect(screen, GRAY, mic_btn)
-        pygame.draw.rect(screen, GRAY, ai_assist_btn)
-        pygame.draw.rect(screen, GRAY, ai_help_btn)
-
-        draw_text("Speak Word", FONT_SMALL, BLACK, speak_btn.centerx, speak_btn.centery)
-        draw_text("Mic", FONT_SMALL, BLACK, mic_btn.centerx, mic_btn.centery)
-        draw_text("AI Assist", FONT_SMALL, BLACK, ai_assist_btn.centerx, ai_assist_btn.centery)
-        draw_text("AI Help", FONT_SMALL, BLACK, ai_help_btn.centerx, ai_help_btn.centery)
-
-        pygame.display.flip()
-
-        for e in pygame.event.get():
+        if loop.needs_redraw():
+            FONT_BIG, FONT_SMALL = get_fonts(HEIGHT)
+            draw_gradient_background(screen, WIDTH, HEIGHT, WHITE, (200, 200, 255))
+            word = words[diff][idx]["word"]
+            draw_text(word, FONT_BIG, BLUE, WIDTH//2, HEIGHT//3)
+
+            # Shuffle button
+            pygame.draw.rect(screen, GRAY, shuffle_btn)
+            draw_text("Shuffle", FONT_SMALL, BLACK, shuffle_btn.centerx, shuffle_btn.centery)
+
+            # Right-side buttons
+            speak_btn = pygame.Rect(WIDTH - 200, 150, 180, 40)
+            mic_btn = pygame.Rect(WIDTH - 200, 200, 180, 40)
+            ai_assist_btn = pygame.Rect(WIDTH - 200, 250, 180, 40)
+            ai_help_btn = pygame.Rect(WIDTH - 200, 300, 180, 40)
+
+            pygame.draw.rect(screen, GRAY, speak_btn)
+            pygame.draw.rect(screen, GRAY, mic_btn)
+            pygame.draw.rect(screen, GRAY, ai_assist_btn)
+            pygame.draw.rect(screen, GRAY, ai_help_btn)
+
+            draw_text("Speak Word", FONT_SMALL, BLACK, speak_btn.centerx, speak_btn.centery)
+            draw_text("Mic", FONT_SMALL, BLACK, mic_btn.centerx, mic_btn.centery)
+            draw_text("AI Assist", FONT_SMALL, BLACK, ai_assist_btn.centerx, ai_assist_btn.centery)
+            draw_text("AI Help", FONT_SMALL, BLACK, ai_help_btn.centerx, ai_help_btn.centery)
+
+            loop.flip()
+
+        for e in loop.events():
             if e.type == pygame.QUIT:
-                joblib.dump(model, MODEL_FILE)
                 pygame.quit(); sys.exit()
             elif e.type == pygame.MOUSEBUTTONDOWN:
                 if shuffle_btn.collidepoint(e.pos):
                     random.shuffle(words[diff])
                     idx = 0
                 elif speak_btn.collidepoint(e.pos):
-                    os.system(f'espeak "{word}"')
+                    tts.say(word)
                 elif mic_btn.collidepoint(e.pos):
                     user = recognize_speech()
                     lev = levenshtein(user, word)
                     bigram = bigram_similarity(user, word)
                     label = combined_feedback(user, word)
-                    model.partial_fit([[lev, bigram]], [label])
+                    trainer.add([lev, bigram], label)
                     log_attempt(user, word, lev, bigram, label)
-                    joblib.dump(model, MODEL_FILE)
 
                     print(f"You said: {user} → {label}")
 
                     attempts_db[diff][word] = attempts_db[diff].get(word, 0) + 1
-                    with open(ATTEMPTS_FILE, "w") as f:
-                        json.dump(attempts_db, f, indent=2)
+                    store.save(ATTEMPTS_FILE, attempts_db)
 
                     idx = (idx + 1) % len(words[diff])
 
                 elif ai_assist_btn.collidepoint(e.pos):
-                    os.system(f'espeak "Try again. Say it slowly."')
+                    tts.say("Try again. Say it slowly.")
                 elif ai_help_btn.collidepoint(e.pos):
-                    os.system(f'espeak "The word is {word}"')
+                    tts.say(f"The word is {word}")
 
 # === GO ===
 menu()
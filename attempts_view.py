@@ -0,0 +1,59 @@
+import json
+import os
+
+
+class AttemptsView:
+    """In-memory copy of attempts.json.
+
+    The game updates this view directly, so screens never parse the file per
+    frame.  ``refresh()`` only re-reads the file when its mtime differs from the
+    last write or read made by this process, i.e. when it changed from outside.
+    With a JsonStore, writes are left to the store and refresh() never reads
+    the file while the store still has changes for it in flight.
+    """
+
+    def __init__(self, path, store=None):
+        self.path = path
+        self.store = store
+        self.counts = {"easy": {}, "difficult": {}}
+        self._mtime = None
+        self.reload()
+
+    def _file_mtime(self):
+        try:
+            return os.stat(self.path).st_mtime_ns
+        except OSError:
+            return None
+
+    def reload(self):
+        mtime = self._file_mtime()
+        if mtime is None:
+            self.counts = {"easy": {}, "difficult": {}}
+        else:
+            try:
+                with open(self.path, "r") as f:
+                    self.counts = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"[ERROR] Failed to read {self.path}: {e}")
+                return
+        self._mtime = mtime
+
+    def refresh(self):
+        if self.store is not None and self.store.pending(self.path):
+            return self.counts
+        if self._file_mtime() != self._mtime:
+            self.reload()
+        return self.counts
+
+    def mark_saved(self):
+        self._mtime = self._file_mtime()
+
+    def get(self, difficulty, word):
+        return self.counts.get(difficulty, {}).get(word, 0)
+
+    def add_word(self, difficulty, word):
+        self.counts.setdefault(difficulty, {}).setdefault(word, 0)
+
+    def reset(self):
+        self.counts = {"easy": {}, "difficult": {}}
+        self._mtime = self._file_mtime()
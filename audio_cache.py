@@ -0,0 +1,232 @@
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+from persistence import atomic_write
+from pronunciation import espeak_input, speakable
+from syllables import split_syllables
+
+# === SYNTHESIZED AUDIO CACHE ===
+# WAV files are content-addressed by (text, voice, rate) so a word or syllable is
+# synthesized once and replayed through pygame.mixer.Sound afterwards.
+AUDIO_CACHE_DIR = "audio_cache"
+AUDIO_CACHE_MAX_BYTES = 64 * 1024 * 1024
+MAX_LOADED_SOUNDS = 128  # decoded pygame Sounds kept in memory
+DEFAULT_VOICE = "en"
+DEFAULT_RATE = 175
+
+
+def cache_key(text, voice=DEFAULT_VOICE, rate=DEFAULT_RATE):
+    # Keyed by what espeak is given, so a lexicon change re-renders the word.
+    return hashlib.sha1(f"{voice}\0{rate}\0{espeak_input(text)}".encode("utf-8")).hexdigest()
+
+
+def cache_path(text, voice=DEFAULT_VOICE, rate=DEFAULT_RATE, cache_dir=AUDIO_CACHE_DIR):
+    key = cache_key(text, voice, rate)
+    return os.path.join(cache_dir, key[:2], key + ".wav")
+
+
+def synthesize(text, voice=DEFAULT_VOICE, rate=DEFAULT_RATE, cache_dir=AUDIO_CACHE_DIR):
+    """Render `text` to its cache file with espeak; returns the path or None on failure."""
+    path = cache_path(text, voice, rate, cache_dir)
+    if os.path.exists(path):
+        return path
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    try:
+        with atomic_write(path) as tmp_path:
+            subprocess.run(['espeak', '-v', voice, '-s', str(rate), '-w', tmp_path, espeak_input(text)],
+                           check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    except (OSError, subprocess.CalledProcessError) as e:
+        print(f"[ERROR] Failed to synthesize {text!r}: {e}")
+        return None
+    return path
+
+
+def _synthesize_job(job):
+    return synthesize(*job)
+
+
+class AudioCache:
+    """Content-addressed WAV cache bounded to max_bytes on disk, least recently used out.
+
+    The directory is scanned once; after that the cache tracks its files and
+    their total size itself, so a miss costs one synthesis rather than a walk
+    of the directory.  Every hit refreshes the file's recency (its mtime, so
+    the order survives restarts).  At most MAX_LOADED_SOUNDS decoded Sounds
+    are kept in memory, and texts that fail to synthesize (or every text, when
+    espeak isn't installed) are not retried.
+    """
+
+    def __init__(self, cache_dir=AUDIO_CACHE_DIR, max_bytes=AUDIO_CACHE_MAX_BYTES,
+                 voice=DEFAULT_VOICE, rate=DEFAULT_RATE, max_sounds=MAX_LOADED_SOUNDS):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.voice = voice
+        self.rate = rate
+        self.max_sounds = max_sounds
+        self._sounds = OrderedDict()   # text -> pygame Sound, least recently used first
+        self._files = None             # path -> size, least recently used first
+        self._total = 0
+        self._failed = set()
+        self._espeak = None
+        self._lock = threading.RLock()
+
+    def _index(self):
+        if self._files is None:
+            entries = []
+            for root, _, files in os.walk(self.cache_dir):
+                for name in files:
+                    if not name.endswith(".wav"):
+                        continue
+                    full = os.path.join(root, name)
+                    try:
+                        st = os.stat(full)
+                    except OSError:
+                        continue
+                    entries.append((st.st_mtime, full, st.st_size))
+            entries.sort()
+            self._files = OrderedDict((full, size) for _, full, size in entries)
+            self._total = sum(self._files.values())
+        return self._files
+
+    def _touch(self, path):
+        self._index().move_to_end(path)
+        try:
+            os.utime(path)  # mtime is the LRU order the next scan starts from
+        except OSError:
+            pass
+
+    def _can_synthesize(self):
+        if self._espeak is None:
+            self._espeak = shutil.which("espeak") is not None
+            if not self._espeak:
+                print("[ERROR] espeak not found; speech will not be cached")
+        return self._espeak
+
+    def path(self, text):
+        """Return the cached WAV for `text`, synthesizing it on a miss (None if that fails)."""
+        path = cache_path(text, self.voice, self.rate, self.cache_dir)
+        with self._lock:
+            files = self._index()
+            if path in files:
+                self._touch(path)
+                return path
+            if text in self._failed or not self._can_synthesize():
+                return None
+        made = synthesize(text, self.voice, self.rate, self.cache_dir)
+        with self._lock:
+            if made is None:
+                self._failed.add(text)
+                return None
+            try:
+                size = os.path.getsize(made)
+            except OSError:
+                return None
+            self._total += size - self._files.pop(made, 0)
+            self._files[made] = size
+            self.evict()
+        return made
+
+    def sound(self, text):
+        import pygame
+        with self._lock:
+            sound = self._sounds.get(text)
+            if sound is not None:
+                self._sounds.move_to_end(text)
+                path = cache_path(text, self.voice, self.rate, self.cache_dir)
+                if path in self._index():
+                    self._touch(path)
+                return sound
+        path = self.path(text)
+        if path is None:
+            return None
+        try:
+            sound = pygame.mixer.Sound(path)
+        except pygame.error as e:
+            print(f"[ERROR] Failed to load {path}: {e}")
+            with self._lock:
+                self._failed.add(text)
+            return None
+        with self._lock:
+            self._sounds[text] = sound
+            while len(self._sounds) > self.max_sounds:
+                self._sounds.popitem(last=False)
+        return sound
+
+    def evict(self):
+        """Delete least-recently-used files until the cache fits in max_bytes."""
+        with self._lock:
+            files = self._index()
+            while self._total > self.max_bytes and files:
+                full, size = files.popitem(last=False)
+                self._total -= size
+                try:
+                    os.remove(full)
+                except OSError:
+                    pass
+
+    def prewarm(self, texts, workers=None):
+        """Synthesize every missing text in parallel across processes; returns how many were made."""
+        missing = sorted({t for t in texts if t and not os.path.exists(
+            cache_path(t, self.voice, self.rate, self.cache_dir))})
+        synthesized = 0
+        if missing:
+            jobs = [(t, self.voice, self.rate, self.cache_dir) for t in missing]
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                synthesized = sum(path is not None for path in pool.map(_synthesize_job, jobs, chunksize=16))
+        with self._lock:
+            self._files = None  # rescan to pick up what the workers wrote
+            self.evict()
+        return synthesized
+
+
+def vocabulary_texts(words):
+    """Every word plus every syllable fragment the game may speak for it."""
+    texts = set()
+    for entries in words.values():
+        for entry in entries:
+            word = entry["word"]
+            texts.add(speakable(word))
+            for syl in split_syllables(word):
+                texts.add(speakable(syl))
+    return texts
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Manage the synthesized audio cache.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    prewarm_cmd = sub.add_parser("prewarm", help="synthesize all words and syllables")
+    prewarm_cmd.add_argument("words_files", nargs="*", default=["words.json"])
+    prewarm_cmd.add_argument("--workers", type=int, default=None)
+    sub.add_parser("evict", help="trim the cache to its size bound")
+    for cmd in sub.choices.values():
+        cmd.add_argument("--cache-dir", default=AUDIO_CACHE_DIR)
+        cmd.add_argument("--max-bytes", type=int, default=AUDIO_CACHE_MAX_BYTES)
+    args = parser.parse_args(argv)
+
+    cache = AudioCache(args.cache_dir, args.max_bytes)
+    if args.command == "evict":
+        cache.evict()
+        return 0
+
+    texts = set()
+    for path in args.words_files:
+        try:
+            with open(path, "r") as f:
+                texts |= vocabulary_texts(json.load(f))
+        except (OSError, ValueError) as e:
+            print(f"[ERROR] Failed to read {path}: {e}")
+    count = cache.prewarm(texts, workers=args.workers)
+    print(f"Synthesized {count} of {len(texts)} entries into {args.cache_dir}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
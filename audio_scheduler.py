@@ -0,0 +1,65 @@
+import time
+
+import pygame
+
+from tts_service import TTSService
+
+BGM_DUCK_VOLUME = 0.3  # music volume while speech is playing
+
+
+class AudioScheduler(TTSService):
+    """One timeline for speech, sound effects and background-music ducking.
+
+    Speech and effects are queued in order and played by the TTS thread, so the
+    event loop never waits on audio.  Music is ducked while speech plays and
+    restored once the timeline drains.  ``cancel_speech()`` pre-empts the
+    current utterance and drops everything still queued; an effect that has
+    already started plays to the end.
+    """
+
+    def __init__(self, cache=None, duck_volume=BGM_DUCK_VOLUME):
+        super().__init__(cache=cache)
+        self.duck_volume = duck_volume
+        self._restore_volume = None
+
+    def play(self, sound, pause=0.0, wait=True):
+        """Queue a pygame Sound; with wait=False later items don't wait for it to end."""
+        if sound is None:
+            return
+        self._enqueue("sfx", (sound, wait), pause)
+
+    def cancel_speech(self):
+        self.clear()
+
+    def _duck(self):
+        if self._restore_volume is not None or not pygame.mixer.get_init():
+            return
+        volume = pygame.mixer.music.get_volume()
+        if volume > self.duck_volume:
+            self._restore_volume = volume
+            pygame.mixer.music.set_volume(self.duck_volume)
+
+    def _idle(self):
+        if self._restore_volume is None:
+            return
+        # Leave the volume alone if the player muted/unmuted while we were ducked.
+        if pygame.mixer.get_init() and abs(pygame.mixer.music.get_volume() - self.duck_volume) < 0.01:
+            pygame.mixer.music.set_volume(self._restore_volume)
+        self._restore_volume = None
+
+    def _perform(self, engine, generation, kind, payload, pause):
+        if kind != "sfx":
+            if generation == self._generation:
+                self._duck()
+            super()._perform(engine, generation, kind, payload, pause)
+            return
+        # A flush drops effects that haven't started yet; one already playing
+        # (e.g. the correct/wrong chime when the next word loads) is left to finish.
+        if generation != self._generation:
+            return
+        sound, wait = payload
+        sound.play()
+        if wait:
+            time.sleep(sound.get_length())
+        if pause and generation == self._generation:
+            time.sleep(pause)
@@ -0,0 +1,83 @@
+from collections import defaultdict
+from functools import lru_cache
+
+RESCORE_MIN_SIMILARITY = 0.8  # a hypothesis this close to the expected word counts as it
+
+
+@lru_cache(maxsize=65536)
+def bigram_profile(word):
+    """The set of character bigrams of `word` (the word itself if shorter than 2)."""
+    return frozenset(word[i:i+2] for i in range(len(word)-1)) if len(word) >= 2 else frozenset((word,))
+
+
+def bigram_similarity(a, b):
+    A = bigram_profile(a)
+    B = bigram_profile(b)
+    union = len(A | B)
+    return len(A & B) / union if union else 0
+
+
+class BigramIndex:
+    """Inverted index from character bigram to the vocabulary words containing it.
+
+    ``best_matches()`` scores a transcript against the vocabulary by bigram
+    Jaccard similarity while only touching words that share at least one
+    bigram with it; ``rescore()`` uses it to pick the expected word out of a
+    recognizer's n-best list when one hypothesis is a near-miss of it.
+    """
+
+    def __init__(self, words=()):
+        self._postings = defaultdict(set)
+        self._sizes = {}
+        for word in words:
+            self.add(word)
+
+    @classmethod
+    def from_words(cls, words):
+        return cls(entry["word"].lower() for entries in words.values() for entry in entries)
+
+    def __contains__(self, word):
+        return word in self._sizes
+
+    def add(self, word):
+        if word in self._sizes:
+            return
+        profile = bigram_profile(word)
+        self._sizes[word] = len(profile)
+        for bigram in profile:
+            self._postings[bigram].add(word)
+
+    def best_matches(self, text, k=1):
+        """Return up to k (similarity, word) pairs, most similar first."""
+        profile = bigram_profile(text)
+        overlap = defaultdict(int)
+        for bigram in profile:
+            for word in self._postings.get(bigram, ()):
+                overlap[word] += 1
+        scored = [(shared / (len(profile) + self._sizes[word] - shared), word)
+                  for word, shared in overlap.items()]
+        scored.sort(key=lambda item: (-item[0], item[1]))
+        return scored[:k]
+
+    def rescore(self, alternatives, expected, min_similarity=RESCORE_MIN_SIMILARITY):
+        """Pick the transcript to grade from an n-best list (best hypothesis first).
+
+        Returns `expected` if any hypothesis is exactly it, or if a hypothesis
+        is at least `min_similarity` close to it and no other vocabulary word
+        matches that hypothesis better.  Otherwise the top hypothesis is kept.
+        """
+        hypotheses = [h.strip().lower() for h in alternatives if h and h.strip()]
+        if not hypotheses:
+            return ""
+        expected = expected.lower()
+        if expected in hypotheses:
+            return expected
+        for hypothesis in hypotheses:
+            if hypothesis in self and hypothesis != expected:
+                continue  # a real vocabulary word, not a garbled form of this one
+            if bigram_similarity(hypothesis, expected) < min_similarity:
+                continue
+            best = self.best_matches(hypothesis, k=2)
+            if best and best[0][1] == expected and (len(best) == 1 or best[1][0] < best[0][0]):
+                return expected
+        return hypotheses[0]
@@ -1,100 +1,80 @@
-import pygame
-import subprocess
 import random
-import speech_recognition as sr
-import json
 import os
 import time
-import re
 import sys
-import csv
-import difflib
-import pyttsx3
-import joblib
-from sklearn.linear_model import SGDClassifier
-
-pygame.init()
-tts_engine = pyttsx3.init()
+import atexit
+import threading
+from collections import deque
+import startup
+
+with startup.timed("imports"):
+    import pygame
+    from render_cache import draw_gradient_background, clear_gradient_cache, get_font, render_text, LayeredScreen
+    from frame_loop import FrameLoop
+    from attempts_view import AttemptsView
+    from speech_worker import Listener, SpeechWorker, SPEECH_RESULT
+    from audio_scheduler import AudioScheduler
+    from audio_cache import AudioCache, vocabulary_texts
+    from syllables import split_syllables
+    from pronunciation import speakable
+    from edit_distance import levenshtein
+    from word_index import WordIndex
+    from bigram_index import BigramIndex, bigram_similarity
+    from online_trainer import OnlineTrainer
+    from training_log import TrainingLog
+    from feedback_table import FeedbackTable
+    from persistence import JsonStore
+    from learner_store import LearnerStore
+    from word_import import load_words, difficulty_for
+
+with startup.timed("pygame.init"):
+    pygame.init()
+# Speech, sound effects and BGM ducking share one timeline on the audio thread
+audio = AudioScheduler(cache=AudioCache())
+startup.warm_up("audio thread", audio.start)
 
 # === ML SETUP (SGDClassifier) ===
 MODEL_FILE = "word_feedback_model.joblib"
 TRAINING_LOG = "training_log.csv"
 classes = ["correct", "almost", "incorrect"]
 
-if os.path.exists(MODEL_FILE):
-    model = joblib.load(MODEL_FILE)
-else:
-    model = SGDClassifier(loss="log_loss")
-    model.partial_fit([[0, 1], [1, 0], [0.5, 0.5]], ["correct", "incorrect", "almost"], classes=classes)
-
-def bigram_similarity(a, b):
-    def get_bigrams(w):
-        return set(w[i:i+2] for i in range(len(w)-1)) if len(w) >= 2 else {w}
-    A = get_bigrams(a)
-    B = get_bigrams(b)
-    return len(A & B) / len(A | B) if A | B else 0
-
-def combined_feedback(user, correct):
-    if user == correct:
-        return "correct"
-    d = levenshtein(user, correct)
-    s = bigram_similarity(user, correct)
-    if d == 1 or s >= 0.7:
-        return "almost"
-    else:
-        return "incorrect"
-
-def log_attempt(user, correct, lev, bigram, label):
-    file_exists = os.path.isfile(TRAINING_LOG)
-    with open(TRAINING_LOG, "a", newline="") as csvfile:
-        writer = csv.writer(csvfile)
-        if not file_exists:
-            writer.writerow(["user_attempt", "correct_word", "levenshtein", "bigram_similarity", "label"])
-        writer.writerow([user, correct, lev, bigram, label])
-
-def update_model_with_attempt(user_attempt, correct_word):
-    lev = levenshtein(user_attempt, correct_word)
-    bigram = bigram_similarity(user_attempt, correct_word)
-    label = combined_feedback(user_attempt, correct_word)
-    model.partial_fit([[lev, bigram]], [label])
-    joblib.dump(model, MODEL_FILE)
-    log_attempt(user_attempt, correct_word, lev, bigram, label)
-    return label
-
-def levenshtein(a, b):
-    """Compute Levenshtein distance between two words."""
-    if len(a) < len(b):
-        return levenshtein(b, a)
-    if len(b) == 0:
-        return len(a)
-    previous_row = list(range(len(b) + 1))
-    for i, c1 in enumerate(a):
-        current_row = [i + 1]
-        for j, c2 in enumerate(b):
-            insertions = previous_row[j + 1] + 1
-            deletions = current_row[j] + 1
-            substitutions = previous_row[j] + (c1 != c2)
-            current_row.append(min(insertions, deletions, substitutions))
-        previous_row = current_row
-    return previous_row[-1]
-
-
-MODEL_FILE = "word_feedback_model.joblib"
-TRAINING_LOG = "training_log.csv"
-classes = ["correct", "almost", "incorrect"]
-
-if os.path.exists(MODEL_FILE):
-    model = joblib.load(MODEL_FILE)
-else:
-    model = SGDClassifier(loss="log_loss")
-    model.partial_fit([[0, 1], [1, 0], [0.5, 0.5]], ["correct", "incorrect", "almost"], classes=classes)
-
-def bigram_similarity(a, b):
-    def get_bigrams(w):
-        return set(w[i:i+2] for i in range(len(w)-1)) if len(w) >= 2 else {w}
-    A = get_bigrams(a)
-    B = get_bigrams(b)
-    return len(A & B) / len(A | B) if A | B else 0
+# The UI reads the model's decisions from a precomputed table, rebuilt at every checkpoint
+feedback_table = FeedbackTable()
+model = None
+trainer = None
+# Attempts made before the warm-up has loaded the model wait here for the trainer
+# (only the newest MAX_PENDING_SAMPLES; none once loading the model has failed)
+MAX_PENDING_SAMPLES = 500
+_pending_samples = deque(maxlen=MAX_PENDING_SAMPLES)
+_trainer_lock = threading.Lock()
+
+def load_model():
+    """Import sklearn/joblib and load (or bootstrap) the model; runs on the warm-up thread."""
+    global model, trainer, _pending_samples
+    try:
+        import joblib
+        from sklearn.linear_model import SGDClassifier
+        if os.path.exists(MODEL_FILE):
+            model = joblib.load(MODEL_FILE)
+        else:
+            model = SGDClassifier(loss="log_loss")
+            model.partial_fit([[0, 1], [1, 0], [0.5, 0.5]], ["correct", "incorrect", "almost"], classes=classes)
+    except Exception:
+        # No trainer will ever drain the queue
+        with _trainer_lock:
+            _pending_samples = None
+        raise
+    feedback_table.refresh(model)
+    # Attempts are fitted in micro-batches and checkpointed in the background; flushed on exit
+    new_trainer = OnlineTrainer(model, MODEL_FILE, on_checkpoint=feedback_table.refresh)
+    atexit.register(new_trainer.close)
+    with _trainer_lock:
+        for features, label in _pending_samples:
+            new_trainer.add(features, label)
+        _pending_samples.clear()
+        trainer = new_trainer
+
+startup.warm_up("model", load_model)
 
 def combined_feedback(user, correct):
     d = levenshtein(user, correct)
@@ -106,28 +86,34 @@ def combined_feedback(user, correct):
     else:
         return "incorrect"
 
+# Rows are buffered, the CSV rotates by size and old segments are compacted to .npy columns
+training_log = TrainingLog(TRAINING_LOG)
+atexit.register(training_log.close)
+
 def log_attempt(user, correct, lev, bigram, label):
-    with open(TRAINING_LOG, "a", newline="") as csvfile:
-        writer = csv.writer(csvfile)
-        writer.writerow([user, correct, lev, bigram, label])
+    training_log.append(user, correct, lev, bigram, label)
 
 def update_model_with_attempt(user_attempt, correct_word):
     lev = levenshtein(user_attempt, correct_word)
     bigram = bigram_similarity(user_attempt, correct_word)
     label = combined_feedback(user_attempt, correct_word)
-    model.partial_fit([[lev, bigram]], [label])
-    joblib.dump(model, MODEL_FILE)
+    # Never wait for the model here: until the warm-up has loaded it the sample is
+    # queued for the trainer, and feedback falls back to the rule-based label.
+    with _trainer_lock:
+        if trainer is not None:
+            trainer.add([lev, bigram], label)
+        elif _pending_samples is not None:
+            _pending_samples.append(([lev, bigram], label))
     log_attempt(user_attempt, correct_word, lev, bigram, label)
-    return label
+    if user_attempt == correct_word:
+        return label
+    return feedback_table.predict(lev, bigram) or label
 
-def suggest_similar_word(correct_word):
-    suggestions = []
-    for level_words in words.values():
-        for word_data in level_words:
-            word = word_data["word"]
-            if word != correct_word and word[0] == correct_word[0] and abs(len(word) - len(correct_word)) <= 2:
-                suggestions.append(word)
-    return random.choice(suggestions) if suggestions else None
+SUGGESTION_COUNT = 5  # pick among this many nearest words so repeated suggestions vary
+
+def suggest_similar_word(correct_word, difficulty=None):
+    suggestions = word_index.nearest(correct_word, k=SUGGESTION_COUNT, tag=difficulty)
+    return random.choice(suggestions)[1] if suggestions else None
 
 
 # --- BACKGROUND MUSIC SETUP ---
@@ -136,22 +122,19 @@ bgm_muted = False
 
 ACH_POPPED_FILE = "achievement_popped.json"
 
+# attempts.json, progress.json and achievement_popped.json are written behind the
+# UI by one background thread (debounced, atomic rename) and flushed on exit
+store = JsonStore()
+atexit.register(store.close)
+
 def load_achievement_popped():
-    if os.path.exists(ACH_POPPED_FILE):
-        with open(ACH_POPPED_FILE, "r") as f:
-            return json.load(f)
-    return {}
+    return store.load(ACH_POPPED_FILE, {})
 
 def save_achievement_popped(achievement_popped):
-    try:
-        with open(ACH_POPPED_FILE, "w") as f:
-            json.dump(achievement_popped, f, indent=2)
-    except Exception as e:
-        print(f"[ERROR] Failed to save achievement_popped.json: {e}")
+    store.save(ACH_POPPED_FILE, achievement_popped)
 
 def reset_achievement_popped():
-    if os.path.exists(ACH_POPPED_FILE):
-        os.remove(ACH_POPPED_FILE)
+    store.delete(ACH_POPPED_FILE)
 
 def play_bgm(loop=True):
     global bgm_muted
@@ -191,53 +174,58 @@ GRAY = (200, 200, 200)
 PURPLE = (128, 0, 128)
 YELLOW = (255, 215, 0)
 
-# Sounds
-try:
-    correct_sound = pygame.mixer.Sound('correct.wav')
-    wrong_sound = pygame.mixer.Sound('wrong.wav')
-    congrats_sound = pygame.mixer.Sound('congrats.wav')
-except pygame.error:
-    correct_sound = None
-    wrong_sound = None
-    congrats_sound = None
+# Sounds (loaded by the warm-up thread; play_sound skips any that aren't ready)
+correct_sound = None
+wrong_sound = None
+congrats_sound = None
+
+def load_sounds():
+    global correct_sound, wrong_sound, congrats_sound
+    try:
+        correct_sound = pygame.mixer.Sound('correct.wav')
+        wrong_sound = pygame.mixer.Sound('wrong.wav')
+        congrats_sound = pygame.mixer.Sound('congrats.wav')
+    except (pygame.error, FileNotFoundError):
+        correct_sound = None
+        wrong_sound = None
+        congrats_sound = None
+
+startup.warm_up("sounds", load_sounds)
 
 def play_sound(sound):
     if sound:
-        sound.play()
+        audio.play(sound)
 
 def congrats_screen():
     global WIDTH, HEIGHT, screen
     stop_bgm()
-    if congrats_sound:
-        congrats_sound.play()
-    import threading
-    def run_tts():
-        tts_engine.say("Congratulations! You finished this level. Excellent job! Always remember that practice makes perfect.")
-        tts_engine.runAndWait()
-    tts_thread = threading.Thread(target=run_tts)
-    tts_thread.start()
+    play_sound(congrats_sound)
+    audio.say("Congratulations! You finished this level. Excellent job! Always remember that practice makes perfect.")
     start_time = pygame.time.get_ticks()
     duration = 10000
     CUSTOM_FONT_SIZE = 25
-    font = pygame.font.Font(None, CUSTOM_FONT_SIZE)
+    font = get_font(CUSTOM_FONT_SIZE)
+    loop = FrameLoop()
+    loop.wake_at(start_time + duration)
     running = True
     while running:
-        for event in pygame.event.get():
+        for event in loop.events():
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
             elif event.type == pygame.VIDEORESIZE:
                 WIDTH, HEIGHT = event.w, event.h
+                clear_gradient_cache()
                 screen = pygame.display.set_mode((WIDTH, HEIGHT), pygame.RESIZABLE)
-                font = pygame.font.Font(None, CUSTOM_FONT_SIZE)
-        draw_gradient_background(screen, WIDTH, HEIGHT, (255, 255, 255), (216, 191, 216))
-        draw_text("Congratulations! You finished this level.", font, PURPLE, WIDTH // 2, HEIGHT // 2 - 60)
-        draw_text("Excellent job!", font, PURPLE, WIDTH // 2, HEIGHT // 2)
-        draw_text("Always remember that practice makes perfect.", font, PURPLE, WIDTH // 2, HEIGHT // 2 + 60)
-        pygame.display.flip()
-        if pygame.time.get_ticks() - start_time > duration:
+                font = get_font(CUSTOM_FONT_SIZE)
+        if loop.needs_redraw():
+            draw_gradient_background(screen, WIDTH, HEIGHT, (255, 255, 255), (216, 191, 216))
+            draw_text("Congratulations! You finished this level.", font, PURPLE, WIDTH // 2, HEIGHT // 2 - 60)
+            draw_text("Excellent job!", font, PURPLE, WIDTH // 2, HEIGHT // 2)
+            draw_text("Always remember that practice makes perfect.", font, PURPLE, WIDTH // 2, HEIGHT // 2 + 60)
+            loop.flip()
+        if loop.expired(start_time + duration):
             running = False
-    tts_thread.join(timeout=0.5)
     play_bgm()
 
 def get_fonts(height):
@@ -245,15 +233,26 @@ def get_fonts(height):
     small_size = max(14, height // 24)
     hint_size = max(12, height // 30)
     return (
-        pygame.font.Font(None, 22),   # FONT_LARGE
-        pygame.font.Font(None, 20),   # FONT_SMALL
-        pygame.font.Font(None, 12),    # FONT_HINT
+        get_font(22),   # FONT_LARGE
+        get_font(20),   # FONT_SMALL
+        get_font(12),    # FONT_HINT
     )
 
-def draw_text(text, font, color, x, y, center=True):
-    rendered = font.render(text, True, color)
+def draw_text(text, font, color, x, y, center=True, surface=None):
+    rendered = render_text(text, font, color)
     rect = rendered.get_rect(center=(x, y) if center else (x, y))
-    screen.blit(rendered, rect)
+    (surface if surface is not None else screen).blit(rendered, rect)
+
+def draw_button_text(text, font, color, rect, surface=None):
+    lines = text.split('\n')
+    total_height = sum(font.size(line)[1] for line in lines)
+    y_offset = rect.centery - total_height // 2
+    for line in lines:
+        text_surface = render_text(line, font, color)
+        text_rect = text_surface.get_rect(center=(rect.centerx, y_offset + font.get_height() // 2))
+        (surface if surface is not None else screen).blit(text_surface, text_rect)
+        y_offset += font.get_height()
+
 words = {
     "easy": [
     {"word": "apple"}, {"word": "candle"}, {"word": "button"}, {"word": "sunset"}, {"word": "pencil"},
@@ -286,67 +285,87 @@ words = {
     ]
 }
 
+# words.json (add_word_menu, word_import.py) extends the built-in list
+WORDS_FILE = "words.json"
+words = load_words(WORDS_FILE, words)
+
 SAVE_FILE = "progress.json"
 ATTEMPTS_FILE = "attempts.json"
 
+with startup.timed("vocabulary indexes"):
+    # In-memory attempts + sorted vocabulary; the file is only re-read if it changes on disk
+    attempts_view = AttemptsView(ATTEMPTS_FILE, store=store)
+    # Every word in the game, for duplicate checks in add_word_menu
+    vocabulary = {entry["word"] for entries in words.values() for entry in entries}
+    # Bigram postings over the vocabulary, for rescoring the recognizer's n-best transcripts
+    transcript_index = BigramIndex.from_words(words)
+
+# Edit-distance index for suggestions after repeated misses; filled by the warm-up
+# thread (the index is locked, so add_word_menu can add to it meanwhile)
+word_index = WordIndex()
+# The vocabulary as loaded, for the background jobs (the lists grow from add_word_menu)
+_startup_words = {tag: list(entries) for tag, entries in words.items()}
+
+def build_word_index():
+    word_index.update(_startup_words)
+
+startup.warm_up("word index", build_word_index)
+
+# Queryable learner history (words, every attempt, progress) in SQLite.  All writes
+# go through the store's writer thread; its first job imports the legacy JSON/CSV
+# files once, and the thread starts with the warm-up, after the first frame.
+learner_db = LearnerStore()
+atexit.register(learner_db.close)
+
+def open_learner_db():
+    with startup.timed("learner database", "learner-db"):
+        learner_db.migrate(WORDS_FILE, ATTEMPTS_FILE, SAVE_FILE, [TRAINING_LOG])
+        learner_db.sync_words(_startup_words)
+
+learner_db.submit(open_learner_db)
+startup.warm_up("learner database writer", learner_db.start)
+
+def record_attempt(difficulty, word, transcript, source, label=None):
+    lev = levenshtein(transcript, word)
+    bigram = bigram_similarity(transcript, word)
+    if label is None:
+        label = combined_feedback(transcript, word)
+    # Only Mic presses count towards the per-word attempt counter, as in attempts.json
+    learner_db.submit(learner_db.record_attempt, difficulty, word, source, transcript, lev, bigram, label,
+                      ts=time.time(), counted=(source == "mic"))
+
 def load_attempts():
-    if os.path.exists(ATTEMPTS_FILE):
-        with open(ATTEMPTS_FILE, "r") as f:
-            return json.load(f)
-    else:
-        return {"easy": {}, "difficult": {}}
+    return attempts_view.refresh()
 
 def save_attempts(attempts):
-    try:
-        with open(ATTEMPTS_FILE, "w") as f:
-            json.dump(attempts, f, indent=2)
-    except Exception as e:
-        print(f"Error saving attempts.json: {e}")
+    attempts_view.counts = attempts
+    store.save(ATTEMPTS_FILE, attempts, on_written=attempts_view.mark_saved)
 
 def reset_attempts():
-    if os.path.exists(ATTEMPTS_FILE):
-        os.remove(ATTEMPTS_FILE)
+    store.delete(ATTEMPTS_FILE, on_written=attempts_view.mark_saved)
+    attempts_view.reset()
+    learner_db.submit(learner_db.reset_attempt_counts)
 
 def load_progress():
-    if os.path.exists(SAVE_FILE):
-        with open(SAVE_FILE, "r") as f:
-            return json.load(f)
-    else:
-        return {"easy": 0, "difficult": 0}
+    return store.load(SAVE_FILE, {"easy": 0, "difficult": 0})
 
 def save_progress(progress):
-    try:
-        with open(SAVE_FILE, "w") as f:
-            json.dump(progress, f, indent=2)
-    except Exception as e:
-        print(f"[ERROR] Failed to save progress.json: {e}")
+    store.save(SAVE_FILE, progress)
+    learner_db.submit(learner_db.save_progress, dict(progress))
 
 def reset_progress():
-    if os.path.exists(SAVE_FILE):
-        os.remove(SAVE_FILE)
+    store.delete(SAVE_FILE)
+    learner_db.submit(learner_db.reset_progress)
 
 def speak_word(word):
-    subprocess.call(['espeak', word])
-
-def recognize_speech():
-    recognizer = sr.Recognizer()
-    with sr.Microphone() as source:
-        recognizer.adjust_for_ambient_noise(source, duration=2)
-        FONT_SMALL = pygame.font.Font(None, 30)
-        draw_gradient_background(screen, WIDTH, HEIGHT, (255, 255, 255), (216, 191, 216))
-        draw_text("Listening... Speak now!", FONT_SMALL, BLACK, WIDTH // 2, HEIGHT // 2)
-        pygame.display.flip()
-        try:
-            audio = recognizer.listen(source, timeout=5, phrase_time_limit=5)
-            result = recognizer.recognize_google(audio).strip().lower()
-            return result
-        except sr.WaitTimeoutError:
-            return "Nothing / No speech detected."
-        except sr.UnknownValueError:
-            return "A thing that audio can't understand."
-        except sr.RequestError as e:
-            print(f"RequestError: {e}")
-            return "Speech service unavailable. Please check your connection."
+    audio.say(word)
+
+# Speech recognition runs on a background thread; results arrive as SPEECH_RESULT events.
+# The backend (google/sphinx/vosk) comes from LEXISPLAY_SPEECH_BACKEND.
+speech_listener = Listener(before_listen=lambda: audio.wait_until_idle(timeout=10),
+                           audio_activity=lambda: audio.queued)
+speech_worker = SpeechWorker(speech_listener)
+startup.warm_up("speech recognition", lambda: speech_listener.recognizer)
 
 def add_word_menu():
     global words
@@ -364,8 +383,9 @@ def add_word_menu():
     back_button = pygame.Rect(20, 20, back_button_width, back_button_height)
     mute_button = pygame.Rect(WIDTH - 100, 10, 90, 35)
 
+    loop = FrameLoop()
     while running:
-        for event in pygame.event.get():
+        for event in loop.events():
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
@@ -381,13 +401,16 @@ def add_word_menu():
             elif event.type == pygame.KEYDOWN and active:
                 if event.key == pygame.K_RETURN:
                     word = text.strip().lower()
-                    if word and word not in [w["word"] for w in words["easy"]] and word not in [w["word"] for w in words["difficult"]]:
-                        sylls = split_syllables(word)
-                        diff = "easy" if len(sylls) <= 2 else "difficult"
+                    if word and word not in vocabulary:
+                        diff = difficulty_for(word)
                         words[diff].append({"word": word})
-                        # Save to words.json for persistence
-                        with open("words.json", "w") as f:
-                            json.dump(words, f, indent=2)
+                        attempts_view.add_word(diff, word)
+                        vocabulary.add(word)
+                        word_index.add(word, diff)
+                        transcript_index.add(word)
+                        learner_db.submit(learner_db.add_word, diff, word)
+                        # Save to words.json for persistence (written behind, like the other files)
+                        store.save(WORDS_FILE, words)
                         # Update attempts/progress for the new word:
                         attempts = load_attempts()
                         attempts[diff][word] = 0
@@ -402,28 +425,29 @@ def add_word_menu():
                 else:
                     text += event.unicode
 
-        draw_gradient_background(screen, WIDTH, HEIGHT, (255,255,255), (216,191,216))
-        FONT_LARGE, FONT_SMALL, _ = get_fonts(HEIGHT)
-        draw_text("Add a new word:", FONT_LARGE, (30,50,200), WIDTH // 2, HEIGHT // 2 - 60)
-        pygame.draw.rect(screen, color, input_box, 2)
-        txt_surface = FONT_LARGE.render(text, True, (0,0,0))
-        screen.blit(txt_surface, (input_box.x+5, input_box.y+5))
-        draw_text("Press ENTER to add", FONT_SMALL, (60,60,60), WIDTH // 2, HEIGHT // 2 + 50)
+        if loop.needs_redraw():
+            draw_gradient_background(screen, WIDTH, HEIGHT, (255,255,255), (216,191,216))
+            FONT_LARGE, FONT_SMALL, _ = get_fonts(HEIGHT)
+            draw_text("Add a new word:", FONT_LARGE, (30,50,200), WIDTH // 2, HEIGHT // 2 - 60)
+            pygame.draw.rect(screen, color, input_box, 2)
+            txt_surface = FONT_LARGE.render(text, True, (0,0,0))
+            screen.blit(txt_surface, (input_box.x+5, input_box.y+5))
+            draw_text("Press ENTER to add", FONT_SMALL, (60,60,60), WIDTH // 2, HEIGHT // 2 + 50)
 
-        # Draw Back Button (upper left)
-        pygame.draw.rect(screen, (128, 43, 226), back_button, border_radius=8)
-        draw_text("Back", FONT_LARGE, (255,255,255), back_button.centerx, back_button.centery)
+            # Draw Back Button (upper left)
+            pygame.draw.rect(screen, (128, 43, 226), back_button, border_radius=8)
+            draw_text("Back", FONT_LARGE, (255,255,255), back_button.centerx, back_button.centery)
 
-        if bgm_muted:
-            mute_color = (200, 60, 60)  # Red when muted
-        else:
-            mute_color = (60, 179, 113)  # Green when unmuted
+            if bgm_muted:
+                mute_color = (200, 60, 60)  # Red when muted
+            else:
+                mute_color = (60, 179, 113)  # Green when unmuted
 
-        pygame.draw.rect(screen, mute_color, mute_button, border_radius=8)
-        draw_text("Mute" if not bgm_muted else "Unmute", FONT_LARGE, (255, 255, 255), mute_button.centerx,
-                  mute_button.centery)
+            pygame.draw.rect(screen, mute_color, mute_button, border_radius=8)
+            draw_text("Mute" if not bgm_muted else "Unmute", FONT_LARGE, (255, 255, 255), mute_button.centerx,
+                      mute_button.centery)
 
-        pygame.display.flip()
+            loop.flip()
 
 
 def database_menu():
@@ -441,83 +465,103 @@ def database_menu():
     back_button = pygame.Rect(10, 10, 60, 25)
     reset_button = pygame.Rect(WIDTH // 2 - 60, HEIGHT - 60, 120, 28)  # moved higher
     mute_button = pygame.Rect(WIDTH - 100, 10, 90, 35)
+    search_box = pygame.Rect(WIDTH // 2 - 80, HEIGHT // 12 + 14, 160, 20)
+    search_text = ""
     FONT_LARGE, FONT_SMALL, _ = get_fonts(HEIGHT)
 
+    loop = FrameLoop()
     while running:
-        draw_gradient_background(screen, WIDTH, HEIGHT, (255, 255, 255), (216, 191, 216))
-        draw_text("Attempts Database", FONT_LARGE, PURPLE, WIDTH // 2, HEIGHT // 12)
-
-        # Draw Back Button (upper left)
-        pygame.draw.rect(screen, (128, 43, 226), back_button, border_radius=8)
-        draw_text("Back", FONT_LARGE, (255,255,255), back_button.centerx, back_button.centery)
-        pygame.draw.rect(screen, RED, reset_button)
-        draw_text("Reset Attempts", FONT_SMALL, WHITE, reset_button.centerx, reset_button.centery)
-        if bgm_muted:
-            mute_color = (200, 60, 60)  # Red when muted
-        else:
-            mute_color = (60, 179, 113)  # Green when unmuted
-
-        pygame.draw.rect(screen, mute_color, mute_button, border_radius=8)
-        draw_text("Mute" if not bgm_muted else "Unmute", FONT_LARGE, (255, 255, 255), mute_button.centerx,
-                  mute_button.centery)
-
-        col_width = WIDTH // 3
-        header_y = HEIGHT // 8 + 30
-        row_height = 26
-        bottom_padding = HEIGHT - reset_button.top  # Align bottom of list above reset button
-        max_display_height = HEIGHT - header_y - bottom_padding
-        max_display_rows = max_display_height // row_height
-
-        headers = ["Easy", "Difficult"]
-        attempts_db = load_attempts()
-        easy_words = sorted([w["word"] for w in words["easy"]])
-        difficult_words = sorted([w["word"] for w in words["difficult"]])
-        max_rows = max(len(easy_words), len(difficult_words))
-        max_scroll = max(0, max_rows - max_display_rows)
-
-        for idx, header in enumerate(headers):
-            draw_text(header, FONT_SMALL, BLUE, col_width * idx + col_width // 2, header_y)
-        pygame.draw.line(screen, BLACK, (col_width * 0.05, header_y + 15), (WIDTH - col_width * 0.05, header_y + 15), 2)
-
-        for row in range(scroll_offset, min(scroll_offset + max_display_rows, max_rows)):
-            y = header_y + 25 + (row - scroll_offset) * row_height
-            if row < len(easy_words):
-                word = easy_words[row]
-                attempts = attempts_db.get("easy", {}).get(word, 0)
+        if loop.needs_redraw():
+            draw_gradient_background(screen, WIDTH, HEIGHT, (255, 255, 255), (216, 191, 216))
+            draw_text("Attempts Database", FONT_LARGE, PURPLE, WIDTH // 2, HEIGHT // 12)
+
+            # Draw Back Button (upper left)
+            pygame.draw.rect(screen, (128, 43, 226), back_button, border_radius=8)
+            draw_text("Back", FONT_LARGE, (255,255,255), back_button.centerx, back_button.centery)
+            pygame.draw.rect(screen, RED, reset_button)
+            draw_text("Reset Attempts", FONT_SMALL, WHITE, reset_button.centerx, reset_button.centery)
+            if bgm_muted:
+                mute_color = (200, 60, 60)  # Red when muted
+            else:
+                mute_color = (60, 179, 113)  # Green when unmuted
+
+            pygame.draw.rect(screen, mute_color, mute_button, border_radius=8)
+            draw_text("Mute" if not bgm_muted else "Unmute", FONT_LARGE, (255, 255, 255), mute_button.centerx,
+                      mute_button.centery)
+
+            # Type-to-filter search box
+            pygame.draw.rect(screen, WHITE, search_box)
+            pygame.draw.rect(screen, BLUE, search_box, 1)
+            if search_text:
+                draw_text(search_text, FONT_SMALL, BLACK, search_box.centerx, search_box.centery)
+            else:
+                draw_text("Type to search...", FONT_SMALL, (150, 150, 150), search_box.centerx, search_box.centery)
+
+            col_width = WIDTH // 3
+            header_y = HEIGHT // 8 + 30
+            row_height = 26
+            bottom_padding = HEIGHT - reset_button.top  # Align bottom of list above reset button
+            max_display_height = HEIGHT - header_y - bottom_padding
+            max_display_rows = max_display_height // row_height
+
+            headers = ["Easy", "Difficult"]
+            # Virtualized columns: the prefix filter is a range over the (difficulty, word)
+            # index and only the visible page of rows is fetched.  While the writer
+            # thread still has queued writes the page would be stale, so poll instead.
+            if learner_db.pending():
+                max_rows = 0
+                easy_page = difficult_page = []
+                draw_text("Loading...", FONT_SMALL, (150, 150, 150), WIDTH // 2, header_y + 40)
+                loop.wake_in(100)
+            else:
+                max_rows = max(learner_db.count_words("easy", search_text),
+                               learner_db.count_words("difficult", search_text))
+                easy_page = learner_db.word_page("easy", search_text, scroll_offset, max_display_rows)
+                difficult_page = learner_db.word_page("difficult", search_text, scroll_offset, max_display_rows)
+            max_scroll = max(0, max_rows - max_display_rows)
+            scroll_offset = min(scroll_offset, max_scroll)
+
+            for idx, header in enumerate(headers):
+                draw_text(header, FONT_SMALL, BLUE, col_width * idx + col_width // 2, header_y)
+            pygame.draw.line(screen, BLACK, (col_width * 0.05, header_y + 15), (WIDTH - col_width * 0.05, header_y + 15), 2)
+
+            for row, (word, attempts) in enumerate(easy_page):
+                y = header_y + 25 + row * row_height
                 draw_text(f"{word}: {attempts}", FONT_SMALL, BLACK, col_width // 2, y)
-            if row < len(difficult_words):
-                word = difficult_words[row]
-                attempts = attempts_db.get("difficult", {}).get(word, 0)
+            for row, (word, attempts) in enumerate(difficult_page):
+                y = header_y + 25 + row * row_height
                 draw_text(f"{word}: {attempts}", FONT_SMALL, BLACK, col_width * 2 + col_width // 2, y)
 
-        if max_rows > max_display_rows:
-            bar_x = WIDTH - 25
-            bar_width = 15
-            bar_track_y = header_y + 25
-            bar_track_height = max_display_height
+            if max_rows > max_display_rows:
+                bar_x = WIDTH - 25
+                bar_width = 15
+                bar_track_y = header_y + 25
+                bar_track_height = max_display_height
 
-            pygame.draw.rect(screen, (200, 200, 200), (bar_x, bar_track_y, bar_width, bar_track_height))
+                pygame.draw.rect(screen, (200, 200, 200), (bar_x, bar_track_y, bar_width, bar_track_height))
 
-            scroll_range = max_rows - max_display_rows
-            scroll_ratio = scroll_offset / scroll_range if scroll_range > 0 else 0
-            thumb_height = max(30, int((max_display_rows / max_rows) * bar_track_height))
-            thumb_y = bar_track_y + int((bar_track_height - thumb_height) * scroll_ratio)
+                scroll_range = max_rows - max_display_rows
+                scroll_ratio = scroll_offset / scroll_range if scroll_range > 0 else 0
+                thumb_height = max(30, int((max_display_rows / max_rows) * bar_track_height))
+                thumb_y = bar_track_y + int((bar_track_height - thumb_height) * scroll_ratio)
 
-            scrollbar_thumb_rect = pygame.Rect(bar_x, thumb_y, bar_width, thumb_height)
-            pygame.draw.rect(screen, (50, 100, 255), scrollbar_thumb_rect)
+                scrollbar_thumb_rect = pygame.Rect(bar_x, thumb_y, bar_width, thumb_height)
+                pygame.draw.rect(screen, (50, 100, 255), scrollbar_thumb_rect)
 
-        pygame.display.flip()
+            loop.flip()
 
-        for event in pygame.event.get():
+        for event in loop.events():
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
             elif event.type == pygame.VIDEORESIZE:
                 WIDTH, HEIGHT = event.w, event.h
+                clear_gradient_cache()
                 screen = pygame.display.set_mode((WIDTH, HEIGHT), pygame.RESIZABLE)
                 reset_button.x = WIDTH // 2 - 100
                 reset_button.y = HEIGHT - 60
                 mute_button.x = WIDTH - 140
+                search_box.x = WIDTH // 2 - 80
             elif event.type == pygame.MOUSEBUTTONDOWN:
                 if back_button.collidepoint(event.pos):
                     running = False
@@ -542,6 +586,15 @@ def database_menu():
                     scroll_offset += scroll_speed
                 elif event.key == pygame.K_UP and scroll_offset > 0:
                     scroll_offset -= scroll_speed
+                elif event.key == pygame.K_BACKSPACE:
+                    search_text = search_text[:-1]
+                    scroll_offset = 0
+                elif event.key == pygame.K_ESCAPE:
+                    search_text = ""
+                    scroll_offset = 0
+                elif event.unicode and event.unicode.isprintable():
+                    search_text += event.unicode.lower()
+                    scroll_offset = 0
             elif event.type == pygame.MOUSEWHEEL:
                 if event.y < 0 and scroll_offset < max_scroll:
                     scroll_offset += scroll_speed
@@ -559,69 +612,63 @@ def menu():
     # Final small mute button
     mute_button = pygame.Rect(WIDTH - 80, 8, 65, 22)
 
+    layers = LayeredScreen()
+    loop = FrameLoop()
     while running:
-        draw_gradient_background(screen, WIDTH, HEIGHT, (255, 255, 255), (216, 191, 216))
-
-        # Small fonts for 480x320 screen
-        FONT_LARGE = pygame.font.Font(None, 26)
-        FONT_SMALL = pygame.font.Font(None, 14)
-
-        draw_text("LexisPlay", FONT_LARGE, RED, WIDTH // 2, 30)
-        draw_text("WORD LEARNING GAME", FONT_SMALL, RED, WIDTH // 2, 50)
-
-        def draw_button_text(text, font, color, rect):
-            lines = text.split('\n')
-            total_height = sum(font.size(line)[1] for line in lines)
-            y_offset = rect.centery - total_height // 2
-            for line in lines:
-                text_surface = font.render(line, True, color)
-                text_rect = text_surface.get_rect(center=(rect.centerx, y_offset + font.get_height() // 2))
-                screen.blit(text_surface, text_rect)
-                y_offset += font.get_height()
-
-        # --- Button size and position (match Easy level style) ---
-        button_width = 160
-        button_height = 35
-        button_x = WIDTH // 2 - button_width // 2
-
-        start_btn = pygame.Rect(button_x, 80, button_width, button_height)
-        add_word_btn = pygame.Rect(button_x, 130, button_width, button_height)
-        database_btn = pygame.Rect(button_x, 180, button_width, button_height)
-        quit_btn = pygame.Rect(button_x, 230, button_width, button_height)
-        mute_button = pygame.Rect(WIDTH - 100, 10, 90, 35)
-
-        # --- Draw each button (match colors used in Easy level) ---
-        pygame.draw.rect(screen, (60, 179, 113), start_btn)
-        draw_button_text("Start", FONT_LARGE, WHITE, start_btn)
-
-        pygame.draw.rect(screen, (70, 130, 180), add_word_btn)
-        draw_button_text("Add Word", FONT_LARGE, WHITE, add_word_btn)
-
-        pygame.draw.rect(screen, (255, 165, 0), database_btn)
-        draw_button_text("Database", FONT_LARGE, WHITE, database_btn)
-
-        pygame.draw.rect(screen, (138, 43, 226), quit_btn)
-        draw_button_text("Quit", FONT_LARGE, WHITE, quit_btn)
-
-        if bgm_muted:
-            mute_color = (200, 60, 60)  # Red when muted
-        else:
-            mute_color = (60, 179, 113)  # Green when unmuted
+        if loop.needs_redraw():
+            # Small fonts for 480x320 screen
+            FONT_LARGE = get_font(26)
+            FONT_SMALL = get_font(14)
 
-        if bgm_muted:
-            mute_color = (200, 60, 60)  # Red when muted
-        else:
-            mute_color = (60, 179, 113)  # Green when unmuted
+            # --- Button size and position (match Easy level style) ---
+            button_width = 160
+            button_height = 35
+            button_x = WIDTH // 2 - button_width // 2
+
+            start_btn = pygame.Rect(button_x, 80, button_width, button_height)
+            add_word_btn = pygame.Rect(button_x, 130, button_width, button_height)
+            database_btn = pygame.Rect(button_x, 180, button_width, button_height)
+            quit_btn = pygame.Rect(button_x, 230, button_width, button_height)
+            mute_button = pygame.Rect(WIDTH - 100, 10, 90, 35)
+
+            def draw_chrome(surface):
+                draw_gradient_background(surface, WIDTH, HEIGHT, (255, 255, 255), (216, 191, 216))
+                draw_text("LexisPlay", FONT_LARGE, RED, WIDTH // 2, 30, surface=surface)
+                draw_text("WORD LEARNING GAME", FONT_SMALL, RED, WIDTH // 2, 50, surface=surface)
+
+                # --- Draw each button (match colors used in Easy level) ---
+                pygame.draw.rect(surface, (60, 179, 113), start_btn)
+                draw_button_text("Start", FONT_LARGE, WHITE, start_btn, surface=surface)
+
+                pygame.draw.rect(surface, (70, 130, 180), add_word_btn)
+                draw_button_text("Add Word", FONT_LARGE, WHITE, add_word_btn, surface=surface)
+
+                pygame.draw.rect(surface, (255, 165, 0), database_btn)
+                draw_button_text("Database", FONT_LARGE, WHITE, database_btn, surface=surface)
+
+                pygame.draw.rect(surface, (138, 43, 226), quit_btn)
+                draw_button_text("Quit", FONT_LARGE, WHITE, quit_btn, surface=surface)
 
-        pygame.draw.rect(screen, mute_color, mute_button, border_radius=8)
-        draw_text("Mute" if not bgm_muted else "Unmute", FONT_LARGE, (255, 255, 255), mute_button.centerx,
-                  mute_button.centery)
+                draw_text("Group 6 - Alpha Version 2025", FONT_LARGE, BLACK, WIDTH // 2, HEIGHT - 18, surface=surface)
 
-        draw_text("Group 6 - Alpha Version 2025", FONT_LARGE, BLACK, WIDTH // 2, HEIGHT - 18)
+            layers.begin(screen, None, draw_chrome)
 
-        pygame.display.flip()
+            # Only the mute button changes while the menu is open
+            if bgm_muted:
+                mute_color = (200, 60, 60)  # Red when muted
+            else:
+                mute_color = (60, 179, 113)  # Green when unmuted
 
-        for event in pygame.event.get():
+            layers.region(screen, mute_button)
+            pygame.draw.rect(screen, mute_color, mute_button, border_radius=8)
+            draw_text("Mute" if not bgm_muted else "Unmute", FONT_LARGE, (255, 255, 255), mute_button.centerx,
+                      mute_button.centery)
+
+            loop.flip(layers)
+            # Heavy subsystems start loading only once the menu is on screen
+            startup.first_frame_shown()
+
+        for event in loop.events():
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
@@ -639,6 +686,7 @@ def menu():
                     set_bgm_mute(not bgm_muted)
             elif event.type == pygame.VIDEORESIZE:
                 WIDTH, HEIGHT = event.w, event.h
+                clear_gradient_cache()
                 screen = pygame.display.set_mode((WIDTH, HEIGHT))
                 mute_button = pygame.Rect(WIDTH - 100, 10, 90, 35)  # re-position after resize
 
@@ -653,8 +701,8 @@ def difficulty_menu():
     back_button = pygame.Rect(20, 20, back_button_width, back_button_height)
     mute_button = pygame.Rect(WIDTH - 100, 10, 90, 35)
 
-    FONT_LARGE = pygame.font.Font(None, 26)
-    FONT_SMALL = pygame.font.Font(None, 14)
+    FONT_LARGE = get_font(26)
+    FONT_SMALL = get_font(14)
 
     btn_w = 180
     btn_h = 60
@@ -663,37 +711,39 @@ def difficulty_menu():
     easy_btn = pygame.Rect(btn_x, 80, btn_w, btn_h)
     difficult_btn = pygame.Rect(btn_x, 150, btn_w, btn_h)
 
+    loop = FrameLoop()
     while running:
-        draw_gradient_background(screen, WIDTH, HEIGHT, (255, 255, 255), (216, 191, 216))
-        draw_text("Choose Difficulty", FONT_LARGE, BLUE, WIDTH // 2, 35)
+        if loop.needs_redraw():
+            draw_gradient_background(screen, WIDTH, HEIGHT, (255, 255, 255), (216, 191, 216))
+            draw_text("Choose Difficulty", FONT_LARGE, BLUE, WIDTH // 2, 35)
 
-        pygame.draw.rect(screen, GREEN, easy_btn)
-        draw_text("Easy", FONT_LARGE, WHITE, easy_btn.centerx, easy_btn.centery)
+            pygame.draw.rect(screen, GREEN, easy_btn)
+            draw_text("Easy", FONT_LARGE, WHITE, easy_btn.centerx, easy_btn.centery)
 
-        pygame.draw.rect(screen, RED, difficult_btn)
-        draw_text("Difficult", FONT_LARGE, WHITE, difficult_btn.centerx, difficult_btn.centery)
+            pygame.draw.rect(screen, RED, difficult_btn)
+            draw_text("Difficult", FONT_LARGE, WHITE, difficult_btn.centerx, difficult_btn.centery)
 
-        # Draw large back button at upper left
-        pygame.draw.rect(screen, (128, 43, 226), back_button, border_radius=8)
-        draw_text("Back", FONT_LARGE, WHITE, back_button.centerx, back_button.centery)
+            # Draw large back button at upper left
+            pygame.draw.rect(screen, (128, 43, 226), back_button, border_radius=8)
+            draw_text("Back", FONT_LARGE, WHITE, back_button.centerx, back_button.centery)
 
-        if bgm_muted:
-            mute_color = (200, 60, 60)  # Red when muted
-        else:
-            mute_color = (60, 179, 113)  # Green when unmuted
+            if bgm_muted:
+                mute_color = (200, 60, 60)  # Red when muted
+            else:
+                mute_color = (60, 179, 113)  # Green when unmuted
 
-        if bgm_muted:
-            mute_color = (200, 60, 60)  # Red when muted
-        else:
-            mute_color = (60, 179, 113)  # Green when unmuted
+            if bgm_muted:
+                mute_color = (200, 60, 60)  # Red when muted
+            else:
+                mute_color = (60, 179, 113)  # Green when unmuted
 
-        pygame.draw.rect(screen, mute_color, mute_button, border_radius=8)
-        draw_text("Mute" if not bgm_muted else "Unmute", FONT_LARGE, (255, 255, 255), mute_button.centerx,
-                  mute_button.centery)
+            pygame.draw.rect(screen, mute_color, mute_button, border_radius=8)
+            draw_text("Mute" if not bgm_muted else "Unmute", FONT_LARGE, (255, 255, 255), mute_button.centerx,
+                      mute_button.centery)
 
-        pygame.display.flip()
+            loop.flip()
 
-        for event in pygame.event.get():
+        for event in loop.events():
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
@@ -711,170 +761,24 @@ def difficulty_menu():
                     set_bgm_mute(not bgm_muted)
             elif event.type == pygame.VIDEORESIZE:
                 WIDTH, HEIGHT = event.w, event.h
+                clear_gradient_cache()
                 screen = pygame.display.set_mode((WIDTH, HEIGHT))
                 mute_button.x = WIDTH - 80
                 # Update back button if you want it to scale/relocate on resize
 
 
-def split_syllables(word):
-    word_lower = word.lower()
-    # Unified exceptions dictionary
-    syllable_exceptions = {
-        "apple": ["app", "poll"],
-        "candle": ["can", "dell"],
-        "button": ["but", "ton"],
-        "sunset": ["sun", "set"],
-        "pencil": ["pen", "seal"],
-        "flower": ["flah", "where"],
-        "window": ["win", "dow"],
-        "rabbit": ["rab", "bit"],
-        "jelly": ["jell", "e"],
-        "cookie": ["cook", "key"],
-        "dollar": ["doll", "lar"],
-        "tiger": ["tie", "gurr"],
-        "butter": ["but", "ter"],
-        "ladder": ["lad", "der"],
-        "hammer": ["ham", "mer"],
-        "doctor": ["doc", "tor"],
-        "kitten": ["kit", "ten"],
-        "monkey": ["mon", "key"],
-        "paper": ["pay", "purr"],
-        "rocket": ["rock", "et"],
-        "puppy": ["puppy"],
-        "yellow": ["yel", "low"],
-        "mirror": ["mir", "ror"],
-        "garden": ["gar", "den"],
-        "honey": ["hon", "e"],
-        "jacket": ["jack", "et"],
-        "lion": ["lie", "on"],
-        "magic": ["ma", "jeek"],
-        "napkin": ["nap", "kin"],
-        "ocean": ["o", "cean"],
-        "pillow": ["pil", "low"],
-        "rainbow": ["rain", "baw"],
-        "supper": ["sup", "per"],
-        "table": ["tay", "ball"],
-        "under": ["un", "der"],
-        "zebra": ["ze", "bra"],
-        "bottle": ["bot", "tle"],
-        "basket": ["bas", "ket"],
-        "cactus": ["cac", "tus"],
-        "carpet": ["car", "pet"],
-        "closet": ["claw", "seth"],
-        "crayon": ["cray", "on"],
-        "dentist": ["den", "tist"],
-        "dragon": ["drag", "gon"],
-        "eagle": ["e", "gehl"],
-        "engine": ["ehn", "gine"],
-        "feather": ["feath", "there"],
-        "helmet": ["hel", "met"],
-        "jungle": ["john", "gehll"],
-        "spider": ["spy", "der"],
-        "cat": ["cat"],
-        "dog": ["dog"],
-        "sun": ["sun"],
-        "first": ["first"],
-        "box": ["box"],
-        "red": ["red"],
-        "blue": ["blue"],
-        "rush": ["rush"],
-        "jump": ["jump"],
-        "site": ["site"],
-        "bed": ["bed"],
-        "car": ["car"],
-        "ball": ["ball"],
-        "milk": ["milk"],
-        "fish": ["fish"],
-        "bird": ["bird"],
-        "tree": ["tree"],
-        "leaf": ["leaf"],
-        "cup": ["cup"],
-        "hat": ["hat"],
-        "shoe": ["shoe"],
-        "bag": ["bag"],
-        "door": ["door"],
-        "clock": ["clock"],
-        "frog": ["frog"],
-        "star": ["star"],
-        "rain": ["rain"],
-        "snow": ["snow"],
-        "wind": ["wind"],
-        "fire": ["fire"],
-        "egg": ["egg"],
-        "fork": ["fork"],
-        "spoon": ["spoon"],
-        "plate": ["plate"],
-        "glass": ["glass"],
-        "nose": ["nose"],
-        "hand": ["hand"],
-        "leg": ["leg"],
-        "eye": ["eye"],
-        "ear": ["ear"],
-        "top": ["top"],
-        "set": ["set"],
-        "zip": ["zip"],
-        "sow": ["sow"],
-        "cow": ["cow"],
-        "beast": ["beast"],
-        "bus": ["bus"],
-        "ship": ["ship"],
-        "moon": ["moon"],
-        "sky": ["sky"],
-
-    # Manual exceptions from your current code
-        "mouse": ["mouse"],
-        "scissor": ["sci", "ssor"],
-        "chocolate": ["choc", "o", "late"],
-        "butterfly": ["but", "ter", "fly"]
-    }
-
-    if word_lower in syllable_exceptions:
-        return syllable_exceptions[word_lower]
-
-    # Default syllable splitting via regex
-    syllables = re.findall(r'[^aeiou]*[aeiou]+(?:[^aeiou]*$|[^aeiou](?=[^aeiou]))?', word, re.I)
-    return syllables if syllables else [word]
-
-phonetic_map = {
-    "apple": "apple", "candle": "candle", "button": "button", "sunset": "sunset", "pencil": "pencil",
-    "flower": "flower", "window": "window", "rabbit": "rabbit", "jelly": "jelly", "cookie": "cookie",
-    "dollar": "dollar", "tiger": "tiger", "butter": "butter", "ladder": "ladder", "hammer": "hammer",
-    "doctor": "doctor", "kitten": "kitten", "monkey": "monkey", "paper": "paper", "rocket": "rocket",
-    "puppy": "puppy", "yellow": "yellow", "mirror": "mirror", "garden": "garden", "honey": "honey",
-    "jacket": "jacket", "lion": "lion", "magic": "magic", "napkin": "napkin", "ocean": "ocean",
-    "pillow": "pillow", "rainbow": "rainbow", "supper": "supper", "table": "table", "under": "under",
-    "zebra": "zebra", "bottle": "bottle", "basket": "basket", "cactus": "cactus", "carpet": "carpet",
-    "closet": "closet", "crayon": "crayon", "dentist": "dentist", "dragon": "dragon", "eagle": "eagle",
-    "engine": "engine", "feather": "feather", "helmet": "helmet", "jungle": "jungle", "spider": "spider",
-    "cat": "cat", "dog": "dog", "sun": "sun", "first": "first", "box": "box",
-    "red": "red", "blue": "blue", "rush": "rush", "jump": "jump", "site": "site",
-    "bed": "bed", "car": "car", "ball": "ball", "milk": "milk", "fish": "fish",
-    "bird": "bird", "tree": "tree", "leaf": "leaf", "cup": "cup", "hat": "hat",
-    "shoe": "shoe", "bag": "bag", "door": "door", "clock": "clock", "frog": "frog",
-    "star": "star", "rain": "rain", "snow": "snow", "wind": "wind", "fire": "fire",
-    "egg": "egg", "fork": "fork", "spoon": "spoon", "plate": "plate", "glass": "glass",
-    "nose": "nose", "hand": "hand", "leg": "leg", "eye": "eye", "ear": "ear",
-    "top": "top", "set": "set", "zip": "zip", "sow": "sow", "cow": "cow",
-    "beast": "beast", "bus": "bus", "ship": "ship", "moon": "moon", "sky": "sky"
-}
-
 def speak_syllables(word):
     syllables = split_syllables(word)
     for syl in syllables:
-        to_speak = phonetic_map.get(syl.lower(), syl)
-        tts_engine.say(to_speak)
-        tts_engine.runAndWait()
-        time.sleep(0.3)
+        audio.say(speakable(syl), pause=0.3)
 
 
 
 def syllable_feedback(word):
     sylls = split_syllables(word)
     for syl in sylls:
-        to_speak = phonetic_map.get(syl.lower(), syl)
-        subprocess.call(['espeak', to_speak])
-        time.sleep(0.4)
-    subprocess.call(['espeak', word])
+        audio.say(speakable(syl), pause=0.4)
+    audio.say(speakable(word))
 
 def get_feedback_color(feedback):
     if "perfect" in feedback.lower() or "awesome" in feedback.lower():
@@ -890,9 +794,9 @@ def get_feedback_color(feedback):
 
 def ai_assist_say_back(user_speech):
     if user_speech and user_speech.strip() != "":
-        subprocess.call(['espeak', f"You said {user_speech}"])
+        audio.say(f"You said {user_speech}")
     else:
-        subprocess.call(['espeak', "I didn't hear anything."])
+        audio.say("I didn't hear anything.")
 
 def main(difficulty):
     global screen, WIDTH, HEIGHT
@@ -927,11 +831,13 @@ def main(difficulty):
 
     progress = load_progress()
     attempts_db = load_attempts()
+    speech_listener.set_vocabulary(w["word"] for w in words[difficulty])
+    speech_worker.start()
 
     flash_index = None
     flash_color = None
     flash_start_time = 0
-    FLASH_DURATION = 500
+    FLASH_DURATION = 700
 
     syllable_hint = []
     show_congrats = False
@@ -944,6 +850,8 @@ def main(difficulty):
     def load_word(index):
         nonlocal correct_word, hint, message, message_color, current_options, option_rects, hint_shown, syllable_hint, attempts, ai_hint_display
         nonlocal ai_feedback, ai_feedback_time, ai_user_said, ai_user_said_time
+        # Moving to another word pre-empts any speech still queued for the previous one
+        audio.cancel_speech()
         current_data = words[difficulty][index]
         correct_word = current_data["word"]
         hint = current_data.get("hint", "")
@@ -968,13 +876,16 @@ def main(difficulty):
 
     current_options, option_rects = load_word(current_word_index)
 
+    layers = LayeredScreen()
+    loop = FrameLoop()
     while running:
-        for event in pygame.event.get():
+        for event in loop.events():
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
             elif event.type == pygame.VIDEORESIZE:
                 WIDTH, HEIGHT = event.w, event.h
+                clear_gradient_cache()
                 screen = pygame.display.set_mode((WIDTH, HEIGHT), pygame.RESIZABLE)
                 speak_button.x = WIDTH - 140
                 help_button.x = WIDTH - 140
@@ -984,68 +895,76 @@ def main(difficulty):
             elif event.type == pygame.MOUSEBUTTONDOWN:
                 x, y = event.pos
                 if back_button.collidepoint(x, y):
+                    speech_worker.cancel()
+                    audio.cancel_speech()
                     play_bgm()
                     running = False
                     return
                 if speak_button.collidepoint(x, y):
                     speak_word(correct_word)
-                if use_mic and mic_button.collidepoint(x, y):
-                    user_speech = recognize_speech()
-                    attempts += 1
-                    if difficulty not in attempts_db:
-                        attempts_db[difficulty] = {}
-                    attempts_db[difficulty][correct_word] = attempts
-                    save_attempts(attempts_db)
-                    if user_speech.strip() == correct_word.lower():
-                        play_sound(correct_sound)
-                        message = "Correct!"
-                        message_color = GREEN
-                        pygame.time.delay(700)
-                        current_word_index += 1
-                        progress[difficulty] = max(progress.get(difficulty, 0), current_word_index)
-                        save_progress(progress)
-                        if current_word_index >= len(words[difficulty]):
-                            congrats_screen()
-                            play_bgm()
-                            return
-                        else:
-                            current_options, option_rects = load_word(current_word_index)
-                    else:
-                            play_sound(wrong_sound)
-                            message = f"Try again. You said: \n {user_speech.capitalize()}"
-                            message_color = RED
-
-                            # 🔔 NEW: Show decision popup if 8 or more attempts
-                            if attempts >= 8:
-                                suggested_word = suggest_similar_word(correct_word)
-                                if suggested_word:
-                                    subprocess.call(
-                                        ['espeak', 'Do you want to try another word?'])
-                                    popup_font = pygame.font.Font(None, 22)
-                                    popup_message = f"Try this similar word: {suggested_word.capitalize()}?"
-                                    decision_made = False
-                                    stay_on_word = True
-
-                                    # Define button positions
-                                    btn_width = 160
-                                    btn_height = 40
-                                    stay_button = pygame.Rect(WIDTH // 2 - btn_width - 10, HEIGHT // 2 + 40, btn_width,
-                                                              btn_height)
-                                    skip_button = pygame.Rect(WIDTH // 2 + 10, HEIGHT // 2 + 40, btn_width, btn_height)
-
-                                    while not decision_made:
-                                        for event in pygame.event.get():
-                                            if event.type == pygame.QUIT:
-                                                pygame.quit()
-                                                sys.exit()
-                                            elif event.type == pygame.MOUSEBUTTONDOWN:
-                                                if stay_button.collidepoint(event.pos):
-                                                    decision_made = True
-                                                    stay_on_word = True
-                                                elif skip_button.collidepoint(event.pos):
-                                                    decision_made = True
-                                                    stay_on_word = False
-
+                if use_mic and mic_button.collidepoint(x, y) and not speech_worker.pending and flash_index is None:
+                    speech_worker.request("mic")
+                if help_button.collidepoint(x, y):
+                    speak_syllables(correct_word)
+                    message = "Listen carefully to syllables!"
+                    message_color = BLACK
+                    hint_shown = True
+                if ai_button.collidepoint(x, y) and not speech_worker.pending:
+                    speech_worker.request("ai")
+            elif event.type == SPEECH_RESULT and event.tag == "mic":
+                user_speech = transcript_index.rescore(event.alternatives, correct_word)
+                attempts += 1
+                if difficulty not in attempts_db:
+                    attempts_db[difficulty] = {}
+                attempts_db[difficulty][correct_word] = attempts
+                save_attempts(attempts_db)
+                is_correct = user_speech.strip() == correct_word.lower()
+                record_attempt(difficulty, correct_word, user_speech, "mic", "correct" if is_correct else None)
+                if is_correct:
+                    play_sound(correct_sound)
+                    message = "Correct!"
+                    message_color = GREEN
+                    # Show "Correct!" while the flash timer runs, then advance to the next word
+                    flash_index = current_word_index
+                    flash_color = (0, 255, 0)
+                    flash_start_time = pygame.time.get_ticks()
+                else:
+                        play_sound(wrong_sound)
+                        message = f"Try again. You said: \n {user_speech.capitalize()}"
+                        message_color = RED
+
+                        # 🔔 NEW: Show decision popup if 8 or more attempts
+                        if attempts >= 8:
+                            suggested_word = suggest_similar_word(correct_word, difficulty)
+                            if suggested_word:
+                                audio.say('Do you want to try another word?')
+                                popup_font = get_font(22)
+                                popup_message = f"Try this similar word: {suggested_word.capitalize()}?"
+                                decision_made = False
+                                stay_on_word = True
+
+                                # Define button positions
+                                btn_width = 160
+                                btn_height = 40
+                                stay_button = pygame.Rect(WIDTH // 2 - btn_width - 10, HEIGHT // 2 + 40, btn_width,
+                                                          btn_height)
+                                skip_button = pygame.Rect(WIDTH // 2 + 10, HEIGHT // 2 + 40, btn_width, btn_height)
+
+                                popup_loop = FrameLoop()
+                                while not decision_made:
+                                    for event in popup_loop.events():
+                                        if event.type == pygame.QUIT:
+                                            pygame.quit()
+                                            sys.exit()
+                                        elif event.type == pygame.MOUSEBUTTONDOWN:
+                                            if stay_button.collidepoint(event.pos):
+                                                decision_made = True
+                                                stay_on_word = True
+                                            elif skip_button.collidepoint(event.pos):
+                                                decision_made = True
+                                                stay_on_word = False
+
+                                    if popup_loop.needs_redraw():
                                         draw_gradient_background(screen, WIDTH, HEIGHT, (255, 255, 255),
                                                                  (216, 191, 216))
                                         draw_text("Having trouble with this word?", popup_font, RED, WIDTH // 2,
@@ -1063,38 +982,40 @@ def main(difficulty):
                                         draw_text("Try another word", popup_font, WHITE, skip_button.centerx,
                                                   skip_button.centery)
 
-                                        pygame.display.flip()
-
-                                    if not stay_on_word:
-                                        # Find the index of the suggested word
-                                        for idx, w in enumerate(words[difficulty]):
-                                            if w["word"].lower() == suggested_word.lower():
-                                                current_word_index = idx
-                                                break
-                                        progress[difficulty] = max(progress.get(difficulty, 0), current_word_index)
-                                        save_progress(progress)
-                                        current_options, option_rects = load_word(current_word_index)
-
-                                    # Define button positions
-                                    btn_width = 160
-                                    btn_height = 40
-                                    stay_button = pygame.Rect(WIDTH // 2 - btn_width - 10, HEIGHT // 2 + 40, btn_width,
-                                                              btn_height)
-                                    skip_button = pygame.Rect(WIDTH // 2 + 10, HEIGHT // 2 + 40, btn_width, btn_height)
-
-                                    while not decision_made:
-                                        for event in pygame.event.get():
-                                            if event.type == pygame.QUIT:
-                                                pygame.quit()
-                                                sys.exit()
-                                            elif event.type == pygame.MOUSEBUTTONDOWN:
-                                                if stay_button.collidepoint(event.pos):
-                                                    decision_made = True
-                                                    stay_on_word = True
-                                                elif skip_button.collidepoint(event.pos):
-                                                    decision_made = True
-                                                    stay_on_word = False
-
+                                        popup_loop.flip()
+
+                                if not stay_on_word:
+                                    # Find the index of the suggested word
+                                    for idx, w in enumerate(words[difficulty]):
+                                        if w["word"].lower() == suggested_word.lower():
+                                            current_word_index = idx
+                                            break
+                                    progress[difficulty] = max(progress.get(difficulty, 0), current_word_index)
+                                    save_progress(progress)
+                                    current_options, option_rects = load_word(current_word_index)
+
+                                # Define button positions
+                                btn_width = 160
+                                btn_height = 40
+                                stay_button = pygame.Rect(WIDTH // 2 - btn_width - 10, HEIGHT // 2 + 40, btn_width,
+                                                          btn_height)
+                                skip_button = pygame.Rect(WIDTH // 2 + 10, HEIGHT // 2 + 40, btn_width, btn_height)
+
+                                popup_loop = FrameLoop()
+                                while not decision_made:
+                                    for event in popup_loop.events():
+                                        if event.type == pygame.QUIT:
+                                            pygame.quit()
+                                            sys.exit()
+                                        elif event.type == pygame.MOUSEBUTTONDOWN:
+                                            if stay_button.collidepoint(event.pos):
+                                                decision_made = True
+                                                stay_on_word = True
+                                            elif skip_button.collidepoint(event.pos):
+                                                decision_made = True
+                                                stay_on_word = False
+
+                                    if popup_loop.needs_redraw():
                                         draw_gradient_background(screen, WIDTH, HEIGHT, (255, 255, 255),
                                                                  (216, 191, 216))
 
@@ -1113,114 +1034,50 @@ def main(difficulty):
                                         draw_text("Try suggested word", popup_font, WHITE, skip_button.centerx,
                                                   skip_button.centery)
 
-                                        pygame.display.flip()
-
-                                    if not stay_on_word:
-                                        current_word_index += 1
-                                        progress[difficulty] = max(progress.get(difficulty, 0), current_word_index)
-                                        save_progress(progress)
-                                        if current_word_index >= len(words[difficulty]):
-                                            congrats_screen()
-                                            play_bgm()
-                                            return
-                                        else:
-                                            current_options, option_rects = load_word(current_word_index)
+                                        popup_loop.flip()
+
+                                if not stay_on_word:
+                                    current_word_index += 1
+                                    progress[difficulty] = max(progress.get(difficulty, 0), current_word_index)
+                                    save_progress(progress)
+                                    if current_word_index >= len(words[difficulty]):
+                                        congrats_screen()
+                                        play_bgm()
+                                        return
+                                    else:
+                                        current_options, option_rects = load_word(current_word_index)
+            elif event.type == SPEECH_RESULT and event.tag == "ai":
+                user_speech = event.text
+                ai_feedback_label = update_model_with_attempt(user_speech, correct_word)
+                record_attempt(difficulty, correct_word, user_speech, "ai", ai_feedback_label)
+
+                if ai_feedback_label == "correct":
+                    ai_feedback = "Awesome! You said it perfectly!"
+                elif ai_feedback_label == "almost":
+                    ai_feedback = "Great job! That was very close. Try again!"
+                else:
+                    ai_feedback = "Not quite. Listen to the word and try again!"
+
+                ai_feedback_time = time.time()
+                ai_user_said = user_speech
+                ai_user_said_time = time.time()
+                ai_assist_say_back(user_speech)
+                audio.say(ai_feedback)
+                syllable_feedback(correct_word)
+                message = ai_feedback
+                message_color = get_feedback_color(ai_feedback)
+                ai_hint_display = True
+
+        if speech_worker.pending:
+            # Keep animating while the worker listens in the background
+            dots = "." * (pygame.time.get_ticks() // 400 % 4)
+            message = f"Listening{dots} Speak now!"
+            message_color = BLACK
+            loop.wake_in(400)
 
-                if help_button.collidepoint(x, y):
-                    speak_syllables(correct_word)
-                    message = "Listen carefully to syllables!"
-                    message_color = BLACK
-                    hint_shown = True
-                if ai_button.collidepoint(x, y):
-                    user_speech = recognize_speech()
-                    ai_feedback_label = update_model_with_attempt(user_speech, correct_word)
-
-                    if ai_feedback_label == "correct":
-                        ai_feedback = "Awesome! You said it perfectly!"
-                    elif ai_feedback_label == "almost":
-                        ai_feedback = "Great job! That was very close. Try again!"
-                    else:
-                        ai_feedback = "Not quite. Listen to the word and try again!"
-
-                    ai_feedback_time = time.time()
-                    ai_user_said = user_speech
-                    ai_user_said_time = time.time()
-                    ai_assist_say_back(user_speech)
-                    subprocess.call(['espeak', ai_feedback])
-                    syllable_feedback(correct_word)
-                    message = ai_feedback
-                    message_color = get_feedback_color(ai_feedback)
-                    ai_hint_display = True
-
-        draw_gradient_background(screen, WIDTH, HEIGHT, (255, 255, 255), (216, 191, 216))
-        FONT_LARGE, FONT_SMALL, FONT_HINT = get_fonts(HEIGHT)
-        draw_text(f"Difficulty: {difficulty.capitalize()}", FONT_SMALL, BLACK, WIDTH // 2, 40)
-        pygame.draw.rect(screen, (128, 43, 226), back_button, border_radius=8)
-        draw_text("Back", FONT_LARGE, (255, 255, 255), back_button.centerx, back_button.centery)
-        if difficulty == "easy" or difficulty == "difficult":
-            draw_text("Say it correctly. Press Mic to start:", FONT_SMALL, BLACK, WIDTH // 2, HEIGHT // 5)
-        else:
-            draw_text("Choose the correct word:", FONT_SMALL, BLACK, WIDTH // 2, HEIGHT // 5)
-        draw_text(correct_word, FONT_LARGE, BLUE, WIDTH // 2, HEIGHT // 3)
-        option_rects.clear()
-
-        def draw_button_text(text, font, color, rect):
-            lines = text.split('\n')
-            total_height = sum(font.size(line)[1] for line in lines)
-            y_offset = rect.centery - total_height // 2
-            for line in lines:
-                text_surface = font.render(line, True, color)
-                text_rect = text_surface.get_rect(center=(rect.centerx, y_offset + font.get_height() // 2))
-                screen.blit(text_surface, text_rect)
-                y_offset += font.get_height()
-
-        # Draw buttons with colors
-        pygame.draw.rect(screen, (70, 130, 180), speak_button)
-        draw_button_text("Speak\nWord", FONT_LARGE, WHITE, speak_button)
-
-        pygame.draw.rect(screen, (60, 179, 113), mic_button)
-        draw_button_text("Mic", FONT_LARGE, WHITE, mic_button)
-
-        pygame.draw.rect(screen, (255, 165, 0), help_button)
-        draw_button_text("Syllable", FONT_LARGE, BLACK, help_button)
-
-        pygame.draw.rect(screen, (138, 43, 226), ai_button)
-        draw_button_text("AI Assist", FONT_LARGE, WHITE, ai_button)
-
-        # --- Show message (correct/wrong feedback) at bottom ---
-        if message:
-            lines = message.split('\n')
-            for i, line in enumerate(lines):
-                draw_text(line, FONT_SMALL, message_color, WIDTH // 2, HEIGHT - 140 + (i * FONT_SMALL.get_height()))
-
-        button_width = 80  # Narrower
-        button_height = 40  # Taller
-        button_x = WIDTH - button_width - 10  # Keep them 10px from the right edge
-
-        speak_button = pygame.Rect(button_x, 10, button_width, button_height)
-        mic_button = pygame.Rect(button_x, 60, button_width, button_height)
-        help_button = pygame.Rect(button_x, 110, button_width, button_height)
-        ai_button = pygame.Rect(button_x, 160, button_width, button_height)
-
-        # --- AI Assist feedback display, applies to all levels ---
-        #if ai_user_said and (time.time() - ai_user_said_time < AI_FEEDBACK_DURATION):
-        #    popup_width = WIDTH - 120
-        #    popup_height = 40
-        #    popup_x = 60
-        #    popup_y = HEIGHT - popup_height - 185
-        #    pygame.draw.rect(screen, (255, 255, 230), (popup_x, popup_y, popup_width, popup_height))
-        #    draw_text(f'You said: "{ai_user_said}"', FONT_SMALL, (128, 0, 128), popup_x + 10, popup_y + popup_height // 2, center=False)
-            # if ai_feedback and (time.time() - ai_feedback_time) < AI_FEEDBACK_DURATION:
-            # popup_width = WIDTH - 120
-            # popup_height = 80
-            # popup_x = 60
-            # popup_y = HEIGHT - popup_height - 130
-            # pygame.draw.rect(screen, (240, 246, 255), (popup_x, popup_y, popup_width, popup_height))
-            # draw_text("AI Feedback:", FONT_SMALL, (70, 70, 70), popup_x + 10, popup_y + 18, center=False)
-            # draw_text(ai_feedback, FONT_HINT, get_feedback_color(ai_feedback), popup_x + 10, popup_y + popup_height // 2 + 5, center=False)
         if flash_index is not None:
-            current_time = pygame.time.get_ticks()
-            if current_time - flash_start_time > FLASH_DURATION:
+            flash_end = flash_start_time + FLASH_DURATION
+            if loop.expired(flash_end):
                 if flash_color == (0, 255, 0):
                     current_word_index += 1
                     progress[difficulty] = max(progress.get(difficulty, 0), current_word_index)
@@ -1233,21 +1090,86 @@ def main(difficulty):
                         current_options, option_rects = load_word(current_word_index)
                 flash_index = None
                 flash_color = None
-
-        pygame.display.flip()
+                loop.invalidate()
+            else:
+                loop.wake_at(flash_end)
+
+        if loop.needs_redraw():
+            FONT_LARGE, FONT_SMALL, FONT_HINT = get_fonts(HEIGHT)
+
+            button_width = 80  # Narrower
+            button_height = 40  # Taller
+            button_x = WIDTH - button_width - 10  # Keep them 10px from the right edge
+
+            speak_button = pygame.Rect(button_x, 10, button_width, button_height)
+            mic_button = pygame.Rect(button_x, 60, button_width, button_height)
+            help_button = pygame.Rect(button_x, 110, button_width, button_height)
+            ai_button = pygame.Rect(button_x, 160, button_width, button_height)
+
+            def draw_chrome(surface):
+                draw_gradient_background(surface, WIDTH, HEIGHT, (255, 255, 255), (216, 191, 216))
+                draw_text(f"Difficulty: {difficulty.capitalize()}", FONT_SMALL, BLACK, WIDTH // 2, 40, surface=surface)
+                pygame.draw.rect(surface, (128, 43, 226), back_button, border_radius=8)
+                draw_text("Back", FONT_LARGE, (255, 255, 255), back_button.centerx, back_button.centery, surface=surface)
+                if difficulty == "easy" or difficulty == "difficult":
+                    draw_text("Say it correctly. Press Mic to start:", FONT_SMALL, BLACK, WIDTH // 2, HEIGHT // 5, surface=surface)
+                else:
+                    draw_text("Choose the correct word:", FONT_SMALL, BLACK, WIDTH // 2, HEIGHT // 5, surface=surface)
+                draw_text(correct_word, FONT_LARGE, BLUE, WIDTH // 2, HEIGHT // 3, surface=surface)
+
+                # Draw buttons with colors
+                pygame.draw.rect(surface, (70, 130, 180), speak_button)
+                draw_button_text("Speak\nWord", FONT_LARGE, WHITE, speak_button, surface=surface)
+
+                pygame.draw.rect(surface, (60, 179, 113), mic_button)
+                draw_button_text("Mic", FONT_LARGE, WHITE, mic_button, surface=surface)
+
+                pygame.draw.rect(surface, (255, 165, 0), help_button)
+                draw_button_text("Syllable", FONT_LARGE, BLACK, help_button, surface=surface)
+
+                pygame.draw.rect(surface, (138, 43, 226), ai_button)
+                draw_button_text("AI Assist", FONT_LARGE, WHITE, ai_button, surface=surface)
+
+            # The chrome only changes with the word; everything else is a dynamic region
+            layers.begin(screen, correct_word, draw_chrome)
+            option_rects.clear()
+
+            # --- Show message (correct/wrong feedback) at bottom ---
+            line_height = FONT_SMALL.get_height()
+            layers.region(screen, (0, HEIGHT - 140 - line_height, WIDTH, line_height * 4))
+            if message:
+                lines = message.split('\n')
+                for i, line in enumerate(lines):
+                    draw_text(line, FONT_SMALL, message_color, WIDTH // 2, HEIGHT - 140 + (i * line_height))
+
+            # --- AI Assist feedback display, applies to all levels ---
+            #if ai_user_said and (time.time() - ai_user_said_time < AI_FEEDBACK_DURATION):
+            #    popup_width = WIDTH - 120
+            #    popup_height = 40
+            #    popup_x = 60
+            #    popup_y = HEIGHT - popup_height - 185
+            #    pygame.draw.rect(screen, (255, 255, 230), (popup_x, popup_y, popup_width, popup_height))
+            #    draw_text(f'You said: "{ai_user_said}"', FONT_SMALL, (128, 0, 128), popup_x + 10, popup_y + popup_height // 2, center=False)
+                # if ai_feedback and (time.time() - ai_feedback_time) < AI_FEEDBACK_DURATION:
+                # popup_width = WIDTH - 120
+                # popup_height = 80
+                # popup_x = 60
+                # popup_y = HEIGHT - popup_height - 130
+                # pygame.draw.rect(screen, (240, 246, 255), (popup_x, popup_y, popup_width, popup_height))
+                # draw_text("AI Feedback:", FONT_SMALL, (70, 70, 70), popup_x + 10, popup_y + 18, center=False)
+                # draw_text(ai_feedback, FONT_HINT, get_feedback_color(ai_feedback), popup_x + 10, popup_y + popup_height // 2 + 5, center=False)
+            loop.flip(layers)
 
         if show_congrats:
             pygame.time.delay(3000)
             play_bgm()
             running = False
 
-def draw_gradient_background(screen, width, height, top_color, bottom_color):
-    for y in range(height):
-        ratio = y / height
-        r = int(top_color[0] * (1 - ratio) + bottom_color[0] * ratio)
-        g = int(top_color[1] * (1 - ratio) + bottom_color[1] * ratio)
-        b = int(top_color[2] * (1 - ratio) + bottom_color[2] * ratio)
-        pygame.draw.line(screen, (r, g, b), (0, y), (width, y))
-
 if __name__ == "__main__":
+    if "--startup-report" in sys.argv:
+        startup.warm_up("report", lambda: print(startup.report()))
+    if "--prewarm-audio" in sys.argv:
+        count = audio.cache.prewarm(vocabulary_texts(words))
+        print(f"Synthesized {count} audio clips into {audio.cache.cache_dir}")
+        sys.exit(0)
     menu()
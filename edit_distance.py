@@ -0,0 +1,82 @@
+"""Levenshtein distance shared by the game and ProtoTest.
+
+Uses Myers' bit-parallel algorithm (Hyyrö's formulation for global distance):
+the query is encoded once as one bitmask per character, and each candidate is
+then scanned a character at a time with a handful of integer operations.
+Python ints are unbounded, so words of any length work.
+"""
+
+
+def _pattern(query):
+    peq = {}
+    for i, c in enumerate(query):
+        peq[c] = peq.get(c, 0) | (1 << i)
+    return peq
+
+
+def _myers(peq, m, text, max_distance):
+    mask = (1 << m) - 1
+    high = 1 << (m - 1)
+    pv = mask
+    mv = 0
+    score = m
+    remaining = len(text)
+    for c in text:
+        eq = peq.get(c, 0)
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = (mv | ~(xh | pv)) & mask
+        mh = pv & xh
+        if ph & high:
+            score += 1
+        elif mh & high:
+            score -= 1
+        ph = ((ph << 1) | 1) & mask
+        mh = (mh << 1) & mask
+        pv = (mh | ~(xv | ph)) & mask
+        mv = ph & xv
+        remaining -= 1
+        # The score can drop by at most one per character left to read.
+        if max_distance is not None and score - remaining > max_distance:
+            return max_distance + 1
+    return score
+
+
+class Query:
+    """A query string with its bitmasks precomputed, for scoring many candidates."""
+
+    __slots__ = ("text", "_peq", "_m")
+
+    def __init__(self, text):
+        self.text = text
+        self._peq = _pattern(text)
+        self._m = len(text)
+
+    def distance(self, candidate, max_distance=None):
+        """Distance to `candidate`; above `max_distance` it is reported as max_distance + 1."""
+        m = self._m
+        if max_distance is not None and abs(len(candidate) - m) > max_distance:
+            return max_distance + 1
+        if candidate == self.text:
+            return 0
+        if m == 0:
+            return len(candidate)
+        return _myers(self._peq, m, candidate, max_distance)
+
+    def distances(self, candidates, max_distance=None):
+        return [self.distance(c, max_distance) for c in candidates]
+
+
+def levenshtein_batch(query, candidates, max_distance=None):
+    """Distances from `query` to every candidate, in order.
+
+    With `max_distance`, any distance above the cutoff is reported as
+    ``max_distance + 1`` and the scan of that candidate stops as soon as the
+    cutoff can no longer be met.
+    """
+    return Query(query).distances(candidates, max_distance)
+
+
+def levenshtein(a, b, max_distance=None):
+    """Compute Levenshtein distance between two words."""
+    return Query(a).distance(b, max_distance)
@@ -0,0 +1,43 @@
+# === LOOKUP-TABLE INFERENCE ===
+# The classifier's inputs are (levenshtein, bigram_similarity): a small integer
+# and a ratio in [0, 1].  Its decision over a quantized grid of both is
+# precomputed, so the UI reads a label from a table instead of calling sklearn.
+LEV_MAX = 16               # larger distances share the last row
+BIGRAM_STEPS = 100         # bigram similarity is rounded to 1/BIGRAM_STEPS
+MIN_TRAINED_SAMPLES = 50   # below this the model is too raw to overrule the rules
+
+
+class FeedbackTable:
+    def __init__(self, model=None):
+        self._table = None
+        if model is not None:
+            self.refresh(model)
+
+    @property
+    def ready(self):
+        return self._table is not None
+
+    def refresh(self, model):
+        """Rebuild the table from `model`; safe to call from the trainer thread."""
+        # SGDClassifier.t_ is 1 + the number of samples it has been fitted on.
+        if getattr(model, "t_", 0) - 1 < MIN_TRAINED_SAMPLES:
+            return
+        import numpy as np  # only needed once there is a model, off the startup path
+        lev, bigram = np.meshgrid(np.arange(LEV_MAX + 1), np.arange(BIGRAM_STEPS + 1) / BIGRAM_STEPS,
+                                  indexing="ij")
+        grid = np.column_stack((lev.ravel(), bigram.ravel()))
+        try:
+            labels = model.predict(grid)
+        except Exception as e:
+            print(f"[ERROR] Failed to build feedback table: {e}")
+            return
+        # Swapped in with a single assignment so readers never see a partial table.
+        self._table = [list(row) for row in labels.reshape(LEV_MAX + 1, BIGRAM_STEPS + 1)]
+
+    def predict(self, lev, bigram):
+        """The model's label for these features, or None until the table is ready."""
+        table = self._table
+        if table is None:
+            return None
+        row = table[min(int(lev), LEV_MAX)]
+        return row[min(max(int(round(bigram * BIGRAM_STEPS)), 0), BIGRAM_STEPS)]
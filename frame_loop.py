@@ -0,0 +1,81 @@
+import pygame
+
+from render_cache import present
+
+# === FRAME PACING ===
+FPS_CAP = 30           # upper bound on redraws per second while something changes
+IDLE_WAKE_MS = 1000    # longest a static screen sleeps in pygame.event.wait
+
+
+class FrameLoop:
+    """Shared screen loop: caps the frame rate and sleeps while nothing changes.
+
+    A screen asks for events with ``events()`` and only redraws when
+    ``needs_redraw()`` is true.  Any input marks the screen dirty; timer-driven
+    changes (flash/feedback timeouts) are registered with ``wake_at``/``wake_in``
+    so the loop wakes exactly when they expire instead of spinning.
+    """
+
+    def __init__(self, fps=None):
+        self.fps = fps or FPS_CAP
+        self.clock = pygame.time.Clock()
+        self.dirty = True
+        self._deadlines = []
+
+    def invalidate(self):
+        self.dirty = True
+
+    def wake_at(self, ticks):
+        if ticks not in self._deadlines:
+            self._deadlines.append(ticks)
+
+    def wake_in(self, ms):
+        self.wake_at(pygame.time.get_ticks() + ms)
+
+    def expired(self, ticks):
+        """True once `ticks` has passed, by the same rule the loop wakes on."""
+        return ticks <= pygame.time.get_ticks()
+
+    def _expire_deadlines(self):
+        now = pygame.time.get_ticks()
+        if any(deadline <= now for deadline in self._deadlines):
+            self._deadlines = [d for d in self._deadlines if d > now]
+            self.dirty = True
+
+    def _wait_timeout(self):
+        if not self._deadlines:
+            return IDLE_WAKE_MS
+        remaining = min(self._deadlines) - pygame.time.get_ticks()
+        return min(IDLE_WAKE_MS, remaining)
+
+    def events(self):
+        self.clock.tick(self.fps)
+        # A deadline that passed during the last frame is due now; never hand
+        # pygame.event.wait a timeout of 0, which means "wait forever".
+        self._expire_deadlines()
+        if self.dirty:
+            events = pygame.event.get()
+        else:
+            timeout = self._wait_timeout()
+            if timeout <= 0:
+                events = pygame.event.get()
+                self.dirty = True
+            else:
+                first = pygame.event.wait(timeout)
+                events = [] if first.type == pygame.NOEVENT else [first]
+                events.extend(pygame.event.get())
+
+        self._expire_deadlines()
+        if events:
+            self.dirty = True
+        return events
+
+    def needs_redraw(self):
+        return self.dirty
+
+    def flip(self, layers=None):
+        if layers is not None:
+            layers.present()
+        else:
+            present()
+        self.dirty = False
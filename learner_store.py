@@ -0,0 +1,275 @@
+import csv
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import deque
+
+from persistence import BackgroundWriter
+
+# === LEARNER DATABASE (SQLite, WAL) ===
+# Words, every attempt with its transcript and scores, and progress, in indexed
+# tables.  The flat JSON/CSV files are imported once by migrate().
+DB_FILE = "lexisplay.db"
+DEFAULT_LEARNER = os.environ.get("LEXISPLAY_LEARNER", "default")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS words (
+    id INTEGER PRIMARY KEY,
+    difficulty TEXT NOT NULL,
+    word TEXT NOT NULL,
+    hint TEXT,
+    attempt_count INTEGER NOT NULL DEFAULT 0,
+    UNIQUE (difficulty, word)
+);
+CREATE TABLE IF NOT EXISTS attempts (
+    id INTEGER PRIMARY KEY,
+    word_id INTEGER NOT NULL REFERENCES words(id),
+    learner TEXT NOT NULL,
+    source TEXT NOT NULL,
+    transcript TEXT,
+    lev REAL,
+    bigram REAL,
+    label TEXT,
+    ts REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS words_by_word ON words (word);
+CREATE INDEX IF NOT EXISTS attempts_by_learner_ts ON attempts (learner, ts);
+CREATE INDEX IF NOT EXISTS attempts_by_word_ts ON attempts (word_id, ts);
+CREATE TABLE IF NOT EXISTS progress (
+    learner TEXT NOT NULL,
+    difficulty TEXT NOT NULL,
+    word_index INTEGER NOT NULL,
+    PRIMARY KEY (learner, difficulty)
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+# Kept as constants so sqlite3's per-connection statement cache reuses the
+# prepared statements instead of re-parsing them.
+SQL_ADD_WORD = "INSERT OR IGNORE INTO words (difficulty, word, hint) VALUES (?, ?, ?)"
+SQL_WORD_ID = "SELECT id FROM words WHERE difficulty = ? AND word = ?"
+SQL_INSERT_ATTEMPT = ("INSERT INTO attempts (word_id, learner, source, transcript, lev, bigram, label, ts) "
+                      "VALUES (?, ?, ?, ?, ?, ?, ?, ?)")
+SQL_BUMP_COUNT = "UPDATE words SET attempt_count = attempt_count + 1 WHERE id = ?"
+SQL_SET_COUNT = "UPDATE words SET attempt_count = ? WHERE difficulty = ? AND word = ?"
+SQL_RESET_COUNTS = "UPDATE words SET attempt_count = 0"
+SQL_COUNT_RANGE = "SELECT COUNT(*) FROM words WHERE difficulty = ? AND word >= ? AND word < ?"
+SQL_PAGE_RANGE = ("SELECT word, attempt_count FROM words WHERE difficulty = ? AND word >= ? AND word < ? "
+                  "ORDER BY word LIMIT ? OFFSET ?")
+SQL_SET_PROGRESS = ("INSERT INTO progress (learner, difficulty, word_index) VALUES (?, ?, ?) "
+                    "ON CONFLICT (learner, difficulty) DO UPDATE SET word_index = excluded.word_index")
+SQL_GET_PROGRESS = "SELECT difficulty, word_index FROM progress WHERE learner = ?"
+SQL_RESET_PROGRESS = "DELETE FROM progress WHERE learner = ?"
+SQL_MOST_FAILED = ("SELECT w.word, w.difficulty, COUNT(*) AS misses FROM attempts a JOIN words w ON w.id = a.word_id "
+                   "WHERE a.learner = ? AND a.ts >= ? AND a.label != 'correct' "
+                   "GROUP BY a.word_id ORDER BY misses DESC, w.word LIMIT ?")
+
+
+class LearnerStore(BackgroundWriter):
+    """One SQLite connection (WAL mode) shared by the game's screens.
+
+    Methods take a lock so the connection can be used from any thread, and
+    each write commits immediately; with WAL and synchronous=NORMAL a commit
+    does not wait for an fsync.  The UI doesn't call the write methods itself:
+    it ``submit()``s them to a writer thread, which runs them in order once
+    ``start()`` is called.  ``close()`` runs whatever is still queued.  The
+    database itself is opened on first use, normally by the writer's first job.
+    """
+
+    thread_name = "learner-db"
+
+    def __init__(self, path=DB_FILE, learner=DEFAULT_LEARNER):
+        super().__init__()
+        self.path = path
+        self.learner = learner
+        self._lock = threading.Lock()
+        self._word_ids = {}
+        self._jobs = deque()
+        self._busy = False
+        self._conn = None
+        self._open_lock = threading.Lock()
+
+    @property
+    def conn(self):
+        if self._conn is None:
+            with self._open_lock:
+                if self._conn is None:
+                    conn = sqlite3.connect(self.path, check_same_thread=False, cached_statements=64)
+                    conn.execute("PRAGMA journal_mode=WAL")
+                    conn.execute("PRAGMA synchronous=NORMAL")
+                    conn.executescript(SCHEMA)
+                    conn.commit()
+                    self._conn = conn
+        return self._conn
+
+    def close(self, timeout=10):
+        self.start()
+        super().close(timeout)
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    # --- writer thread ---
+    def submit(self, fn, *args, **kwargs):
+        """Queue fn(*args, **kwargs) for the writer thread; jobs run in submission order."""
+        with self._cond:
+            self._jobs.append((fn, args, kwargs))
+            self._cond.notify_all()
+
+    def pending(self):
+        """True while submitted jobs haven't all run yet."""
+        with self._cond:
+            return bool(self._jobs) or self._busy
+
+    def flush(self, timeout=None):
+        """Wait until every submitted job has run (the writer must be started)."""
+        with self._cond:
+            return self._cond.wait_for(lambda: not self._jobs and not self._busy, timeout)
+
+    def _take(self):
+        if not self._jobs:
+            return None, None
+        self._busy = True
+        return self._jobs.popleft(), None
+
+    def _process(self, job):
+        fn, args, kwargs = job
+        try:
+            fn(*args, **kwargs)
+        except Exception as e:
+            print(f"[ERROR] Learner database write failed: {e}")
+        finally:
+            with self._cond:
+                self._busy = False
+                self._cond.notify_all()
+
+    def _word_id(self, difficulty, word):
+        key = (difficulty, word)
+        word_id = self._word_ids.get(key)
+        if word_id is None:
+            row = self.conn.execute(SQL_WORD_ID, key).fetchone()
+            if row is None:
+                self.conn.execute(SQL_ADD_WORD, (difficulty, word, None))
+                row = self.conn.execute(SQL_WORD_ID, key).fetchone()
+            word_id = self._word_ids[key] = row[0]
+        return word_id
+
+    # --- words ---
+    def sync_words(self, words):
+        """Insert any entries of the game's words dict the database doesn't have yet."""
+        rows = [(difficulty, entry["word"], entry.get("hint")) for difficulty, entries in words.items()
+                for entry in entries]
+        with self._lock, self.conn:
+            self.conn.executemany(SQL_ADD_WORD, rows)
+
+    def add_word(self, difficulty, word, hint=None):
+        with self._lock, self.conn:
+            self.conn.execute(SQL_ADD_WORD, (difficulty, word, hint))
+
+    def count_words(self, difficulty, prefix=""):
+        with self._lock:
+            return self.conn.execute(SQL_COUNT_RANGE, (difficulty, prefix, prefix + "\U0010ffff")).fetchone()[0]
+
+    def word_page(self, difficulty, prefix="", offset=0, limit=50):
+        """[(word, attempt count)] for words starting with `prefix`, alphabetical, one page."""
+        with self._lock:
+            return self.conn.execute(SQL_PAGE_RANGE, (difficulty, prefix, prefix + "\U0010ffff",
+                                                      limit, offset)).fetchall()
+
+    # --- attempts ---
+    def record_attempt(self, difficulty, word, source, transcript=None, lev=None, bigram=None,
+                       label=None, ts=None, counted=True):
+        """Store one attempt; `counted` attempts also bump the word's attempt counter."""
+        with self._lock, self.conn:
+            word_id = self._word_id(difficulty, word)
+            self.conn.execute(SQL_INSERT_ATTEMPT, (word_id, self.learner, source, transcript, lev, bigram,
+                                                   label, time.time() if ts is None else ts))
+            if counted:
+                self.conn.execute(SQL_BUMP_COUNT, (word_id,))
+
+    def reset_attempt_counts(self):
+        """Zero the per-word counters; the attempt history itself is kept."""
+        with self._lock, self.conn:
+            self.conn.execute(SQL_RESET_COUNTS)
+
+    def most_failed(self, since, limit=10):
+        """[(word, difficulty, misses)] for this learner's non-correct attempts since `since`."""
+        with self._lock:
+            return self.conn.execute(SQL_MOST_FAILED, (self.learner, since, limit)).fetchall()
+
+    # --- progress ---
+    def save_progress(self, progress):
+        with self._lock, self.conn:
+            self.conn.executemany(SQL_SET_PROGRESS, [(self.learner, d, i) for d, i in progress.items()])
+
+    def load_progress(self):
+        with self._lock:
+            return dict(self.conn.execute(SQL_GET_PROGRESS, (self.learner,)).fetchall())
+
+    def reset_progress(self):
+        with self._lock, self.conn:
+            self.conn.execute(SQL_RESET_PROGRESS, (self.learner,))
+
+    # --- one-time import ---
+    def migrate(self, words_file=None, attempts_file=None, progress_file=None, training_logs=()):
+        """Import the legacy JSON/CSV files once; later calls are no-ops."""
+        with self._lock:
+            if self.conn.execute("SELECT 1 FROM meta WHERE key = 'migrated'").fetchone():
+                return False
+        words = _read_json(words_file)
+        attempts = _read_json(attempts_file)
+        progress = _read_json(progress_file)
+        with self._lock, self.conn:
+            if isinstance(words, dict):
+                self.conn.executemany(SQL_ADD_WORD, [(d, e["word"], e.get("hint"))
+                                                     for d, entries in words.items() for e in entries])
+            if isinstance(attempts, dict):
+                for difficulty, counts in attempts.items():
+                    for word in counts:
+                        self._word_id(difficulty, word)
+                    self.conn.executemany(SQL_SET_COUNT, [(n, difficulty, w) for w, n in counts.items()])
+            if isinstance(progress, dict):
+                self.conn.executemany(SQL_SET_PROGRESS, [(self.learner, d, i) for d, i in progress.items()])
+            for path in training_logs:
+                self._import_training_log(path)
+            self.conn.execute("INSERT INTO meta (key, value) VALUES ('migrated', ?)", (str(time.time()),))
+        return True
+
+    def _import_training_log(self, path):
+        # Logs carry no timestamps, difficulty or source; rows get the file's
+        # mtime, the difficulty the word is already filed under ("imported" if
+        # none) and the source "imported".
+        try:
+            f = open(path, "r", newline="")
+            ts = os.path.getmtime(path)
+        except OSError:
+            return
+        with f:
+            for row in csv.reader(f):
+                if len(row) < 5 or row[4] not in ("correct", "almost", "incorrect"):
+                    continue  # header or damaged line
+                user, correct, lev, bigram, label = row[:5]
+                found = self.conn.execute("SELECT difficulty FROM words WHERE word = ? LIMIT 1", (correct,)).fetchone()
+                word_id = self._word_id(found[0] if found else "imported", correct)
+                try:
+                    lev, bigram = float(lev), float(bigram)
+                except ValueError:
+                    continue
+                self.conn.execute(SQL_INSERT_ATTEMPT, (word_id, self.learner, "imported", user, lev, bigram, label, ts))
+
+
+def _read_json(path):
+    if not path or not os.path.exists(path):
+        return None
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"[ERROR] Failed to read {path}: {e}")
+        return None
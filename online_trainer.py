@@ -0,0 +1,97 @@
+import copy
+import threading
+import time
+
+from persistence import BackgroundWriter, atomic_write
+
+BATCH_SIZE = 8                 # samples per partial_fit call
+CHECKPOINT_EVERY = 32          # samples since the last checkpoint that force a save
+CHECKPOINT_INTERVAL = 30.0     # seconds an unsaved sample may wait before a save
+
+
+class OnlineTrainer(BackgroundWriter):
+    """Micro-batched partial_fit with model checkpoints on a background thread.
+
+    ``add()`` only appends to a buffer, so the UI never waits on training or
+    disk.  The trainer thread fits the buffer once BATCH_SIZE samples are
+    queued, and writes a checkpoint (temp file + atomic rename) after
+    CHECKPOINT_EVERY new samples or CHECKPOINT_INTERVAL seconds, whichever
+    comes first.  ``close()`` fits and saves whatever is left; call it on quit.
+    ``on_checkpoint(model)`` is called on the trainer thread with each saved
+    snapshot.
+    """
+
+    thread_name = "model-trainer"
+
+    def __init__(self, model, path, batch_size=BATCH_SIZE,
+                 checkpoint_every=CHECKPOINT_EVERY, checkpoint_interval=CHECKPOINT_INTERVAL,
+                 on_checkpoint=None):
+        super().__init__()
+        self.model = model
+        self.path = path
+        self.batch_size = batch_size
+        self.checkpoint_every = checkpoint_every
+        self.checkpoint_interval = checkpoint_interval
+        self.on_checkpoint = on_checkpoint
+        self.lock = threading.Lock()  # guards self.model
+        self._buffer = []
+        self._unsaved = 0
+        self._unsaved_since = None
+
+    def add(self, features, label):
+        with self._cond:
+            self._buffer.append((features, label))
+            self._unsaved += 1
+            if self._unsaved_since is None:
+                self._unsaved_since = time.monotonic()
+            self._cond.notify()
+        self.start()
+
+    def _fit(self, batch):
+        if not batch:
+            return
+        X = [features for features, _ in batch]
+        y = [label for _, label in batch]
+        try:
+            with self.lock:
+                self.model.partial_fit(X, y)
+        except Exception as e:
+            print(f"[ERROR] Model update failed: {e}")
+
+    def _checkpoint(self):
+        import joblib
+        with self.lock:
+            snapshot = copy.deepcopy(self.model)
+        try:
+            with atomic_write(self.path) as tmp_path:
+                joblib.dump(snapshot, tmp_path)
+        except Exception as e:
+            print(f"[ERROR] Failed to save {self.path}: {e}")
+        if self.on_checkpoint is not None:
+            self.on_checkpoint(snapshot)
+
+    def _take(self):
+        """The next (batch to fit, whether to checkpoint), or how long to wait for one."""
+        due = None
+        if self._unsaved_since is not None:
+            due = self._unsaved_since + self.checkpoint_interval
+        save = self._unsaved > 0 and (self._closing or self._unsaved >= self.checkpoint_every
+                                      or time.monotonic() >= due)
+        if save or len(self._buffer) >= self.batch_size:
+            batch = self._buffer
+            self._buffer = []
+            if save:
+                self._unsaved = 0
+                self._unsaved_since = None
+            return (batch, save), None
+        return None, None if due is None else max(0.0, due - time.monotonic())
+
+    def _process(self, work):
+        batch, save = work
+        self._fit(batch)
+        if save:
+            self._checkpoint()
+
+    def close(self, timeout=10):
+        """Fit the remaining samples, write the final checkpoint and stop the thread."""
+        super().close(timeout)
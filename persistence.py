@@ -0,0 +1,197 @@
+import copy
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+
+# === ATOMIC WRITES ===
+@contextmanager
+def atomic_write(path):
+    """Yield a temp path next to `path`; it replaces `path` when the block succeeds.
+
+    If the block raises, the temp file is removed and `path` is left as it was,
+    so a crash mid-write never leaves a truncated file behind.
+    """
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        yield tmp_path
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+# === BACKGROUND WRITER THREAD ===
+class BackgroundWriter:
+    """One daemon thread that takes work from state guarded by ``_cond``.
+
+    Subclasses implement ``_take()`` and ``_process(work)``.  ``_take()`` runs
+    with ``_cond`` held and returns ``(work, timeout)``: work for
+    ``_process()``, which runs outside the lock, or None to sleep until
+    notified (at most `timeout` seconds; None waits indefinitely).  After
+    ``close()`` the thread keeps taking work until there is none, then exits.
+    """
+
+    thread_name = "background-writer"
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._closing = False
+        self._thread = None
+
+    def start(self):
+        with self._cond:
+            if self._thread is None or not self._thread.is_alive():
+                self._closing = False
+                self._thread = threading.Thread(target=self._run, name=self.thread_name, daemon=True)
+                self._thread.start()
+
+    def _take(self):
+        raise NotImplementedError
+
+    def _process(self, work):
+        raise NotImplementedError
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while True:
+                    work, timeout = self._take()
+                    if work is not None or self._closing:
+                        break
+                    self._cond.wait(timeout)
+            if work is None:
+                return
+            self._process(work)
+
+    def close(self, timeout=10):
+        """Let the thread finish the remaining work, then stop it."""
+        with self._cond:
+            self._closing = True
+            self._cond.notify_all()
+            thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+
+
+# === WRITE-BEHIND JSON STORE ===
+FLUSH_DELAY = 0.5      # seconds of quiet after the last save before writing
+MAX_FLUSH_DELAY = 3.0  # a file that keeps changing is still written this often
+
+_DELETE = object()
+
+
+class JsonStore(BackgroundWriter):
+    """Owns a set of JSON files and writes them behind the UI's back.
+
+    ``save()`` snapshots the value and marks the file dirty; repeated saves
+    coalesce, and a background thread writes the latest snapshot once the file
+    has been quiet for FLUSH_DELAY (or dirty for MAX_FLUSH_DELAY).  Writes go to
+    a temp file that is renamed over the original, so a crash never leaves a
+    truncated file.  ``close()`` flushes everything; call it on exit.
+    """
+
+    thread_name = "json-store"
+
+    def __init__(self, delay=FLUSH_DELAY, max_delay=MAX_FLUSH_DELAY):
+        super().__init__()
+        self.delay = delay
+        self.max_delay = max_delay
+        self._values = {}       # path -> latest value (or _DELETE)
+        self._dirty = {}        # path -> (first dirty time, last save time, on_written)
+        self._writing = set()
+        self._flushing = 0
+
+    def load(self, path, default):
+        """The current value for `path` (unsaved changes included), or `default`."""
+        with self._cond:
+            value = self._values.get(path)
+        if value is None:
+            try:
+                with open(path, "r") as f:
+                    value = json.load(f)
+            except FileNotFoundError:
+                value = _DELETE
+            except (OSError, ValueError) as e:
+                print(f"[ERROR] Failed to read {path}: {e}")
+                value = _DELETE
+            with self._cond:
+                value = self._values.setdefault(path, value)
+        return copy.deepcopy(default if value is _DELETE else value)
+
+    def save(self, path, value, on_written=None):
+        self._mark(path, copy.deepcopy(value), on_written)
+
+    def delete(self, path, on_written=None):
+        self._mark(path, _DELETE, on_written)
+
+    def pending(self, path):
+        """True while `path` has changes that haven't reached the disk yet."""
+        with self._cond:
+            return path in self._dirty or path in self._writing
+
+    def _mark(self, path, value, on_written):
+        now = time.monotonic()
+        with self._cond:
+            self._values[path] = value
+            first = self._dirty[path][0] if path in self._dirty else now
+            self._dirty[path] = (first, now, on_written)
+            self._cond.notify()
+        self.start()
+
+    def _due(self, now):
+        due = []
+        next_deadline = None
+        for path, (first, last, _) in self._dirty.items():
+            deadline = min(last + self.delay, first + self.max_delay)
+            if self._closing or self._flushing or deadline <= now:
+                due.append(path)
+            elif next_deadline is None or deadline < next_deadline:
+                next_deadline = deadline
+        return due, next_deadline
+
+    def _write(self, path, value):
+        if value is _DELETE:
+            if os.path.exists(path):
+                os.remove(path)
+            return
+        with atomic_write(path) as tmp_path:
+            with open(tmp_path, "w") as f:
+                json.dump(value, f, indent=2)
+
+    def _take(self):
+        due, next_deadline = self._due(time.monotonic())
+        if not due:
+            return None, None if next_deadline is None else max(0.0, next_deadline - time.monotonic())
+        batch = []
+        for path in due:
+            _, _, on_written = self._dirty.pop(path)
+            self._writing.add(path)
+            batch.append((path, self._values[path], on_written))
+        return batch, None
+
+    def _process(self, batch):
+        for path, value, on_written in batch:
+            try:
+                self._write(path, value)
+                if on_written is not None:
+                    on_written()
+            except Exception as e:
+                print(f"[ERROR] Failed to save {path}: {e}")
+            finally:
+                with self._cond:
+                    self._writing.discard(path)
+                    self._cond.notify_all()
+
+    def flush(self, timeout=None):
+        """Write every dirty file now and wait until it is on disk."""
+        with self._cond:
+            self._flushing += 1
+            self._cond.notify_all()
+            try:
+                return self._cond.wait_for(lambda: not self._dirty and not self._writing, timeout)
+            finally:
+                self._flushing -= 1
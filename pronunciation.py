@@ -0,0 +1,201 @@
+import argparse
+import mmap
+import os
+import sys
+import threading
+from functools import lru_cache
+
+from persistence import atomic_write
+from syllables import phonetic_map
+
+# === PRONUNCIATION LEXICON ===
+# lexicon.tsv holds one "key<TAB>phonemes" line per word or syllable, sorted by
+# the UTF-8 bytes of the lowercase key.  It is memory-mapped and binary-searched,
+# so a full dictionary costs no parse at startup and only the pages a lookup
+# touches stay resident.  Phonemes are espeak mnemonics: espeak_input() wraps
+# them in [[...]] for the code paths that run the espeak command (the audio
+# cache and the espeak fallback engine).  Other engines (pyttsx3 on SAPI, or
+# libespeak without phoneme input) would read the markup aloud, so they get
+# the plain text.  The lexicon takes precedence over syllables.phonetic_map,
+# which only respells words the lexicon lacks.  No lexicon.tsv ships with the
+# game: until one is built (`python pronunciation.py build cmudict.dict`) every
+# lookup misses and phonetic_map is all that applies.
+LEXICON_FILE = "lexicon.tsv"
+MEMO_SIZE = 1024
+
+# CMUdict ARPAbet -> espeak phoneme mnemonics, for `build`.
+ARPABET_TO_ESPEAK = {
+    "AA": "A:", "AE": "a", "AH": "V", "AO": "O:", "AW": "aU", "AY": "aI", "EH": "E", "ER": "3:",
+    "EY": "eI", "IH": "I", "IY": "i:", "OW": "oU", "OY": "OI", "UH": "U", "UW": "u:",
+    "B": "b", "CH": "tS", "D": "d", "DH": "D", "F": "f", "G": "g", "HH": "h", "JH": "dZ",
+    "K": "k", "L": "l", "M": "m", "N": "n", "NG": "N", "P": "p", "R": "r", "S": "s",
+    "SH": "S", "T": "t", "TH": "T", "V": "v", "W": "w", "Y": "j", "Z": "z", "ZH": "Z",
+}
+UNSTRESSED = {"AH": "@", "ER": "3"}  # reduced vowels when the stress digit is 0
+STRESS_MARKS = {"1": "'", "2": ","}
+
+
+class Lexicon:
+    """Read-only view of a sorted lexicon file; lookups never parse the whole file."""
+
+    def __init__(self, path=LEXICON_FILE):
+        self.path = path
+        self._map = None
+        self._opened = False
+        self._lock = threading.Lock()
+        self.lookup = lru_cache(maxsize=MEMO_SIZE)(self._lookup)
+
+    def _mapped(self):
+        if not self._opened:
+            with self._lock:
+                if not self._opened:
+                    self._map = self._open()
+                    self._opened = True
+        return self._map
+
+    def _open(self):
+        try:
+            with open(self.path, "rb") as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return None
+                return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            print(f"[ERROR] Failed to open {self.path}: {e}")
+            return None
+
+    def close(self):
+        with self._lock:
+            if self._map is not None:
+                self._map.close()
+            self._map = None
+            self._opened = False
+        self.lookup.cache_clear()
+
+    def _lookup(self, text):
+        """Phonemes for `text` (case-insensitive), or None."""
+        mm = self._mapped()
+        if mm is None:
+            return None
+        key = text.strip().lower().encode("utf-8")
+        if not key:
+            return None
+        # Binary search over byte offsets; each probe backs up to the start of
+        # the line it landed in.  Only slicing/find are used, so lookups from
+        # the TTS thread and the UI thread don't share a file position.
+        lo, hi = 0, len(mm)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            start = mm.rfind(b"\n", 0, mid) + 1
+            end = mm.find(b"\n", start)
+            if end == -1:
+                end = len(mm)
+            tab = mm.find(b"\t", start, end)
+            line_key = mm[start:end if tab == -1 else tab]
+            if line_key == key:
+                return None if tab == -1 else mm[tab + 1:end].decode("utf-8").strip() or None
+            if line_key < key:
+                lo = end + 1
+            else:
+                hi = start
+        return None
+
+    def __contains__(self, text):
+        return self.lookup(text) is not None
+
+
+lexicon = Lexicon()
+
+
+def speakable(text):
+    """The plain text to hand the TTS layer for a word or syllable.
+
+    A word in the lexicon is passed on unchanged, so espeak_input() finds its
+    phonemes; otherwise phonetic_map's respelling (or the text itself) is used.
+    """
+    if text in lexicon:
+        return text
+    return phonetic_map.get(text.lower(), text)
+
+
+def espeak_input(text):
+    """What to pass the espeak command for `text`: lexicon phonemes as [[...]], else the text."""
+    phonemes = lexicon.lookup(text)
+    return text if phonemes is None else f"[[{phonemes}]]"
+
+
+# === BUILDING lexicon.tsv ===
+def arpabet_to_espeak(phones):
+    out = []
+    for phone in phones:
+        base, stress = phone.rstrip("012"), phone[len(phone.rstrip("012")):]
+        if base not in ARPABET_TO_ESPEAK:
+            raise ValueError(f"unknown phoneme {phone!r}")
+        if stress == "0" and base in UNSTRESSED:
+            out.append(UNSTRESSED[base])
+        else:
+            out.append(STRESS_MARKS.get(stress, "") + ARPABET_TO_ESPEAK[base])
+    return "".join(out)
+
+
+def iter_source(path):
+    """(key, espeak phonemes) from a CMUdict file or an existing key<TAB>phonemes file."""
+    with open(path, "r", encoding="utf-8", errors="replace") as f:
+        for line in f:
+            if not line.strip() or line.startswith(";;;") or line.startswith("#"):
+                continue
+            if "\t" in line:
+                key, phonemes = line.rstrip("\n").split("\t", 1)
+                yield key.strip().lower(), phonemes.strip()
+                continue
+            word, *phones = line.split("#", 1)[0].split()
+            if not phones:
+                continue
+            # Alternate pronunciations are "WORD(2)"; the first one wins.
+            if word.endswith(")") and "(" in word:
+                continue
+            try:
+                yield word.lower(), arpabet_to_espeak(phones)
+            except ValueError:
+                continue
+
+
+def build(sources, output=LEXICON_FILE):
+    """Merge `sources` (earlier files win) into a sorted lexicon file, atomically."""
+    entries = {}
+    for path in sources:
+        for key, phonemes in iter_source(path):
+            if key and phonemes and "\n" not in key:
+                entries.setdefault(key, phonemes)
+    with atomic_write(output) as tmp_path:
+        with open(tmp_path, "w", encoding="utf-8", newline="\n") as f:
+            for key in sorted(entries, key=lambda k: k.encode("utf-8")):
+                f.write(f"{key}\t{entries[key]}\n")
+    return len(entries)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build or query the pronunciation lexicon.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    build_cmd = sub.add_parser("build", help="build lexicon.tsv from CMUdict or key<TAB>phonemes files")
+    build_cmd.add_argument("sources", nargs="+", help="earlier files take precedence")
+    build_cmd.add_argument("-o", "--output", default=LEXICON_FILE)
+    lookup_cmd = sub.add_parser("lookup", help="print what espeak would be given for each text")
+    lookup_cmd.add_argument("texts", nargs="+")
+    lookup_cmd.add_argument("--lexicon", default=LEXICON_FILE)
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        count = build(args.sources, args.output)
+        print(f"Wrote {count} entries to {args.output}")
+    else:
+        global lexicon
+        lexicon = Lexicon(args.lexicon)
+        for text in args.texts:
+            print(f"{text}\t{espeak_input(speakable(text))}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,147 @@
+from collections import OrderedDict
+
+import numpy as np
+import pygame
+
+# === GRADIENT CACHE ===
+# Gradients are keyed by (size, top_color, bottom_color) and built once with
+# NumPy, so drawing a background is a single blit instead of one line per row.
+_gradient_cache = {}
+
+
+def _build_gradient(width, height, top_color, bottom_color):
+    ratio = (np.arange(height, dtype=np.float64) / height)[:, None]
+    top = np.asarray(top_color[:3], dtype=np.float64)
+    bottom = np.asarray(bottom_color[:3], dtype=np.float64)
+    column = (top * (1 - ratio) + bottom * ratio).astype(np.uint8)
+    pixels = np.broadcast_to(column[None, :, :], (width, height, 3))
+    surface = pygame.Surface((width, height))
+    pygame.surfarray.blit_array(surface, pixels)
+    if pygame.display.get_surface() is not None:
+        surface = surface.convert()
+    return surface
+
+
+def get_gradient(width, height, top_color, bottom_color):
+    key = ((width, height), tuple(top_color), tuple(bottom_color))
+    surface = _gradient_cache.get(key)
+    if surface is None:
+        surface = _build_gradient(width, height, top_color, bottom_color)
+        _gradient_cache[key] = surface
+    return surface
+
+
+def clear_gradient_cache():
+    """Drop cached gradients; call on VIDEORESIZE so stale sizes don't pile up."""
+    _gradient_cache.clear()
+
+
+def draw_gradient_background(screen, width, height, top_color, bottom_color):
+    if width <= 0 or height <= 0:
+        return
+    screen.blit(get_gradient(width, height, top_color, bottom_color), (0, 0))
+
+
+# === FONTS & TEXT ===
+# Fonts are created once per (name, size).  Rendered text surfaces live in an
+# LRU bounded by TEXT_CACHE_MAX_BYTES, so static labels cost a blit each frame.
+TEXT_CACHE_MAX_BYTES = 2 * 1024 * 1024
+
+_fonts = {}
+_text_cache = OrderedDict()
+_text_cache_bytes = 0
+
+
+def get_font(size, name=None):
+    key = (name, size)
+    font = _fonts.get(key)
+    if font is None:
+        font = pygame.font.Font(name, size)
+        _fonts[key] = font
+    return font
+
+
+def _surface_bytes(surface):
+    return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+
+def render_text(text, font, color, antialias=True):
+    global _text_cache_bytes
+    key = (text, font, tuple(color), antialias)
+    surface = _text_cache.get(key)
+    if surface is not None:
+        _text_cache.move_to_end(key)
+        return surface
+
+    surface = font.render(text, antialias, color)
+    _text_cache[key] = surface
+    _text_cache_bytes += _surface_bytes(surface)
+    while _text_cache_bytes > TEXT_CACHE_MAX_BYTES and len(_text_cache) > 1:
+        _, evicted = _text_cache.popitem(last=False)
+        _text_cache_bytes -= _surface_bytes(evicted)
+    return surface
+
+
+def set_text_cache_limit(max_bytes):
+    global TEXT_CACHE_MAX_BYTES, _text_cache_bytes
+    TEXT_CACHE_MAX_BYTES = max_bytes
+    while _text_cache_bytes > TEXT_CACHE_MAX_BYTES and _text_cache:
+        _, evicted = _text_cache.popitem(last=False)
+        _text_cache_bytes -= _surface_bytes(evicted)
+
+
+# === LAYERED COMPOSITING ===
+# A screen's static chrome (background, buttons, labels) is pre-rendered into a
+# layer once.  Each frame only the dynamic regions are restored from the layer,
+# redrawn, and pushed with pygame.display.update(rects).
+_display_owner = None
+
+
+def present(rects=None, owner=None):
+    """Push the frame to the display; a rect list means a partial update."""
+    global _display_owner
+    if rects is None:
+        pygame.display.flip()
+    else:
+        pygame.display.update(rects)
+    _display_owner = owner
+
+
+class LayeredScreen:
+    def __init__(self):
+        self._layer = None
+        self._key = None
+        self._rects = []
+        self._full = True
+
+    def invalidate(self):
+        self._layer = None
+
+    def begin(self, screen, key, draw_static):
+        """Start a frame; `draw_static(surface)` is called only when `key` changes."""
+        key = (screen.get_size(), key)
+        if self._layer is None or key != self._key:
+            layer = pygame.Surface(screen.get_size())
+            if pygame.display.get_surface() is not None:
+                layer = layer.convert()
+            draw_static(layer)
+            self._layer = layer
+            self._key = key
+            self._full = True
+        elif _display_owner is not self:
+            # Another screen or popup drew over the display since our last frame.
+            self._full = True
+        if self._full:
+            screen.blit(self._layer, (0, 0))
+
+    def region(self, screen, rect):
+        """Restore `rect` from the static layer and mark it for update."""
+        rect = pygame.Rect(rect).clip(screen.get_rect())
+        screen.blit(self._layer, rect, rect)
+        self._rects.append(rect)
+        return rect
+
+    def present(self):
+        present(None if self._full else self._rects, owner=self)
+        self._rects = []
+        self._full = False
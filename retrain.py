@@ -0,0 +1,168 @@
+import argparse
+import csv
+import itertools
+import os
+import sys
+import zlib
+
+import joblib
+import numpy as np
+from joblib import Parallel, delayed
+from sklearn.linear_model import SGDClassifier
+
+from persistence import atomic_write
+from training_log import CLASSES, TRAINING_LOG, compacted_segments, load_columns, rotated_segments
+
+# === OFFLINE RETRAINING ===
+# Streams any number of training_log.csv files (with the game's header or
+# ProtoTest's headerless rows, plus their rotated and compacted segments) in
+# chunks, refits the feedback classifier with partial_fit, and picks the best
+# hyperparameters from a parallel sweep.
+MODEL_FILE = "word_feedback_model.joblib"
+CHUNK_SIZE = 4096
+VALIDATION_BUCKETS = 10  # 1 in 10 (attempt, word) pairs is held out for scoring
+
+PARAM_GRID = {
+    "alpha": [1e-5, 1e-4, 1e-3],
+    "penalty": ["l2", "l1", "elasticnet"],
+}
+
+
+def _parse_row(row):
+    if len(row) < 5:
+        return None
+    user, correct, lev, bigram, label = row[:5]
+    if label not in CLASSES:
+        return None  # header row or damaged line
+    try:
+        return user, correct, float(lev), float(bigram), label
+    except ValueError:
+        return None
+
+
+def _is_validation(user, correct):
+    return zlib.crc32(f"{user}\0{correct}".encode("utf-8")) % VALIDATION_BUCKETS == 0
+
+
+def expand_logs(paths):
+    """Each log followed by its compacted and rotated segments (oldest data first)."""
+    expanded = []
+    for path in paths:
+        if path.endswith(".csv"):
+            expanded.extend(compacted_segments(path))
+            expanded.extend(rotated_segments(path))
+        expanded.append(path)
+    return expanded
+
+
+def _iter_columns(directory, chunk_size, split):
+    columns = load_columns(directory)
+    features = np.column_stack((columns["levenshtein"], columns["bigram_similarity"]))
+    labels = np.asarray(CLASSES)[columns["label"]]
+    if split is not None:
+        held_out = np.fromiter((_is_validation(u, c) for u, c in zip(columns["user_attempt"], columns["correct_word"])),
+                               dtype=bool, count=len(labels))
+        keep = held_out if split == "validation" else ~held_out
+        features, labels = features[keep], labels[keep]
+    for start in range(0, len(labels), chunk_size):
+        yield features[start:start + chunk_size].tolist(), labels[start:start + chunk_size].tolist()
+
+
+def iter_chunks(paths, chunk_size=CHUNK_SIZE, split=None):
+    """Yield (X, y) lists of at most chunk_size samples read lazily from `paths`.
+
+    Paths may be CSV logs or compacted column directories.  split is None for
+    every row, "train" or "validation" for that side of the hold-out.
+    """
+    X, y = [], []
+    for path in paths:
+        if os.path.isdir(path):
+            try:
+                yield from _iter_columns(path, chunk_size, split)
+            except (OSError, ValueError) as e:
+                print(f"[ERROR] Failed to read {path}: {e}")
+            continue
+        try:
+            f = open(path, "r", newline="")
+        except OSError as e:
+            print(f"[ERROR] Failed to read {path}: {e}")
+            continue
+        with f:
+            for row in csv.reader(f):
+                sample = _parse_row(row)
+                if sample is None:
+                    continue
+                user, correct, lev, bigram, label = sample
+                if split is not None and _is_validation(user, correct) != (split == "validation"):
+                    continue
+                X.append([lev, bigram])
+                y.append(label)
+                if len(X) >= chunk_size:
+                    yield X, y
+                    X, y = [], []
+    if X:
+        yield X, y
+
+
+def train_model(paths, params, epochs=1, chunk_size=CHUNK_SIZE, split="train"):
+    model = SGDClassifier(loss="log_loss", **params)
+    for _ in range(epochs):
+        for X, y in iter_chunks(paths, chunk_size, split):
+            model.partial_fit(X, y, classes=CLASSES)
+    return model
+
+
+def score_model(model, paths, chunk_size=CHUNK_SIZE, split="validation"):
+    """Accuracy over `split`; returns (accuracy, sample count)."""
+    correct = total = 0
+    for X, y in iter_chunks(paths, chunk_size, split):
+        predicted = model.predict(X)
+        correct += sum(p == t for p, t in zip(predicted, y))
+        total += len(y)
+    return (correct / total if total else 0.0), total
+
+
+def _evaluate(paths, params, epochs, chunk_size):
+    model = train_model(paths, params, epochs, chunk_size)
+    if not hasattr(model, "coef_"):
+        return None
+    accuracy, _ = score_model(model, paths, chunk_size)
+    return accuracy, params
+
+
+def save_model(model, path):
+    with atomic_write(path) as tmp_path:
+        joblib.dump(model, tmp_path)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Retrain the word feedback model from training logs.")
+    parser.add_argument("logs", nargs="*", default=[TRAINING_LOG])
+    parser.add_argument("--output", default=MODEL_FILE)
+    parser.add_argument("--epochs", type=int, default=5)
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+    parser.add_argument("--jobs", type=int, default=-1, help="parallel sweep workers (-1 = all cores)")
+    args = parser.parse_args(argv)
+    args.logs = expand_logs(args.logs)
+
+    grid = [dict(zip(PARAM_GRID, values)) for values in itertools.product(*PARAM_GRID.values())]
+    results = Parallel(n_jobs=args.jobs)(
+        delayed(_evaluate)(args.logs, params, args.epochs, args.chunk_size) for params in grid)
+    results = [r for r in results if r is not None]
+    if not results:
+        print("[ERROR] No usable training rows found.")
+        return 1
+
+    for accuracy, params in sorted(results, key=lambda r: -r[0]):
+        print(f"{accuracy:.4f}  {params}")
+    accuracy, params = max(results, key=lambda r: r[0])
+
+    # Refit the winner on every row so the held-out pairs aren't wasted.
+    model = train_model(args.logs, params, args.epochs, args.chunk_size, split=None)
+    save_model(model, args.output)
+    print(f"Saved {args.output} (validation accuracy {accuracy:.4f}, {params})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,322 @@
+import json
+import os
+import queue
+import hashlib
+import socket
+import tempfile
+import threading
+import time
+
+import pygame
+
+from persistence import atomic_write
+
+# Posted to the pygame queue when a recognition request finishes.
+# Attributes: text, alternatives (n-best transcripts, best first), tag, request_id.
+SPEECH_RESULT = pygame.event.custom_type()
+
+NO_SPEECH = "Nothing / No speech detected."
+NOT_UNDERSTOOD = "A thing that audio can't understand."
+SERVICE_UNAVAILABLE = "Speech service unavailable. Please check your connection."
+
+# === MIC CALIBRATION ===
+CALIBRATION_FILE = "mic_calibration.json"
+CALIBRATION_SECONDS = 1.0   # first calibration of a session without a saved profile
+ADAPT_SECONDS = 0.5         # short re-adjustment run by the worker between attempts
+ADAPT_SETTLE_SECONDS = 0.25 # lets the UI queue its feedback audio before the worker re-adjusts
+SAVE_MIN_CHANGE = 0.1       # relative threshold drift worth rewriting the saved profile for
+CALIBRATION_KEYS = ("energy_threshold", "dynamic_energy_threshold",
+                    "dynamic_energy_adjustment_damping", "dynamic_energy_ratio")
+
+
+# === RECOGNIZER BACKEND ===
+# "google" needs the network; "sphinx" (PocketSphinx) and "vosk" run offline with
+# their decoding grammar restricted to the active vocabulary.
+SPEECH_BACKEND = os.environ.get("LEXISPLAY_SPEECH_BACKEND", "google")
+VOSK_MODEL_PATH = os.environ.get("LEXISPLAY_VOSK_MODEL", "model")
+
+
+def vocabulary_with_confusions(words):
+    """The active words plus the near-misses learners commonly produce (plural/singular)."""
+    vocabulary = set()
+    for word in words:
+        word = word.strip().lower()
+        if not word:
+            continue
+        vocabulary.add(word)
+        if not word.endswith("s"):
+            vocabulary.add(word + "s")
+        elif len(word) > 3:
+            vocabulary.add(word[:-1])
+    return sorted(vocabulary)
+
+
+def _sr():
+    # Imported on first use so speech_recognition stays off the startup path.
+    import speech_recognition
+    return speech_recognition
+
+
+class Cancelled(Exception):
+    pass
+
+
+class Listener:
+    """Microphone capture + recognition with a persistent noise calibration.
+
+    The ambient-noise calibration is done once per session (or loaded from
+    CALIBRATION_FILE for this device/profile), so a press starts listening
+    immediately.  ``adapt()`` is run by the worker between attempts and keeps
+    the energy threshold tracking the room; the profile is saved back to disk
+    when the threshold has drifted by more than SAVE_MIN_CHANGE.  Calibration
+    waits for ``before_listen`` like a capture does, and a reading taken while
+    ``audio_activity()`` changed (the game scheduled sound) is thrown away.
+    """
+
+    def __init__(self, profile=None, device_index=None, path=None, backend=None, before_listen=None,
+                 audio_activity=None):
+        self._recognizer = None
+        self._recognizer_lock = threading.Lock()
+        self._saved_threshold = None
+        self.before_listen = before_listen
+        self.audio_activity = audio_activity
+        self.backend = backend or SPEECH_BACKEND
+        self.vocabulary = ()
+        self._grammar_file = None
+        self._vosk_model = None
+        self.device_index = device_index
+        self.profile = profile or f"{socket.gethostname()}:{device_index if device_index is not None else 'default'}"
+        self.path = path or CALIBRATION_FILE
+        self.calibrated = False
+
+    @property
+    def recognizer(self):
+        """The sr.Recognizer, created (and its saved calibration applied) on first use."""
+        # Read by the warm-up thread and the worker thread; only one may create it.
+        if self._recognizer is None:
+            with self._recognizer_lock:
+                if self._recognizer is None:
+                    recognizer = _sr().Recognizer()
+                    self.calibrated = self._load_profile(recognizer)
+                    self._recognizer = recognizer
+        return self._recognizer
+
+    def _load_profile(self, recognizer):
+        try:
+            with open(self.path, "r") as f:
+                saved = json.load(f).get(self.profile)
+        except (OSError, ValueError):
+            return False
+        if not saved:
+            return False
+        for key in CALIBRATION_KEYS:
+            if key in saved:
+                setattr(recognizer, key, saved[key])
+        self._saved_threshold = recognizer.energy_threshold
+        return True
+
+    def _save_profile(self):
+        try:
+            with open(self.path, "r") as f:
+                profiles = json.load(f)
+        except (OSError, ValueError):
+            profiles = {}
+        entry = {key: getattr(self.recognizer, key) for key in CALIBRATION_KEYS}
+        entry["updated"] = time.time()
+        profiles[self.profile] = entry
+        try:
+            with atomic_write(self.path) as tmp_path:
+                with open(tmp_path, "w") as f:
+                    json.dump(profiles, f, indent=2)
+        except OSError as e:
+            print(f"[ERROR] Failed to save {self.path}: {e}")
+            return
+        self._saved_threshold = entry["energy_threshold"]
+
+    def set_vocabulary(self, words):
+        """Restrict offline decoding to `words` (plus common confusions)."""
+        self.vocabulary = tuple(vocabulary_with_confusions(words))
+        self._grammar_file = None
+
+    def _sphinx_grammar(self):
+        # recognize_sphinx caches a compiled .fsg next to the grammar, so each
+        # vocabulary gets its own content-addressed file.
+        if self._grammar_file is None:
+            digest = hashlib.sha1("\n".join(self.vocabulary).encode("utf-8")).hexdigest()[:12]
+            path = os.path.join(tempfile.gettempdir(), f"lexisplay_{digest}.gram")
+            if not os.path.exists(path):
+                with open(path, "w") as f:
+                    f.write("#JSGF V1.0;\ngrammar words;\npublic <word> = ")
+                    f.write(" | ".join(self.vocabulary))
+                    f.write(" ;\n")
+            self._grammar_file = path
+        return self._grammar_file
+
+    def _recognize_vosk(self, audio):
+        sr = _sr()
+        try:
+            from vosk import Model, KaldiRecognizer
+        except ImportError:
+            raise sr.RequestError("missing vosk module: ensure that vosk is set up correctly.")
+        if self._vosk_model is None:
+            self._vosk_model = Model(VOSK_MODEL_PATH)
+        grammar = json.dumps(list(self.vocabulary) + ["[unk]"]) if self.vocabulary else None
+        decoder = KaldiRecognizer(self._vosk_model, 16000, grammar) if grammar else KaldiRecognizer(self._vosk_model, 16000)
+        decoder.AcceptWaveform(audio.get_raw_data(convert_rate=16000, convert_width=2))
+        text = json.loads(decoder.FinalResult()).get("text", "").replace("[unk]", "").strip()
+        if not text:
+            raise sr.UnknownValueError()
+        return text
+
+    def decode(self, audio):
+        """Return the recognizer's hypotheses for `audio`, best first."""
+        sr = _sr()
+        if self.backend == "sphinx":
+            if self.vocabulary:
+                return [self.recognizer.recognize_sphinx(audio, grammar=self._sphinx_grammar())]
+            return [self.recognizer.recognize_sphinx(audio)]
+        if self.backend == "vosk":
+            return [self._recognize_vosk(audio)]
+        result = self.recognizer.recognize_google(audio, show_all=True)
+        alternatives = [alt["transcript"] for alt in (result or {}).get("alternative", []) if alt.get("transcript")]
+        if not alternatives:
+            raise sr.UnknownValueError()
+        return alternatives
+
+    def adapt(self):
+        """Calibrate (first run) or nudge the threshold towards the current room noise."""
+        sr = _sr()
+        recognizer = self.recognizer
+        duration = ADAPT_SECONDS if self.calibrated else CALIBRATION_SECONDS
+        # Only measure silence: the game's own sounds and speech would raise the threshold.
+        if self.before_listen is not None and self.before_listen() is False:
+            return
+        mark = self.audio_activity() if self.audio_activity is not None else None
+        previous = recognizer.energy_threshold
+        try:
+            with sr.Microphone(device_index=self.device_index) as source:
+                recognizer.adjust_for_ambient_noise(source, duration=duration)
+        except (OSError, AttributeError) as e:
+            print(f"[ERROR] Microphone calibration failed: {e}")
+            return
+        if mark is not None and self.audio_activity() != mark:
+            recognizer.energy_threshold = previous
+            return
+        self.calibrated = True
+        saved = self._saved_threshold
+        if not saved or abs(recognizer.energy_threshold - saved) > SAVE_MIN_CHANGE * saved:
+            self._save_profile()
+
+    def __call__(self, cancelled=lambda: False):
+        """Blocking capture + recognition; runs on the worker thread.
+
+        Returns the n-best transcripts, or one of the message constants.
+        """
+        sr = _sr()
+        recognizer = self.recognizer
+        if not self.calibrated:
+            self.adapt()
+        if self.before_listen is not None:
+            # e.g. let the TTS finish so the prompt isn't captured as speech
+            self.before_listen()
+        if cancelled():
+            raise Cancelled()
+        with sr.Microphone(device_index=self.device_index) as source:
+            try:
+                audio = recognizer.listen(source, timeout=5, phrase_time_limit=5)
+            except sr.WaitTimeoutError:
+                return NO_SPEECH
+        if cancelled():
+            raise Cancelled()
+        try:
+            return [text.strip().lower() for text in self.decode(audio)]
+        except sr.UnknownValueError:
+            return NOT_UNDERSTOOD
+        except sr.RequestError as e:
+            print(f"RequestError: {e}")
+            return SERVICE_UNAVAILABLE
+
+
+class SpeechWorker:
+    """Runs speech recognition off the UI thread, one request at a time.
+
+    ``request(tag)`` returns immediately; the result is posted as a
+    SPEECH_RESULT event carrying the same tag.  The recognizer may return a
+    single string or a list of alternatives, best first.  ``cancel()`` drops every
+    pending request: a capture already in progress is abandoned at the next
+    checkpoint and its result is never posted.  Between requests the worker
+    calls the recognizer's ``adapt()`` (if it has one) to keep calibration fresh.
+    """
+
+    def __init__(self, recognize=None):
+        self._recognize = recognize if recognize is not None else Listener()
+        self._adapt = getattr(self._recognize, "adapt", None)
+        self._requests = queue.Queue()
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._next_id = 0
+        self._pending = 0
+        self._thread = None
+
+    @property
+    def pending(self):
+        return self._pending > 0
+
+    def request(self, tag=None):
+        with self._lock:
+            self._next_id += 1
+            request_id = self._next_id
+            self._pending += 1
+            generation = self._generation
+        self.start()
+        self._requests.put((request_id, generation, tag))
+        return request_id
+
+    def start(self):
+        """Start the worker thread early so calibration happens before the first press."""
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="speech-worker", daemon=True)
+            self._thread.start()
+
+    def cancel(self):
+        with self._lock:
+            self._generation += 1
+            self._pending = 0
+
+    def _is_stale(self, generation):
+        return generation != self._generation
+
+    def _adapt_if_idle(self, settle=0.0):
+        if self._adapt is None:
+            return
+        if settle:
+            # Give the UI time to react to the result before measuring the room.
+            time.sleep(settle)
+        if not self._requests.empty():
+            return
+        try:
+            self._adapt()
+        except Exception as e:
+            print(f"[ERROR] Microphone calibration failed: {e}")
+
+    def _run(self):
+        self._adapt_if_idle()
+        while True:
+            request_id, generation, tag = self._requests.get()
+            if self._is_stale(generation):
+                continue
+            try:
+                result = self._recognize(lambda: self._is_stale(generation))
+            except Cancelled:
+                continue
+            except Exception as e:
+                print(f"[ERROR] Speech recognition failed: {e}")
+                result = NOT_UNDERSTOOD
+            alternatives = [result] if isinstance(result, str) else list(result) or [NOT_UNDERSTOOD]
+            with self._lock:
+                if self._is_stale(generation):
+                    continue
+                self._pending -= 1
+            pygame.event.post(pygame.event.Event(SPEECH_RESULT, text=alternatives[0], alternatives=alternatives,
+                                                 tag=tag, request_id=request_id))
+            self._adapt_if_idle(ADAPT_SETTLE_SECONDS)
@@ -0,0 +1,65 @@
+import threading
+import time
+from contextlib import contextmanager
+
+# === STARTUP PROFILING + WARM-UP ===
+# Heavy subsystems (sklearn, speech_recognition, sounds, ...) are registered as
+# warm-up tasks and initialized on a background thread once the first frame is
+# on screen.  Every step is timed so report() can show where startup goes.
+_started = time.perf_counter()
+_timings = []           # (name, seconds, where)
+_tasks = []             # (name, fn) in registration order
+_lock = threading.Lock()
+_thread = None
+_first_frame = None
+
+
+@contextmanager
+def timed(name, where="main"):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        with _lock:
+            _timings.append((name, time.perf_counter() - start, where))
+
+
+def warm_up(name, fn):
+    """Register `fn` to run on the warm-up thread, in registration order."""
+    with _lock:
+        _tasks.append((name, fn))
+
+
+def _run_tasks():
+    while True:
+        with _lock:
+            if not _tasks:
+                return
+            name, fn = _tasks.pop(0)
+        try:
+            with timed(name, "warm-up"):
+                fn()
+        except Exception as e:
+            print(f"[ERROR] Warm-up of {name} failed: {e}")
+
+
+def first_frame_shown():
+    """Called once the first frame is presented; starts the warm-up thread."""
+    global _thread, _first_frame
+    if _first_frame is None:
+        _first_frame = time.perf_counter() - _started
+    if _thread is None:
+        _thread = threading.Thread(target=_run_tasks, name="warm-up", daemon=True)
+        _thread.start()
+
+
+def report():
+    """Per-subsystem startup cost, one line each."""
+    with _lock:
+        timings = list(_timings)
+    lines = ["Startup time by subsystem:"]
+    for name, seconds, where in timings:
+        lines.append(f"  {name:<24} {seconds * 1000:8.1f} ms  ({where})")
+    if _first_frame is not None:
+        lines.append(f"  {'first frame':<24} {_first_frame * 1000:8.1f} ms  (since start)")
+    return "\n".join(lines)
@@ -0,0 +1,278 @@
+from functools import lru_cache
+
+# === SYLLABIFICATION ===
+# Words in SYLLABLE_EXCEPTIONS keep their hand-written (phonetic) splits.  Any
+# other word is hyphenated with Liang's algorithm: every pattern that matches
+# inside ".word." votes a number between two letters, the highest vote wins, and
+# odd numbers mark a syllable break.  The patterns live in one trie built once.
+MEMO_SIZE = 4096
+VOWELS = "aeiouy"
+CONSONANTS = "bcdfghjklmnpqrstvwxz"
+LEFT_MIN = 1   # fewest letters a syllable break may leave before/after it
+RIGHT_MIN = 1
+
+SYLLABLE_EXCEPTIONS = {
+    "apple": ["app", "poll"],
+    "candle": ["can", "dell"],
+    "button": ["but", "ton"],
+    "sunset": ["sun", "set"],
+    "pencil": ["pen", "seal"],
+    "flower": ["flah", "where"],
+    "window": ["win", "dow"],
+    "rabbit": ["rab", "bit"],
+    "jelly": ["jell", "e"],
+    "cookie": ["cook", "key"],
+    "dollar": ["doll", "lar"],
+    "tiger": ["tie", "gurr"],
+    "butter": ["but", "ter"],
+    "ladder": ["lad", "der"],
+    "hammer": ["ham", "mer"],
+    "doctor": ["doc", "tor"],
+    "kitten": ["kit", "ten"],
+    "monkey": ["mon", "key"],
+    "paper": ["pay", "purr"],
+    "rocket": ["rock", "et"],
+    "puppy": ["puppy"],
+    "yellow": ["yel", "low"],
+    "mirror": ["mir", "ror"],
+    "garden": ["gar", "den"],
+    "honey": ["hon", "e"],
+    "jacket": ["jack", "et"],
+    "lion": ["lie", "on"],
+    "magic": ["ma", "jeek"],
+    "napkin": ["nap", "kin"],
+    "ocean": ["o", "cean"],
+    "pillow": ["pil", "low"],
+    "rainbow": ["rain", "baw"],
+    "supper": ["sup", "per"],
+    "table": ["tay", "ball"],
+    "under": ["un", "der"],
+    "zebra": ["ze", "bra"],
+    "bottle": ["bot", "tle"],
+    "basket": ["bas", "ket"],
+    "cactus": ["cac", "tus"],
+    "carpet": ["car", "pet"],
+    "closet": ["claw", "seth"],
+    "crayon": ["cray", "on"],
+    "dentist": ["den", "tist"],
+    "dragon": ["drag", "gon"],
+    "eagle": ["e", "gehl"],
+    "engine": ["ehn", "gine"],
+    "feather": ["feath", "there"],
+    "helmet": ["hel", "met"],
+    "jungle": ["john", "gehll"],
+    "spider": ["spy", "der"],
+    "cat": ["cat"],
+    "dog": ["dog"],
+    "sun": ["sun"],
+    "first": ["first"],
+    "box": ["box"],
+    "red": ["red"],
+    "blue": ["blue"],
+    "rush": ["rush"],
+    "jump": ["jump"],
+    "site": ["site"],
+    "bed": ["bed"],
+    "car": ["car"],
+    "ball": ["ball"],
+    "milk": ["milk"],
+    "fish": ["fish"],
+    "bird": ["bird"],
+    "tree": ["tree"],
+    "leaf": ["leaf"],
+    "cup": ["cup"],
+    "hat": ["hat"],
+    "shoe": ["shoe"],
+    "bag": ["bag"],
+    "door": ["door"],
+    "clock": ["clock"],
+    "frog": ["frog"],
+    "star": ["star"],
+    "rain": ["rain"],
+    "snow": ["snow"],
+    "wind": ["wind"],
+    "fire": ["fire"],
+    "egg": ["egg"],
+    "fork": ["fork"],
+    "spoon": ["spoon"],
+    "plate": ["plate"],
+    "glass": ["glass"],
+    "nose": ["nose"],
+    "hand": ["hand"],
+    "leg": ["leg"],
+    "eye": ["eye"],
+    "ear": ["ear"],
+    "top": ["top"],
+    "set": ["set"],
+    "zip": ["zip"],
+    "sow": ["sow"],
+    "cow": ["cow"],
+    "beast": ["beast"],
+    "bus": ["bus"],
+    "ship": ["ship"],
+    "moon": ["moon"],
+    "sky": ["sky"],
+
+    # Manual exceptions from your current code
+    "mouse": ["mouse"],
+    "scissor": ["sci", "ssor"],
+    "chocolate": ["choc", "o", "late"],
+    "butterfly": ["but", "ter", "fly"]
+}
+
+
+
+def _english_patterns():
+    """A small Liang-style pattern set for the game's vocabulary, in TeX notation."""
+    patterns = []
+    # V-CV: ti-ger, pa-per (an open first syllable).
+    for c in CONSONANTS:
+        for v in VOWELS:
+            patterns.append(f"1{c}{v}")
+    # VC-CV: rab-bit, nap-kin, win-dow.
+    for c1 in CONSONANTS:
+        for c2 in CONSONANTS:
+            patterns.append(f"{c1}1{c2}")
+    # Consonant pairs that stay together (digraphs, blends).
+    patterns += ["1c2h", "1s2h", "1t2h", "1p2h", "1w2h", "g2h", "c2k", "q2u", "n2g.", "n2k",
+                 "1b2l", "1c2l", "1f2l", "1g2l", "1p2l",
+                 "1b2r", "1c2r", "1d2r", "1f2r", "1g2r", "1p2r", "1t2r",
+                 "1s2t", "1s2p", "1s2c", "1s2k", "1t2w"]
+    # Final consonant + "le" is its own syllable: ta-ble, can-dle, tick-le.
+    patterns += [f"1{c}le." for c in CONSONANTS if c != "l"] + ["ck3le."]
+    # Silent final "e" and "-ed"/"-es" after most consonants add no syllable: plate, jumped.
+    for c in CONSONANTS:
+        patterns.append(f"2{c}e.")
+        if c not in "td":
+            patterns.append(f"2{c}ed.")
+        if c not in "sxzcg":
+            patterns.append(f"2{c}es.")
+    # "-ing" after a vowel is its own syllable (go-ing, see-ing, play-ing); after a
+    # single consonant it takes none of it (cook-ing, read-ing).
+    for v in VOWELS:
+        patterns.append(f"{v}1ing.")
+        for c in CONSONANTS:
+            patterns.append(f"{v}2{c}1ing.")
+    # Vowel pairs that are usually two syllables (hiatus): li-on, pi-a-no,
+    # cre-ate, qui-et, sci-ence, po-em, flu-id, vi-de-o.
+    patterns += ["i1o", "i1a", "u1a", "e1o", "i1u", "e1ate.", "i1et", "i1enc", "i1al", "u1al",
+                 "u1id", "o1em", "o1et", "e1um", "y1er."]
+    # ...except in -tion/-sion/-cian/-cial endings, which are one syllable.
+    patterns += ["ti2o", "si2o", "ci2o", "ti2a", "ci2a", "xi2o"]
+    return patterns
+
+
+class Syllabifier:
+    """Splits words into syllables: exceptions first, then hyphenation patterns.
+
+    The exceptions table and the pattern trie are built once; results are kept
+    in an LRU memo, so repeated words (every word load, hint and add-word) cost
+    a dictionary lookup.
+    """
+
+    def __init__(self, exceptions=SYLLABLE_EXCEPTIONS, patterns=None, memo_size=MEMO_SIZE):
+        self.exceptions = {word.lower(): tuple(sylls) for word, sylls in exceptions.items()}
+        self.trie = {}
+        for pattern in _english_patterns() if patterns is None else patterns:
+            self._insert(pattern)
+        self._split_cached = lru_cache(maxsize=memo_size)(self._split)
+
+    def _insert(self, pattern):
+        letters = "".join(ch for ch in pattern if not ch.isdigit())
+        points = [0] * (len(letters) + 1)
+        i = 0
+        for ch in pattern:
+            if ch.isdigit():
+                points[i] = int(ch)
+            else:
+                i += 1
+        node = self.trie
+        for ch in letters:
+            node = node.setdefault(ch, {})
+        node[None] = points
+
+    def hyphenate(self, word):
+        """Break positions (indexes into `word`) chosen by the patterns alone."""
+        lower = word.lower()
+        padded = f".{lower}."
+        points = [0] * (len(padded) + 1)
+        trie = self.trie
+        for i in range(len(padded)):
+            node = trie
+            for ch in padded[i:]:
+                node = node.get(ch)
+                if node is None:
+                    break
+                found = node.get(None)
+                if found is not None:
+                    for j, value in enumerate(found):
+                        if value > points[i + j]:
+                            points[i + j] = value
+        # points[k + 1] is the vote between lower[k - 1] and lower[k].
+        return [k for k in range(LEFT_MIN, len(lower) - RIGHT_MIN + 1) if points[k + 1] % 2]
+
+    def _split(self, word):
+        found = self.exceptions.get(word.lower())
+        if found is not None:
+            return found
+        syllables = []
+        start = 0
+        for k in self.hyphenate(word) + [len(word)]:
+            piece = word[start:k]
+            # A piece without a vowel can't be a syllable; fold it into its neighbour.
+            if syllables and not any(ch in VOWELS for ch in piece.lower()):
+                syllables[-1] += piece
+            elif syllables and not any(ch in VOWELS for ch in syllables[-1].lower()):
+                syllables[-1] += piece
+            else:
+                syllables.append(piece)
+            start = k
+        return tuple(syllables) if syllables else (word,)
+
+    def split(self, word):
+        return list(self._split_cached(word))
+
+    def split_many(self, words):
+        """{word: syllables} for a whole vocabulary; duplicates are split once.
+
+        Bypasses the memo so a bulk run doesn't evict the words the game is using.
+        """
+        split = self._split
+        return {word: list(split(word)) for word in dict.fromkeys(words)}
+
+    def cache_info(self):
+        return self._split_cached.cache_info()
+
+
+syllabifier = Syllabifier()
+
+
+def split_syllables(word):
+    return syllabifier.split(word)
+
+
+def split_many(words):
+    return syllabifier.split_many(words)
+
+phonetic_map = {
+    "apple": "apple", "candle": "candle", "button": "button", "sunset": "sunset", "pencil": "pencil",
+    "flower": "flower", "window": "window", "rabbit": "rabbit", "jelly": "jelly", "cookie": "cookie",
+    "dollar": "dollar", "tiger": "tiger", "butter": "butter", "ladder": "ladder", "hammer": "hammer",
+    "doctor": "doctor", "kitten": "kitten", "monkey": "monkey", "paper": "paper", "rocket": "rocket",
+    "puppy": "puppy", "yellow": "yellow", "mirror": "mirror", "garden": "garden", "honey": "honey",
+    "jacket": "jacket", "lion": "lion", "magic": "magic", "napkin": "napkin", "ocean": "ocean",
+    "pillow": "pillow", "rainbow": "rainbow", "supper": "supper", "table": "table", "under": "under",
+    "zebra": "zebra", "bottle": "bottle", "basket": "basket", "cactus": "cactus", "carpet": "carpet",
+    "closet": "closet", "crayon": "crayon", "dentist": "dentist", "dragon": "dragon", "eagle": "eagle",
+    "engine": "engine", "feather": "feather", "helmet": "helmet", "jungle": "jungle", "spider": "spider",
+    "cat": "cat", "dog": "dog", "sun": "sun", "first": "first", "box": "box",
+    "red": "red", "blue": "blue", "rush": "rush", "jump": "jump", "site": "site",
+    "bed": "bed", "car": "car", "ball": "ball", "milk": "milk", "fish": "fish",
+    "bird": "bird", "tree": "tree", "leaf": "leaf", "cup": "cup", "hat": "hat",
+    "shoe": "shoe", "bag": "bag", "door": "door", "clock": "clock", "frog": "frog",
+    "star": "star", "rain": "rain", "snow": "snow", "wind": "wind", "fire": "fire",
+    "egg": "egg", "fork": "fork", "spoon": "spoon", "plate": "plate", "glass": "glass",
+    "nose": "nose", "hand": "hand", "leg": "leg", "eye": "eye", "ear": "ear",
+    "top": "top", "set": "set", "zip": "zip", "sow": "sow", "cow": "cow",
+    "beast": "beast", "bus": "bus", "ship": "ship", "moon": "moon", "sky": "sky"
+}
@@ -0,0 +1,83 @@
+import os
+import threading
+import time
+import unittest
+from unittest import mock
+
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from audio_scheduler import AudioScheduler
+
+
+class FakeEngine:
+    """Speaks each text for `length` seconds unless interrupted; records what happened."""
+
+    def __init__(self, length=5.0):
+        self.length = length
+        self.log = []
+        self.speaking = threading.Event()
+
+    def speak(self, text, interrupt=None):
+        self.speaking.set()
+        interrupted = interrupt.wait(self.length) if interrupt is not None else False
+        self.log.append((text, "interrupted" if interrupted else "done"))
+
+
+class FakeSound:
+    def __init__(self, name, length, log):
+        self.name = name
+        self.length = length
+        self.log = log
+        self.playing = threading.Event()
+
+    def play(self):
+        self.log.append(self.name)
+        self.playing.set()
+
+    def get_length(self):
+        return self.length
+
+
+class AudioSchedulerTest(unittest.TestCase):
+    def setUp(self):
+        self.engine = FakeEngine()
+        patcher = mock.patch.object(AudioScheduler, "_open_engine", lambda scheduler: self.engine)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.audio = AudioScheduler()
+
+    def test_cancel_cuts_off_speech_and_drops_the_queue(self):
+        self.audio.say("one")
+        self.audio.say("two")
+        self.assertTrue(self.engine.speaking.wait(2))
+        self.audio.cancel_speech()
+        self.engine.length = 0.0
+        self.audio.say("three")
+        self.assertTrue(self.audio.wait_until_idle(timeout=2))
+        self.assertEqual(self.engine.log, [("one", "interrupted"), ("three", "done")])
+
+    def test_started_effect_plays_to_the_end(self):
+        played = []
+        chime = FakeSound("chime", 0.3, played)
+        queued = FakeSound("queued", 0.0, played)
+        start = time.monotonic()
+        self.audio.play(chime)
+        self.audio.play(queued)
+        self.assertTrue(chime.playing.wait(2))
+        self.audio.cancel_speech()
+        self.assertTrue(self.audio.wait_until_idle(timeout=2))
+        self.assertGreaterEqual(time.monotonic() - start, 0.3)
+        self.assertEqual(played, ["chime"])
+
+    def test_queued_counts_every_item(self):
+        self.engine.length = 0.0
+        before = self.audio.queued
+        self.audio.say("a")
+        self.audio.play(FakeSound("b", 0.0, []))
+        self.assertEqual(self.audio.queued, before + 2)
+        self.assertTrue(self.audio.wait_until_idle(timeout=2))
+        self.assertFalse(self.audio.busy)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,33 @@
+import unittest
+
+from bigram_index import BigramIndex, bigram_similarity
+
+
+class BigramIndexTest(unittest.TestCase):
+    def setUp(self):
+        self.index = BigramIndex(["cat", "hat", "elephant", "rabbit", "ribbon"])
+
+    def test_best_matches_agree_with_similarity(self):
+        for text in ("elefant", "rabit", "cta", "xyz"):
+            expected = sorted(((bigram_similarity(text, w), w) for w in ("cat", "hat", "elephant", "rabbit", "ribbon")),
+                              key=lambda item: (-item[0], item[1]))
+            expected = [item for item in expected if item[0] > 0][:3]
+            self.assertEqual(self.index.best_matches(text, k=3), expected)
+
+    def test_rescore_prefers_exact_expected(self):
+        self.assertEqual(self.index.rescore(["hat", "Cat"], "cat"), "cat")
+
+    def test_rescore_accepts_near_miss_of_expected(self):
+        self.assertEqual(self.index.rescore(["elephants", "elegant"], "elephant"), "elephant")
+
+    def test_rescore_keeps_other_vocabulary_words(self):
+        # "hat" is a real word, not a garbled "cat": the learner said something else.
+        self.assertEqual(self.index.rescore(["hat"], "cat"), "hat")
+
+    def test_rescore_keeps_top_hypothesis_when_nothing_is_close(self):
+        self.assertEqual(self.index.rescore(["banana", "bandana"], "rabbit"), "banana")
+        self.assertEqual(self.index.rescore(["", "  "], "rabbit"), "")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,48 @@
+import random
+import unittest
+
+from edit_distance import Query, levenshtein, levenshtein_batch
+
+
+def dp_levenshtein(a, b):
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ca != cb)))
+        previous = current
+    return previous[-1]
+
+
+class EditDistanceTest(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(13)
+        alphabet = "abcde"
+        self.pairs = [("".join(rng.choice(alphabet) for _ in range(rng.randint(0, 12))),
+                       "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 12))))
+                      for _ in range(2000)]
+        # Longer than a machine word, to cover the unbounded-int bit vectors.
+        self.pairs += [("a" * 70 + "b" * 5, "a" * 68 + "c" * 9), ("", ""), ("kitten", "sitting")]
+
+    def test_matches_dynamic_programming(self):
+        for a, b in self.pairs:
+            self.assertEqual(levenshtein(a, b), dp_levenshtein(a, b), (a, b))
+
+    def test_max_distance_cutoff(self):
+        for a, b in self.pairs:
+            exact = dp_levenshtein(a, b)
+            for max_distance in (0, 1, 3):
+                got = levenshtein(a, b, max_distance)
+                self.assertEqual(got, exact if exact <= max_distance else max_distance + 1, (a, b, max_distance))
+
+    def test_query_reuse_and_batch(self):
+        query = Query("banana")
+        candidates = ["", "banana", "bandana", "ananas", "cabana", "b"]
+        expected = [dp_levenshtein("banana", c) for c in candidates]
+        self.assertEqual(query.distances(candidates), expected)
+        self.assertEqual(levenshtein_batch("banana", candidates), expected)
+        self.assertEqual(levenshtein_batch("banana", candidates, 1), [min(d, 2) for d in expected])
+
+
+if __name__ == "__main__":
+    unittest.main()
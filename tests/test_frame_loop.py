@@ -0,0 +1,64 @@
+import os
+import threading
+import time
+import unittest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from frame_loop import FrameLoop, IDLE_WAKE_MS
+
+
+class FrameLoopTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        pygame.display.init()
+        pygame.display.set_mode((64, 64))
+
+    @classmethod
+    def tearDownClass(cls):
+        pygame.display.quit()
+
+    def setUp(self):
+        self.loop = FrameLoop(fps=1000)
+        self.loop.events()
+        self.loop.flip()  # start clean: nothing to redraw
+        self.assertFalse(self.loop.needs_redraw())
+
+    def run_events(self, limit):
+        """Call events() on a thread; fail instead of hanging if it doesn't return in `limit` seconds."""
+        done = threading.Event()
+        thread = threading.Thread(target=lambda: (self.loop.events(), done.set()), daemon=True)
+        thread.start()
+        if not done.wait(limit):
+            pygame.event.post(pygame.event.Event(pygame.USEREVENT))  # unblock the stuck wait
+            self.fail(f"events() did not return within {limit}s")
+
+    def test_wakes_at_deadline(self):
+        self.loop.wake_in(30)
+        start = time.monotonic()
+        self.run_events(IDLE_WAKE_MS / 1000 / 2)
+        self.assertGreaterEqual(time.monotonic() - start, 0.02)
+        self.assertTrue(self.loop.needs_redraw())
+
+    def test_deadline_already_passed_does_not_block(self):
+        self.loop.wake_in(20)
+        time.sleep(0.05)
+        self.run_events(0.5)
+        self.assertTrue(self.loop.needs_redraw())
+
+    def test_expired_matches_wakeup_rule(self):
+        now = pygame.time.get_ticks()
+        self.assertTrue(self.loop.expired(now))
+        self.assertFalse(self.loop.expired(now + 10000))
+
+    def test_idle_wait_is_bounded(self):
+        start = time.monotonic()
+        self.run_events(IDLE_WAKE_MS / 1000 + 1)
+        self.assertGreaterEqual(time.monotonic() - start, IDLE_WAKE_MS / 1000 * 0.9)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from learner_store import LearnerStore
+
+
+class LearnerStoreTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.dir)
+        self.store = LearnerStore(self.file("lexisplay.db"), learner="tester")
+        self.addCleanup(self.store.close)
+
+    def file(self, name):
+        return os.path.join(self.dir, name)
+
+    def write_json(self, name, value):
+        with open(self.file(name), "w") as f:
+            json.dump(value, f)
+        return self.file(name)
+
+    def test_migrate_imports_legacy_files_once(self):
+        words = self.write_json("words.json", {"easy": [{"word": "cat"}, {"word": "dog"}],
+                                               "difficult": [{"word": "butterfly"}]})
+        attempts = self.write_json("attempts.json", {"easy": {"cat": 3}, "difficult": {"butterfly": 1}})
+        progress = self.write_json("progress.json", {"easy": 2, "difficult": 0})
+        log = self.file("training_log.csv")
+        with open(log, "w") as f:
+            f.write("user_attempt,correct_word,levenshtein,bigram_similarity,label\n"
+                    "cap,cat,1,0.33,almost\n"
+                    "dog,dog,0,1.0,correct\n"
+                    "broken line\n")
+        self.assertTrue(self.store.migrate(words, attempts, progress, [log]))
+        self.assertEqual(self.store.word_page("easy"), [("cat", 3), ("dog", 0)])
+        self.assertEqual(self.store.word_page("difficult"), [("butterfly", 1)])
+        self.assertEqual(self.store.load_progress(), {"easy": 2, "difficult": 0})
+        self.assertEqual(self.store.most_failed(since=0), [("cat", "easy", 1)])
+        sources = self.store.conn.execute("SELECT DISTINCT source FROM attempts").fetchall()
+        self.assertEqual(sources, [("imported",)])
+        # A second run must not import the files again.
+        self.assertFalse(self.store.migrate(words, attempts, progress, [log]))
+        self.assertEqual(self.store.conn.execute("SELECT COUNT(*) FROM attempts").fetchone()[0], 2)
+
+    def test_prefix_paging(self):
+        words = [f"{prefix}{i:02d}" for prefix in ("ba", "be", "ca") for i in range(30)]
+        self.store.sync_words({"easy": [{"word": w} for w in words], "difficult": [{"word": "bat"}]})
+        self.assertEqual(self.store.count_words("easy"), 90)
+        self.assertEqual(self.store.count_words("easy", "b"), 60)
+        self.assertEqual(self.store.count_words("easy", "be"), 30)
+        self.assertEqual(self.store.count_words("easy", "x"), 0)
+        pages = [self.store.word_page("easy", "b", offset, 25) for offset in range(0, 60, 25)]
+        self.assertEqual([w for page in pages for w, _ in page], sorted(w for w in words if w.startswith("b")))
+        self.assertEqual([len(page) for page in pages], [25, 25, 10])
+        self.assertEqual(self.store.word_page("difficult", "ba"), [("bat", 0)])
+
+    def test_writer_runs_jobs_in_order(self):
+        self.store.submit(self.store.add_word, "easy", "cat")
+        for source in ("mic", "ai", "mic"):
+            self.store.submit(self.store.record_attempt, "easy", "cat", source, "cat", 0, 1.0, "correct",
+                              counted=(source == "mic"))
+        self.store.submit(self.store.save_progress, {"easy": 1})
+        self.assertTrue(self.store.pending())  # nothing runs before start()
+        self.store.start()
+        self.assertTrue(self.store.flush(timeout=5))
+        self.assertFalse(self.store.pending())
+        self.assertEqual(self.store.word_page("easy"), [("cat", 2)])
+        self.assertEqual(self.store.load_progress(), {"easy": 1})
+        self.store.submit(self.store.reset_attempt_counts)
+        self.store.flush(timeout=5)
+        self.assertEqual(self.store.word_page("easy"), [("cat", 0)])
+
+    def test_close_runs_queued_jobs(self):
+        self.store.submit(self.store.add_word, "easy", "owl")
+        self.store.close()
+        reopened = LearnerStore(self.file("lexisplay.db"), learner="tester")
+        self.addCleanup(reopened.close)
+        self.assertEqual(reopened.word_page("easy"), [("owl", 0)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+import os
+import pickle
+import shutil
+import sys
+import tempfile
+import threading
+import types
+import unittest
+from unittest import mock
+
+from online_trainer import OnlineTrainer
+
+
+class FakeModel:
+    def __init__(self):
+        self.batches = []
+
+    def partial_fit(self, X, y):
+        self.batches.append(len(X))
+
+    @property
+    def samples(self):
+        return sum(self.batches)
+
+
+def fake_joblib():
+    def dump(value, path):
+        with open(path, "wb") as f:
+            pickle.dump(value, f)
+    return types.SimpleNamespace(dump=dump)
+
+
+class OnlineTrainerTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.dir)
+        self.path = os.path.join(self.dir, "model.joblib")
+        patcher = mock.patch.dict(sys.modules, {"joblib": fake_joblib()})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.checkpoints = []
+        self.checkpointed = threading.Event()
+
+    def on_checkpoint(self, snapshot):
+        self.checkpoints.append(snapshot)
+        self.checkpointed.set()
+
+    def saved(self):
+        with open(self.path, "rb") as f:
+            return pickle.load(f)
+
+    def trainer(self, model, **kwargs):
+        trainer = OnlineTrainer(model, self.path, on_checkpoint=self.on_checkpoint, **kwargs)
+        self.addCleanup(trainer.close)
+        return trainer
+
+    def test_fits_in_batches_and_close_saves_the_rest(self):
+        model = FakeModel()
+        trainer = self.trainer(model, batch_size=4, checkpoint_every=100, checkpoint_interval=100)
+        for i in range(10):
+            trainer.add([i, 0.5], "correct")
+        trainer.close()
+        self.assertEqual(model.samples, 10)
+        self.assertTrue(all(size >= 4 for size in model.batches[:-1]), model.batches)
+        self.assertEqual(len(self.checkpoints), 1)
+        self.assertEqual(self.saved().samples, 10)
+
+    def test_checkpoint_after_enough_samples(self):
+        model = FakeModel()
+        trainer = self.trainer(model, batch_size=1, checkpoint_every=3, checkpoint_interval=100)
+        for i in range(3):
+            trainer.add([i, 0.5], "almost")
+        self.assertTrue(self.checkpointed.wait(2))
+        snapshot = self.checkpoints[0]
+        self.assertIsNot(snapshot, model)  # a copy, so the UI never sees a model mid-fit
+        self.assertEqual(self.saved().samples, 3)
+        self.assertEqual(os.listdir(self.dir), ["model.joblib"])
+
+    def test_checkpoint_after_interval(self):
+        model = FakeModel()
+        trainer = self.trainer(model, batch_size=100, checkpoint_every=100, checkpoint_interval=0.05)
+        trainer.add([1, 0.5], "incorrect")
+        self.assertTrue(self.checkpointed.wait(2))
+        self.assertEqual(self.saved().samples, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from persistence import JsonStore
+
+
+class JsonStoreTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.dir, "progress.json")
+        self.store = JsonStore(delay=0.01, max_delay=0.05)
+
+    def tearDown(self):
+        self.store.close()
+        shutil.rmtree(self.dir)
+
+    def read(self):
+        with open(self.path) as f:
+            return json.load(f)
+
+    def test_saves_coalesce_to_latest_value(self):
+        for i in range(20):
+            self.store.save(self.path, {"easy": i})
+        self.assertTrue(self.store.flush(timeout=5))
+        self.assertEqual(self.read(), {"easy": 19})
+        self.assertFalse(self.store.pending(self.path))
+
+    def test_save_snapshots_value(self):
+        value = {"easy": 1}
+        self.store.save(self.path, value)
+        value["easy"] = 2
+        self.store.flush(timeout=5)
+        self.assertEqual(self.read(), {"easy": 1})
+
+    def test_load_sees_unsaved_changes(self):
+        self.assertEqual(self.store.load(self.path, {"easy": 0}), {"easy": 0})
+        self.store.save(self.path, {"easy": 3})
+        self.assertEqual(self.store.load(self.path, {}), {"easy": 3})
+
+    def test_failed_write_leaves_old_file_intact(self):
+        self.store.save(self.path, {"easy": 1})
+        self.store.flush(timeout=5)
+        real_dump = json.dump
+
+        def dump_then_fail(value, f, **kwargs):
+            real_dump(value, f, **kwargs)
+            raise OSError("disk full")
+
+        with mock.patch("persistence.json.dump", dump_then_fail):
+            self.store.save(self.path, {"easy": 2})
+            self.store.flush(timeout=5)
+        self.assertEqual(self.read(), {"easy": 1})
+        self.assertEqual(os.listdir(self.dir), ["progress.json"])
+
+    def test_delete_and_close_flushes(self):
+        self.store.save(self.path, {"easy": 1})
+        self.store.close()
+        self.assertEqual(self.read(), {"easy": 1})
+        store = JsonStore(delay=0.01)
+        store.delete(self.path)
+        store.close()
+        self.assertFalse(os.path.exists(self.path))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+import os
+import random
+import shutil
+import string
+import tempfile
+import unittest
+
+import pronunciation
+import syllables
+from pronunciation import Lexicon, arpabet_to_espeak, build, espeak_input, speakable
+
+
+class LexiconTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def write(self, name, text):
+        path = os.path.join(self.dir, name)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+        return path
+
+    def test_lookup_every_key_in_a_large_file(self):
+        rng = random.Random(5)
+        keys = sorted({"".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(1, 10)))
+                       for _ in range(5000)})
+        path = self.write("big.tsv", "".join(f"{k}\tp{k}\n" for k in keys))
+        lexicon = Lexicon(path)
+        try:
+            for key in keys:
+                self.assertEqual(lexicon.lookup(key), "p" + key)
+            self.assertEqual(lexicon.lookup(keys[0].upper()), "p" + keys[0])
+            for missing in ("", "0", "zzzzzzzzzzz", keys[0] + "0"):
+                self.assertIsNone(lexicon.lookup(missing))
+        finally:
+            lexicon.close()
+
+    def test_missing_and_empty_files(self):
+        self.assertIsNone(Lexicon(os.path.join(self.dir, "nope.tsv")).lookup("cat"))
+        self.assertIsNone(Lexicon(self.write("empty.tsv", "")).lookup("cat"))
+
+    def test_build_from_cmudict_and_overrides(self):
+        cmu = self.write("cmu.dict", ";;; comment\nTIGER T AY1 G ER0\nBIT B IH1 T\nBIT(2) B AH0 T\n")
+        extra = self.write("extra.tsv", "gurr\tg3:\nbit\tbIt\n")
+        out = os.path.join(self.dir, "lexicon.tsv")
+        self.assertEqual(build([extra, cmu], out), 3)
+        lexicon = Lexicon(out)
+        try:
+            self.assertEqual(lexicon.lookup("tiger"), "t'aIg3")
+            self.assertEqual(lexicon.lookup("bit"), "bIt")  # earlier source wins
+            self.assertEqual(lexicon.lookup("gurr"), "g3:")
+        finally:
+            lexicon.close()
+        self.assertEqual(arpabet_to_espeak(["AE1", "P", "AH0", "L"]), "'ap@l")
+
+    def test_phonemes_only_for_espeak(self):
+        path = self.write("lexicon.tsv", "cat\tk'at\n")
+        saved, pronunciation.lexicon = pronunciation.lexicon, Lexicon(path)
+        try:
+            self.assertEqual(speakable("cat"), "cat")
+            self.assertEqual(espeak_input("cat"), "[[k'at]]")
+            self.assertEqual(espeak_input("dog"), "dog")
+        finally:
+            pronunciation.lexicon.close()
+            pronunciation.lexicon = saved
+
+    def test_lexicon_wins_over_phonetic_map(self):
+        path = self.write("lexicon.tsv", "cat\tk'at\n")
+        saved, pronunciation.lexicon = pronunciation.lexicon, Lexicon(path)
+        respellings = {"cat": "kat", "dog": "dawg"}
+        originals = {word: syllables.phonetic_map.get(word) for word in respellings}
+        syllables.phonetic_map.update(respellings)
+        try:
+            self.assertEqual(speakable("cat"), "cat")
+            self.assertEqual(espeak_input(speakable("cat")), "[[k'at]]")
+            self.assertEqual(speakable("dog"), "dawg")
+        finally:
+            for word, original in originals.items():
+                if original is None:
+                    syllables.phonetic_map.pop(word, None)
+                else:
+                    syllables.phonetic_map[word] = original
+            pronunciation.lexicon.close()
+            pronunciation.lexicon = saved
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+import os
+import threading
+import time
+import unittest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from speech_worker import SPEECH_RESULT, Cancelled, SpeechWorker
+
+
+class FakeRecognizer:
+    """Stands in for Listener: blocks until released, then returns `result`."""
+
+    def __init__(self, result=("cat", "cap"), honour_cancel=True):
+        self.result = list(result)
+        self.honour_cancel = honour_cancel
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.release.set()
+
+    def __call__(self, cancelled):
+        self.started.set()
+        self.release.wait(5)
+        if self.honour_cancel and cancelled():
+            raise Cancelled()
+        return self.result
+
+
+class SpeechWorkerTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        pygame.display.init()
+        pygame.display.set_mode((64, 64))
+
+    @classmethod
+    def tearDownClass(cls):
+        pygame.display.quit()
+
+    def setUp(self):
+        pygame.event.clear()
+
+    def results(self, count=1, limit=2.0):
+        """SPEECH_RESULT events posted within `limit` seconds (stops early at `count`)."""
+        found = []
+        deadline = time.monotonic() + limit
+        while len(found) < count and time.monotonic() < deadline:
+            found.extend(pygame.event.get(SPEECH_RESULT))
+            time.sleep(0.01)
+        return found
+
+    def test_posts_result_with_alternatives(self):
+        worker = SpeechWorker(FakeRecognizer())
+        request_id = worker.request("mic")
+        [event] = self.results()
+        self.assertEqual((event.text, event.alternatives), ("cat", ["cat", "cap"]))
+        self.assertEqual((event.tag, event.request_id), ("mic", request_id))
+        self.assertFalse(worker.pending)
+
+    def test_cancel_abandons_capture_in_progress(self):
+        recognizer = FakeRecognizer()
+        recognizer.release.clear()
+        worker = SpeechWorker(recognizer)
+        worker.request("mic")
+        self.assertTrue(recognizer.started.wait(2))
+        worker.cancel()
+        self.assertFalse(worker.pending)
+        recognizer.release.set()
+        self.assertEqual(self.results(limit=0.3), [])
+        # The worker is still usable afterwards.
+        worker.request("ai")
+        [event] = self.results()
+        self.assertEqual(event.tag, "ai")
+
+    def test_stale_result_is_never_posted(self):
+        recognizer = FakeRecognizer(honour_cancel=False)
+        recognizer.release.clear()
+        worker = SpeechWorker(recognizer)
+        worker.request("mic")
+        self.assertTrue(recognizer.started.wait(2))
+        worker.request("mic")  # queued behind the capture, dropped by the same cancel
+        worker.cancel()
+        recognizer.release.set()
+        self.assertEqual(self.results(count=2, limit=0.3), [])
+        self.assertFalse(worker.pending)
+
+
+if __name__ == "__main__":
+    unittest.main()
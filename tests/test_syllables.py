@@ -0,0 +1,68 @@
+import unittest
+
+from syllables import SYLLABLE_EXCEPTIONS, Syllabifier, split_many, split_syllables
+from word_import import difficulty_for
+
+# Words that are not in SYLLABLE_EXCEPTIONS, so these come from the patterns.
+KNOWN_SPLITS = {
+    "island": ["is", "land"],
+    "education": ["e", "du", "ca", "tion"],
+    "create": ["cre", "ate"],
+    "quiet": ["qui", "et"],
+    "going": ["go", "ing"],
+    "being": ["be", "ing"],
+    "playing": ["play", "ing"],
+    "cooking": ["cook", "ing"],
+    "running": ["run", "ning"],
+    "science": ["sci", "ence"],
+    "radio": ["ra", "di", "o"],
+    "piano": ["pi", "a", "no"],
+    "station": ["sta", "tion"],
+    "special": ["spe", "cial"],
+    "player": ["play", "er"],
+    "happy": ["hap", "py"],
+    "tickle": ["tick", "le"],
+    "cake": ["cake"],
+    "jumped": ["jumped"],
+    "wanted": ["wan", "ted"],
+    "bike": ["bike"],
+    "strength": ["strength"],
+    "banana": ["ba", "na", "na"],
+    "umbrella": ["um", "brel", "la"],
+    "hippopotamus": ["hip", "po", "po", "ta", "mus"],
+}
+
+
+class SyllabifierTest(unittest.TestCase):
+    def test_known_splits(self):
+        for word, expected in KNOWN_SPLITS.items():
+            self.assertNotIn(word, SYLLABLE_EXCEPTIONS)
+            self.assertEqual(split_syllables(word), expected, word)
+
+    def test_exceptions_win(self):
+        self.assertEqual(split_syllables("tiger"), ["tie", "gurr"])
+        self.assertEqual(split_syllables("Tiger"), ["tie", "gurr"])
+
+    def test_case_is_kept(self):
+        self.assertEqual(split_syllables("Island"), ["Is", "land"])
+
+    def test_difficulty_follows_syllable_count(self):
+        self.assertEqual(difficulty_for("island"), "easy")
+        self.assertEqual(difficulty_for("going"), "easy")
+        self.assertEqual(difficulty_for("education"), "difficult")
+        self.assertEqual(difficulty_for("radio"), "difficult")
+
+    def test_split_many_matches_split(self):
+        words = list(KNOWN_SPLITS) + ["island", "tiger"]
+        self.assertEqual(split_many(words), {w: split_syllables(w) for w in words})
+
+    def test_memo_returns_fresh_lists(self):
+        syllabifier = Syllabifier()
+        first = syllabifier.split("banana")
+        first.append("x")
+        self.assertEqual(syllabifier.split("banana"), ["ba", "na", "na"])
+        self.assertEqual(syllabifier.cache_info().hits, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
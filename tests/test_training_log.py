@@ -0,0 +1,83 @@
+import csv
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+from training_log import (CLASSES, TrainingLog, compact, compacted_segments, load_columns,
+                          rotated_segments)
+
+
+class TrainingLogTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.dir)
+        self.path = os.path.join(self.dir, "training_log.csv")
+
+    def rows(self, path=None):
+        try:
+            with open(path or self.path, newline="") as f:
+                return list(csv.reader(f))
+        except FileNotFoundError:
+            return []
+
+    def wait_for_rows(self, count, limit=2.0):
+        deadline = time.monotonic() + limit
+        while len(self.rows()) < count and time.monotonic() < deadline:
+            time.sleep(0.01)
+        return len(self.rows())
+
+    def test_writer_flushes_on_row_count_and_interval(self):
+        log = TrainingLog(self.path, flush_rows=3, flush_interval=0.1)
+        self.addCleanup(log.close)
+        log.append("cap", "cat", 1, 0.33, "almost")
+        log.append("cat", "cat", 0, 1.0, "correct")
+        self.assertEqual(self.rows(), [])  # append only buffers
+        log.append("dot", "dog", 1, 0.33, "almost")
+        self.assertEqual(self.wait_for_rows(3), 3)
+        log.append("dog", "dog", 0, 1.0, "correct")
+        self.assertEqual(self.wait_for_rows(4), 4)
+
+    def test_close_writes_the_rest(self):
+        log = TrainingLog(self.path, flush_rows=100, flush_interval=100)
+        log.append("cap", "cat", 1, 0.33, "almost")
+        log.close()
+        self.assertEqual(self.rows(), [["cap", "cat", "1", "0.33", "almost"]])
+
+    def test_rotation_and_compaction(self):
+        log = TrainingLog(self.path, rotate_bytes=200, flush_rows=1, flush_interval=100, compact_on_rotate=False)
+        written = []
+        for i in range(40):
+            row = (f"word{i}", "word", i % 3, i / 40, CLASSES[i % 3])
+            written.append(row)
+            log.append(*row)
+            log.flush()
+        log.close()
+        segments = rotated_segments(self.path)
+        self.assertGreater(len(segments), 1)
+        total = sum(len(self.rows(s)) for s in segments) + len(self.rows())
+        self.assertEqual(total, len(written))
+
+        # A damaged line and a leftover partial directory must not break compaction.
+        with open(segments[0], "a") as f:
+            f.write("garbage\n")
+        os.makedirs(segments[0][:-len(".csv")] + ".cols.tmp")
+        created = compact(self.path)
+        self.assertEqual(created, compacted_segments(self.path))
+        self.assertEqual(len(created), len(segments))
+        self.assertEqual(rotated_segments(self.path), [])
+        self.assertFalse([name for name in os.listdir(self.dir) if name.endswith(".tmp")])
+
+        users, labels = [], []
+        for directory in created:
+            columns = load_columns(directory)
+            users.extend(str(u) for u in columns["user_attempt"])
+            labels.extend(CLASSES[i] for i in columns["label"])
+        compacted = len(users)
+        self.assertEqual(users, [row[0] for row in written[:compacted]])
+        self.assertEqual(labels, [row[4] for row in written[:compacted]])
+
+
+if __name__ == "__main__":
+    unittest.main()
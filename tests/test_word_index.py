@@ -0,0 +1,83 @@
+import ast
+import os
+import random
+import unittest
+
+from edit_distance import levenshtein
+from word_index import WordIndex
+
+
+def brute_force(words, query, k, tag, max_distance, exclude=()):
+    scored = sorted((levenshtein(query, w), w) for t, entries in words.items() if tag is None or t == tag
+                    for w in {e["word"] for e in entries} if w != query and w not in exclude)
+    return [(d, w) for d, w in scored if max_distance is None or d <= max_distance][:k]
+
+
+def game_words():
+    """The built-in vocabulary of dyslexia_word_game.py, read without importing pygame."""
+    path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "dyslexia_word_game.py")
+    with open(path, encoding="utf-8") as f:
+        tree = ast.parse(f.read())
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(getattr(t, "id", None) == "words" for t in node.targets) \
+                and isinstance(node.value, ast.Dict):
+            return ast.literal_eval(node.value)
+    raise AssertionError("built-in word list not found")
+
+
+def random_words(rng, count):
+    return list({"".join(rng.choice("abcdeilnorst") for _ in range(rng.randint(1, 9))) for _ in range(count)})
+
+
+class WordIndexTest(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(7)
+        vocab = random_words(rng, 3000)
+        self.words = {"easy": [{"word": w} for w in vocab[:1500]],
+                      "difficult": [{"word": w} for w in vocab[1500:]]}
+        self.index = WordIndex.from_words(self.words)
+        self.queries = rng.sample(vocab, 60) + random_words(rng, 60)
+
+    def check(self, k, tag, max_distance):
+        for query in self.queries:
+            got = self.index.nearest(query, k=k, tag=tag, max_distance=max_distance)
+            expected = brute_force(self.words, query, k, tag, max_distance)
+            # Words tied at the k-th distance may differ; the distances may not.
+            self.assertEqual([d for d, _ in got], [d for d, _ in expected], query)
+            for d, w in got:
+                self.assertEqual(levenshtein(query, w), d)
+                self.assertNotEqual(w, query)
+
+    def test_matches_brute_force_with_tag(self):
+        self.check(k=5, tag="difficult", max_distance=2)
+
+    def test_matches_brute_force_without_tag(self):
+        self.check(k=3, tag=None, max_distance=2)
+
+    def test_smaller_max_distance(self):
+        self.check(k=5, tag="easy", max_distance=1)
+
+    def test_exclude_and_membership(self):
+        index = WordIndex.from_words({"easy": [{"word": "cat"}, {"word": "bat"}, {"word": "hat"}]})
+        self.assertIn("bat", index)
+        self.assertEqual(len(index), 3)
+        self.assertEqual(index.nearest("cat", k=5, exclude={"bat"}), [(1, "hat")])
+        self.assertEqual(index.nearest("cat", k=5, tag="difficult"), [])
+
+    def test_widens_beyond_index_distance(self):
+        self.check(k=5, tag="easy", max_distance=4)
+        self.check(k=3, tag="difficult", max_distance=None)
+
+    def test_every_game_word_gets_a_suggestion(self):
+        words = game_words()
+        index = WordIndex.from_words(words)
+        for tag, entries in words.items():
+            for entry in entries:
+                got = index.nearest(entry["word"], k=5, tag=tag)
+                self.assertEqual(len(got), min(5, len(entries) - 1), entry["word"])
+                expected = brute_force(words, entry["word"], 5, tag, None)
+                self.assertEqual([d for d, _ in got], [d for d, _ in expected], entry["word"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,200 @@
+import argparse
+import csv
+import glob
+import os
+import shutil
+import sys
+import threading
+import time
+
+from persistence import BackgroundWriter
+
+# === TRAINING LOG ===
+# Rows are buffered and appended in batches.  Once the live CSV passes
+# ROTATE_BYTES it is renamed to a numbered segment, and compact() turns
+# segments into one directory of .npy columns that can be memory-mapped.
+TRAINING_LOG = "training_log.csv"
+ROTATE_BYTES = 1024 * 1024
+FLUSH_ROWS = 32
+FLUSH_INTERVAL = 10.0  # longest a buffered row waits before the writer thread flushes it
+CLASSES = ["correct", "almost", "incorrect"]
+COLUMNS = ("user_attempt", "correct_word", "levenshtein", "bigram_similarity", "label")
+
+_compact_lock = threading.Lock()
+
+
+def _stem(path):
+    return os.path.splitext(path)[0]
+
+
+def rotated_segments(path=TRAINING_LOG):
+    """Rotated CSV segments of `path`, oldest first."""
+    return sorted(glob.glob(glob.escape(_stem(path)) + ".*.csv"))
+
+
+def compacted_segments(path=TRAINING_LOG):
+    """Compacted column directories of `path`, oldest first."""
+    return sorted(p for p in glob.glob(glob.escape(_stem(path)) + ".*.cols") if os.path.isdir(p))
+
+
+class TrainingLog(BackgroundWriter):
+    """Buffered, size-rotated writer for training_log.csv (headerless rows).
+
+    ``append()`` only buffers the row.  A writer thread flushes the buffer once
+    it holds flush_rows rows or its oldest row is flush_interval old, and does
+    the rotation (compaction runs on its own thread), so the caller never
+    touches the disk.  ``close()`` writes whatever is left; call it on exit.
+    """
+
+    thread_name = "training-log"
+
+    def __init__(self, path=TRAINING_LOG, rotate_bytes=ROTATE_BYTES, flush_rows=FLUSH_ROWS,
+                 flush_interval=FLUSH_INTERVAL, compact_on_rotate=True):
+        super().__init__()
+        self.path = path
+        self.rotate_bytes = rotate_bytes
+        self.flush_rows = flush_rows
+        self.flush_interval = flush_interval
+        self.compact_on_rotate = compact_on_rotate
+        self._rows = []
+        self._oldest = None
+        self._write_lock = threading.Lock()
+
+    def append(self, user, correct, lev, bigram, label):
+        with self._cond:
+            self._rows.append([user, correct, lev, bigram, label])
+            if self._oldest is None:
+                self._oldest = time.monotonic()
+            self._cond.notify()
+        self.start()
+
+    def _take(self):
+        if not self._rows:
+            return None, None
+        wait = self._oldest + self.flush_interval - time.monotonic()
+        if self._closing or len(self._rows) >= self.flush_rows or wait <= 0:
+            return True, None
+        return None, wait
+
+    def _process(self, _):
+        self.flush()
+
+    def flush(self):
+        """Write the buffered rows now (rotating the file if it grew past rotate_bytes)."""
+        with self._write_lock:
+            with self._cond:
+                rows, self._rows = self._rows, []
+                self._oldest = None
+            if not rows:
+                return
+            try:
+                with open(self.path, "a", newline="") as csvfile:
+                    csv.writer(csvfile).writerows(rows)
+                    size = csvfile.tell()
+            except OSError as e:
+                print(f"[ERROR] Failed to write {self.path}: {e}")
+                return
+            rotated = size >= self.rotate_bytes and self._rotate()
+        if rotated and self.compact_on_rotate:
+            threading.Thread(target=compact, args=(self.path,), name="log-compaction", daemon=True).start()
+
+    def _rotate(self):
+        segment = f"{_stem(self.path)}.{time.time_ns()}.csv"
+        try:
+            os.replace(self.path, segment)
+        except OSError as e:
+            print(f"[ERROR] Failed to rotate {self.path}: {e}")
+            return False
+        return True
+
+    def close(self, timeout=10):
+        super().close(timeout)
+        # Rows appended after the thread exited (or if it never started)
+        self.flush()
+
+
+def _np():
+    # Only compaction and readers need NumPy; appending rows never imports it.
+    import numpy
+    return numpy
+
+
+def _read_segment(path):
+    np = _np()
+    users, corrects, levs, bigrams, labels = [], [], [], [], []
+    with open(path, "r", newline="") as f:
+        for row in csv.reader(f):
+            if len(row) < 5 or row[4] not in CLASSES:
+                continue  # header row or damaged line
+            try:
+                lev, bigram = float(row[2]), float(row[3])
+            except ValueError:
+                continue
+            users.append(row[0])
+            corrects.append(row[1])
+            levs.append(lev)
+            bigrams.append(bigram)
+            labels.append(CLASSES.index(row[4]))
+    return {
+        "user_attempt": np.array(users, dtype=str),
+        "correct_word": np.array(corrects, dtype=str),
+        "levenshtein": np.array(levs, dtype=np.float32),
+        "bigram_similarity": np.array(bigrams, dtype=np.float32),
+        "label": np.array(labels, dtype=np.int8),
+    }
+
+
+def compact(path=TRAINING_LOG):
+    """Convert every rotated CSV segment of `path` into a directory of .npy columns.
+
+    Labels are stored as int8 indexes into CLASSES.  Returns the new directories.
+    """
+    created = []
+    with _compact_lock:
+        for segment in rotated_segments(path):
+            target = _compact_segment(segment)
+            if target is not None:
+                created.append(target)
+    return created
+
+
+def _compact_segment(segment):
+    np = _np()
+    target = segment[:-len(".csv")] + ".cols"
+    tmp_dir = target + ".tmp"
+    try:
+        columns = _read_segment(segment)
+        # A run that died mid-compaction may have left a partial directory behind.
+        if os.path.isdir(tmp_dir):
+            shutil.rmtree(tmp_dir)
+        os.makedirs(tmp_dir)
+        for name, values in columns.items():
+            np.save(os.path.join(tmp_dir, name + ".npy"), values)
+        os.replace(tmp_dir, target)
+        os.remove(segment)
+    except (OSError, ValueError) as e:
+        print(f"[ERROR] Failed to compact {segment}: {e}")
+        return None
+    return target
+
+
+def load_columns(directory, mmap_mode="r"):
+    """Memory-map the columns of one compacted segment."""
+    np = _np()
+    return {name: np.load(os.path.join(directory, name + ".npy"), mmap_mode=mmap_mode) for name in COLUMNS}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Maintain the rotated training log.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    compact_cmd = sub.add_parser("compact", help="convert rotated CSV segments to .npy columns")
+    compact_cmd.add_argument("--log", default=TRAINING_LOG)
+    args = parser.parse_args(argv)
+
+    created = compact(args.log)
+    print(f"Compacted {len(created)} segment(s) of {args.log}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,169 @@
+import queue
+import subprocess
+import threading
+import time
+
+from pronunciation import espeak_input
+
+
+class _PyttsxEngine:
+    def __init__(self):
+        import pyttsx3
+        self.engine = pyttsx3.init()
+        self._interrupt = None
+        # The driver calls back on its own loop as it reaches each word, which is
+        # where pyttsx3 allows engine.stop() to cut the utterance short.
+        self.engine.connect('started-utterance', self._check_interrupt)
+        self.engine.connect('started-word', self._check_interrupt)
+
+    def _check_interrupt(self, *args, **kwargs):
+        if self._interrupt is not None and self._interrupt.is_set():
+            self.engine.stop()
+
+    def speak(self, text, interrupt=None):
+        if interrupt is not None and interrupt.is_set():
+            return
+        self._interrupt = interrupt
+        try:
+            self.engine.say(text)
+            self.engine.runAndWait()
+        finally:
+            self._interrupt = None
+
+
+class _EspeakCommand:
+    # Fallback when pyttsx3 can't start: still off the UI thread, but pays a
+    # fork/exec per utterance.
+    def speak(self, text, interrupt=None):
+        if interrupt is None:
+            subprocess.call(['espeak', espeak_input(text)])
+            return
+        if interrupt.is_set():
+            return
+        process = subprocess.Popen(['espeak', espeak_input(text)])
+        while process.poll() is None:
+            if interrupt.wait(0.05):
+                process.terminate()
+                process.wait()
+                return
+
+
+class _CachedPlayback:
+    # Plays pre-synthesized WAVs from an AudioCache; anything that can't be
+    # synthesized is spoken by the fallback engine instead.
+    def __init__(self, cache, open_fallback):
+        self.cache = cache
+        self._open_fallback = open_fallback
+        self._fallback = None
+
+    def speak(self, text, interrupt=None):
+        sound = self.cache.sound(text)
+        if sound is None:
+            if self._fallback is None:
+                self._fallback = self._open_fallback()
+            self._fallback.speak(text, interrupt)
+            return
+        channel = sound.play()
+        if interrupt is None:
+            time.sleep(sound.get_length())
+        elif interrupt.wait(sound.get_length()) and channel is not None:
+            channel.stop()
+
+
+class TTSService:
+    """A single long-lived TTS engine owned by a dedicated thread.
+
+    ``say()`` queues an utterance and returns immediately; utterances are spoken
+    in order, each optionally followed by a pause.  ``clear()`` drops whatever
+    is still queued, and ``wait_until_idle()`` lets callers (e.g. the
+    microphone) wait for the speaker to go quiet.  With an AudioCache the
+    service plays cached WAVs and only falls back to live synthesis on a miss
+    that espeak can't render.
+    """
+
+    def __init__(self, cache=None):
+        self.cache = cache
+        self._queue = queue.Queue()
+        self._cond = threading.Condition()
+        self._pending = 0
+        self._queued = 0
+        self._generation = 0
+        self._interrupt = threading.Event()
+        self._thread = None
+
+    def start(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="tts-service", daemon=True)
+            self._thread.start()
+
+    def _enqueue(self, kind, payload, pause):
+        with self._cond:
+            self._pending += 1
+            self._queued += 1
+            generation = self._generation
+        self.start()
+        self._queue.put((generation, kind, payload, pause))
+
+    def say(self, text, pause=0.0):
+        if not text:
+            return
+        self._enqueue("speech", text, pause)
+
+    def clear(self):
+        """Drop queued speech and cut off the utterance that is playing."""
+        with self._cond:
+            self._generation += 1
+            self._interrupt.set()
+
+    @property
+    def busy(self):
+        return self._pending > 0
+
+    @property
+    def queued(self):
+        """How many items have ever been queued; a change means new audio was scheduled."""
+        return self._queued
+
+    def wait_until_idle(self, timeout=None):
+        with self._cond:
+            return self._cond.wait_for(lambda: self._pending == 0, timeout)
+
+    def _open_engine(self):
+        if self.cache is not None:
+            return _CachedPlayback(self.cache, self._open_live_engine)
+        return self._open_live_engine()
+
+    def _open_live_engine(self):
+        try:
+            return _PyttsxEngine()
+        except Exception as e:
+            print(f"[ERROR] pyttsx3 unavailable, falling back to espeak: {e}")
+            return _EspeakCommand()
+
+    def _perform(self, engine, generation, kind, payload, pause):
+        if generation != self._generation:
+            return
+        self._interrupt.clear()
+        if generation != self._generation:
+            return
+        try:
+            engine.speak(payload, self._interrupt)
+        except Exception as e:
+            print(f"[ERROR] TTS failed: {e}")
+        if pause:
+            self._interrupt.wait(pause)
+
+    def _idle(self):
+        pass
+
+    def _run(self):
+        engine = self._open_engine()
+        while True:
+            item = self._queue.get()
+            self._perform(engine, *item)
+            with self._cond:
+                self._pending -= 1
+                idle = self._pending == 0
+                self._cond.notify_all()
+            if idle:
+                self._idle()
@@ -0,0 +1,154 @@
+import argparse
+import csv
+import json
+import os
+import re
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from persistence import JsonStore
+from syllables import split_syllables, split_many
+
+# === BULK VOCABULARY IMPORT ===
+WORDS_FILE = "words.json"
+BATCH_SIZE = 512
+_WORD_RE = re.compile(r"^[a-z][a-z'-]*$")
+
+
+def _difficulty(syllables):
+    return "easy" if len(syllables) <= 2 else "difficult"
+
+
+def difficulty_for(word):
+    """The game's rule: up to two syllables is easy, more is difficult."""
+    return _difficulty(split_syllables(word))
+
+
+def _classify_batch(batch):
+    return [(word, _difficulty(sylls)) for word, sylls in split_many(batch).items()]
+
+
+def iter_candidates(path):
+    """Stream candidate words from a .txt (one per line), .csv (first column) or .json file."""
+    ext = os.path.splitext(path)[1].lower()
+    with open(path, "r", newline="" if ext == ".csv" else None) as f:
+        if ext == ".csv":
+            for i, row in enumerate(csv.reader(f)):
+                if row and not (i == 0 and row[0].strip().lower() == "word"):
+                    yield row[0]
+        elif ext == ".json":
+            # JSON has to be parsed whole: a list of words/entries, or a words.json dict.
+            data = json.load(f)
+            entries = [e for v in data.values() for e in v] if isinstance(data, dict) else data
+            for entry in entries:
+                yield entry["word"] if isinstance(entry, dict) else entry
+        else:
+            for line in f:
+                yield line
+
+
+def load_words(path, base):
+    """`base` extended with the entries of a words.json file (if any), without duplicates."""
+    try:
+        with open(path, "r") as f:
+            saved = json.load(f)
+    except FileNotFoundError:
+        return base
+    except (OSError, ValueError) as e:
+        print(f"[ERROR] Failed to read {path}: {e}")
+        return base
+    merged = {difficulty: list(entries) for difficulty, entries in base.items()}
+    seen = {entry["word"] for entries in merged.values() for entry in entries}
+    for difficulty, entries in saved.items():
+        for entry in entries:
+            if entry.get("word") and entry["word"] not in seen:
+                seen.add(entry["word"])
+                merged.setdefault(difficulty, []).append(entry)
+    return merged
+
+
+def import_words(paths, words, workers=None, batch_size=BATCH_SIZE):
+    """Add every new word from `paths` to `words` in place; returns {difficulty: [new words]}.
+
+    Input is streamed and deduplicated against `words` and itself with a hash
+    set; syllable splitting/classification runs in batches across processes.
+    """
+    seen = {entry["word"] for entries in words.values() for entry in entries}
+
+    def batches():
+        batch = []
+        for path in paths:
+            try:
+                candidates = iter_candidates(path)
+                for raw in candidates:
+                    word = raw.strip().lower()
+                    if not _WORD_RE.match(word) or word in seen:
+                        continue
+                    seen.add(word)
+                    batch.append(word)
+                    if len(batch) >= batch_size:
+                        yield batch
+                        batch = []
+            except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+                print(f"[ERROR] Failed to read {path}: {e}")
+        if batch:
+            yield batch
+
+    added = {}
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        # Keep a bounded number of batches in flight so huge inputs stay streamed.
+        in_flight = deque()
+        limit = 2 * (workers or os.cpu_count() or 1)
+        for batch in batches():
+            in_flight.append(pool.submit(_classify_batch, batch))
+            while len(in_flight) >= limit:
+                _collect(in_flight.popleft().result(), words, added)
+        while in_flight:
+            _collect(in_flight.popleft().result(), words, added)
+    return added
+
+
+def _collect(results, words, added):
+    for word, difficulty in results:
+        words.setdefault(difficulty, []).append({"word": word})
+        added.setdefault(difficulty, []).append(word)
+
+
+def initialize_entries(added, attempts, progress):
+    """Give every new word an attempts entry and every tier a progress entry, in one pass."""
+    for difficulty, new_words in added.items():
+        counts = attempts.setdefault(difficulty, {})
+        for word in new_words:
+            counts.setdefault(word, 0)
+        progress.setdefault(difficulty, 0)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Import word lists into words.json.")
+    parser.add_argument("inputs", nargs="+", help=".txt, .csv or .json word lists")
+    parser.add_argument("--words", default=WORDS_FILE)
+    parser.add_argument("--attempts", default="attempts.json")
+    parser.add_argument("--progress", default="progress.json")
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    store = JsonStore()
+    words = store.load(args.words, {"easy": [], "difficult": []})
+    added = import_words(args.inputs, words, workers=args.workers)
+    total = sum(len(v) for v in added.values())
+    if total:
+        attempts = store.load(args.attempts, {"easy": {}, "difficult": {}})
+        progress = store.load(args.progress, {"easy": 0, "difficult": 0})
+        initialize_entries(added, attempts, progress)
+        store.save(args.words, words)
+        store.save(args.attempts, attempts)
+        store.save(args.progress, progress)
+    store.close()
+    summary = ", ".join(f"{len(v)} {d}" for d, v in sorted(added.items())) or "nothing new"
+    print(f"Imported {total} word(s) into {args.words}: {summary}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
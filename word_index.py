@@ -0,0 +1,170 @@
+import heapq
+import threading
+
+from edit_distance import Query
+
+MAX_DISTANCE = 2  # distances the segment postings answer directly; fixes how words are cut
+
+
+def _segments(length, parts):
+    """(start, length) of the `parts` near-equal segments a word of `length` is cut into."""
+    short, extra = divmod(length, parts)
+    spans = []
+    start = 0
+    for i in range(parts):
+        size = short + (1 if i >= parts - extra else 0)
+        spans.append((start, size))
+        start += size
+    return spans
+
+
+class WordIndex:
+    """Nearest-word lookup by edit distance.
+
+    Each word is cut into MAX_DISTANCE + 1 segments and filed under every one
+    of them, keyed by (tag, length, segment number, text); the tag is the
+    difficulty tier.  d <= MAX_DISTANCE edits can touch at most d segments, so
+    any word that close to a query shares one segment with it exactly, shifted
+    by at most d characters.  ``nearest()`` therefore only scores the words
+    found under those few keys (lengths within d of the query) instead of the
+    whole vocabulary.  Every word is also kept in a plain list per
+    (tag, length): words too short to cut are matched from there, and when
+    fewer than k words lie within max_distance the search widens to those
+    lists, nearest length first.
+
+    Methods take a lock, so the index can be filled on a background thread
+    while the game already queries it.
+    """
+
+    def __init__(self, max_distance=MAX_DISTANCE):
+        self.max_distance = max_distance
+        self._parts = max_distance + 1
+        self._postings = {}   # (tag, length, segment number, text) -> [word]
+        self._lengths = {}    # (tag, length) -> [word]
+        self._tags = {}       # word -> tags it was added under
+        self._all_tags = set()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_words(cls, words, max_distance=MAX_DISTANCE):
+        index = cls(max_distance)
+        index.update(words)
+        return index
+
+    def update(self, words):
+        """Add every entry of a words dict ({tag: [{"word": ...}, ...]})."""
+        for tag, entries in words.items():
+            for entry in entries:
+                self.add(entry["word"], tag)
+
+    def __len__(self):
+        return len(self._tags)
+
+    def __contains__(self, word):
+        return word in self._tags
+
+    def add(self, word, tag=None):
+        length = len(word)
+        with self._lock:
+            tags = self._tags.setdefault(word, set())
+            if tag in tags:
+                return
+            tags.add(tag)
+            self._all_tags.add(tag)
+            self._lengths.setdefault((tag, length), []).append(word)
+            if length < self._parts:
+                return
+            for i, (start, size) in enumerate(_segments(length, self._parts)):
+                self._postings.setdefault((tag, length, i, word[start:start + size]), []).append(word)
+
+    def _candidates(self, word, tags, max_distance):
+        """{word: lower bound on its distance to `word`} for every possible match.
+
+        A word e edits away keeps at least parts - e segments intact, so parts
+        minus the segments found in the query bounds its distance from below.
+        """
+        n = len(word)
+        postings = self._postings
+        matched = {}
+        for length in range(max(0, n - max_distance), n + max_distance + 1):
+            if length < self._parts:
+                for tag in tags:
+                    for hit in self._lengths.get((tag, length), ()):
+                        matched[hit] = None
+                continue
+            grow = n - length
+            for i, (start, size) in enumerate(_segments(length, self._parts)):
+                # Edits before the segment shift it; edits after it make up the
+                # rest of the length difference, and together they fit in max_distance.
+                for shift in range(-max_distance, max_distance + 1):
+                    pos = start + shift
+                    if abs(shift) + abs(grow - shift) > max_distance or pos < 0 or pos + size > n:
+                        continue
+                    piece = word[pos:pos + size]
+                    for tag in tags:
+                        for hit in postings.get((tag, length, i, piece), ()):
+                            matched[hit] = matched.get(hit, 0) | (1 << i)
+        parts = self._parts
+        return {hit: abs(n - len(hit)) if mask is None else max(abs(n - len(hit)), parts - bin(mask).count("1"))
+                for hit, mask in matched.items()}
+
+    def nearest(self, word, k=1, tag=None, exclude=(), max_distance=None):
+        """Return the k (distance, word) pairs closest to `word`, nearest first.
+
+        With `max_distance`, only words at most that many edits away are
+        returned.  With `tag`, only words added under that tag are considered.
+        """
+        if k <= 0:
+            return []
+        indexed = self.max_distance if max_distance is None else min(max_distance, self.max_distance)
+        with self._lock:
+            tags = tuple(self._all_tags) if tag is None else (tag,)
+            matched = self._candidates(word, tags, indexed)
+        skip = set(exclude)
+        skip.add(word)
+        for hit in skip:
+            matched.pop(hit, None)
+        # Score candidates by increasing lower bound and stop once it can't win.
+        # Ties at the k-th distance keep whichever word was scored first.
+        query = Query(word)
+        best = []  # max-heap of (-distance, word)
+        limit = indexed
+        for hit, bound in sorted(matched.items(), key=lambda item: item[1]):
+            if bound > limit:
+                break
+            d = query.distance(hit, limit)
+            if d <= limit:
+                limit = _keep(best, k, d, hit, limit)
+        if len(best) < k and (max_distance is None or max_distance > indexed):
+            # Every word within `indexed` edits is in `best` already.
+            skip.update(hit for _, hit in best)
+            self._widen(query, tags, k, best, skip, max_distance)
+        return sorted((-neg, w) for neg, w in best)
+
+    def _widen(self, query, tags, k, best, skip, max_distance):
+        """Scan the words beyond the postings' reach into `best`, nearest length first."""
+        n = len(query.text)
+        with self._lock:
+            buckets = [(length, entries, len(entries)) for (t, length), entries in self._lengths.items()
+                       if t in tags]
+        buckets.sort(key=lambda bucket: abs(bucket[0] - n))
+        limit = max_distance
+        for length, entries, count in buckets:
+            if limit is not None and abs(length - n) > limit:
+                break
+            for hit in entries[:count]:
+                if hit in skip:
+                    continue
+                skip.add(hit)
+                d = query.distance(hit, limit)
+                if limit is None or d <= limit:
+                    limit = _keep(best, k, d, hit, limit)
+
+
+def _keep(best, k, d, hit, limit):
+    """Add (d, hit) to the max-heap of the k best; return the new distance limit."""
+    if len(best) < k:
+        heapq.heappush(best, (-d, hit))
+    else:
+        heapq.heapreplace(best, (-d, hit))
+    return -best[0][0] - 1 if len(best) == k else limit